@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+"""
+Report run_batch() throughput as the number of worker processes changes.
+
+Run from the repository root with: python benchmarks/bench_batch.py [NUM_JOBS]
+"""
+
+import os
+import sys
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from days import run_batch  # noqa: E402
+
+
+PATTERNS = [['Tue', 'Thu'], ['Mon', 'Wed', 'Fri'], ['Mon'], ['Sat', 'Sun']]
+
+
+def make_jobs(count):
+    start = date(2025, 1, 6)
+    return [{'start_date': (start + timedelta(days=n % 365)).isoformat(),
+             'weekdays': PATTERNS[n % len(PATTERNS)],
+             'weeks': 14 + n % 40}
+            for n in range(count)]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    jobs = make_jobs(count)
+    workers = 1
+    counts = []
+    while workers <= (os.cpu_count() or 1):
+        counts.append(workers)
+        workers *= 2
+
+    print("{:>8} {:>10} {:>12} {:>10}".format("workers", "chunksize", "jobs/sec", "seconds"))
+    for workers in counts:
+        for chunksize in ((16,) if workers == 1 else (16, 256)):
+            start = time.perf_counter()
+            for _ in run_batch(jobs, workers=workers, chunksize=chunksize):
+                pass
+            elapsed = time.perf_counter() - start
+            print("{:>8} {:>10} {:>12.0f} {:>10.2f}".format(
+                workers, chunksize, count / elapsed, elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+"""
+Compare get_days() against the calendar-walking implementation it replaced.
+
+Run from the repository root with: python benchmarks/bench_get_days.py
+"""
+
+import calendar
+import os
+import sys
+import timeit
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from days import get_days  # noqa: E402
+
+
+def legacy_get_days(year, month, day, days, weeks=14):
+    """The original implementation: render every day, then match strings."""
+    results = []
+
+    c = calendar.Calendar()
+    start_date = date(year, month, day)
+
+    num_weeks = 0
+    for m in range(13)[month:]:
+        for week in c.monthdatescalendar(year, m):
+            if num_weeks == weeks:
+                return results
+
+            found = False
+            for day in week:
+                if day < start_date:
+                    continue
+                dt = day.strftime('%c')
+                for dow in days:
+                    if dt.startswith(dow) and dt not in results:
+                        results.append(dt)
+                        found = True
+            if found:
+                num_weeks += 1
+    return results
+
+
+CASES = [
+    (['Tue', 'Thu'], 14),
+    (['Tue', 'Thu'], 52),
+    (['Mon', 'Wed', 'Fri'], 52),
+    (['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun'], 52),
+]
+
+
+def main():
+    number = 200
+    print("{:<40} {:>6} {:>12} {:>12} {:>8}".format(
+        "weekdays", "weeks", "legacy (us)", "new (us)", "speedup"))
+    for dows, weeks in CASES:
+        assert get_days(2018, 1, 1, dows, weeks) == legacy_get_days(2018, 1, 1, dows, weeks)
+        old = min(timeit.repeat(
+            lambda: legacy_get_days(2018, 1, 1, dows, weeks), number=number, repeat=5))
+        new = min(timeit.repeat(
+            lambda: get_days(2018, 1, 1, dows, weeks), number=number, repeat=5))
+        print("{:<40} {:>6} {:>12.1f} {:>12.1f} {:>7.1f}x".format(
+            " ".join(dows), weeks, old / number * 1e6, new / number * 1e6, old / new))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+"""
+Compare get_days_multi() against calling get_days() once per pattern.
+
+For 1 to 127 weekday sets (every non-empty combination), times building all
+the schedules, and building and formatting them the way `days --pattern`
+prints them. The last column is the time per pattern with get_days_multi(),
+which should fall as patterns are added.
+
+Run from the repository root with: python benchmarks/bench_multi.py
+"""
+
+import os
+import sys
+import timeit
+from itertools import combinations
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from days import _format_day, _pattern_lines, get_days, get_days_multi  # noqa: E402
+
+NAMES = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
+SUBSETS = [list(c) for size in range(1, 8) for c in combinations(NAMES, size)]
+
+
+def loop_build(patterns, weeks):
+    return [get_days(2025, 1, 1, days, weeks=weeks) for days in patterns]
+
+
+def multi_build(patterns, weeks):
+    return get_days_multi(2025, 1, 1, patterns, weeks=weeks)
+
+
+def loop_format(patterns, weeks):
+    for days in patterns:
+        for day in get_days(2025, 1, 1, days, weeks=weeks).dates:
+            _format_day(day)
+
+
+def multi_format(patterns, weeks):
+    labels = [' '.join(days) for days in patterns]
+    for _ in _pattern_lines(labels, multi_build(patterns, weeks), _format_day):
+        pass
+
+
+def best(func, patterns, weeks, repeat=5):
+    number = max(1, 20000 // (weeks * len(patterns)))
+    return min(timeit.repeat(lambda: func(patterns, weeks), number=number,
+                             repeat=repeat)) / number
+
+
+def main():
+    print("{:<8} {:>8} {:>6} {:>12} {:>12} {:>8} {:>14}".format(
+        "work", "patterns", "weeks", "loop (ms)", "multi (ms)", "speedup", "us/pattern"))
+    for work, loop, multi in (('build', loop_build, multi_build),
+                              ('format', loop_format, multi_format)):
+        for weeks in (14, 520):
+            for count in (1, 4, 16, 64, 127):
+                patterns = SUBSETS[::len(SUBSETS) // count][:count]
+                assert multi_build(patterns, weeks) == loop_build(patterns, weeks)
+                old = best(loop, patterns, weeks)
+                new = best(multi, patterns, weeks)
+                print("{:<8} {:>8} {:>6} {:>12.3f} {:>12.3f} {:>7.1f}x {:>14.1f}".format(
+                    work, count, weeks, old * 1e3, new * 1e3, old / new, new / count * 1e6))
+
+
+if __name__ == '__main__':
+    main()
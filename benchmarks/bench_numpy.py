@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+"""
+Compare the pure-Python and NumPy backends from 10**3 to 10**6 dates.
+
+Run from the repository root with: python benchmarks/bench_numpy.py [MAX_EXPONENT]
+NumPy must be installed. Dates stop at 9999-12-31, so a single schedule holds
+at most about 3.6 million dates; larger exponents are capped there.
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from days import get_days_array, iter_days  # noqa: E402
+
+ALL_DAYS = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
+
+
+def best_time(func, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        sys.exit('NumPy is not installed')
+
+    max_exponent = int(sys.argv[1]) if len(sys.argv) > 1 else 6
+    print("{:>10} {:>14} {:>14} {:>8}".format("dates", "python (ms)", "numpy (ms)", "speedup"))
+    for exponent in range(3, max_exponent + 1):
+        weeks = 10 ** exponent // len(ALL_DAYS)
+        repeat = 3 if exponent < 6 else 1
+        python = best_time(lambda: list(iter_days(1, 1, 1, ALL_DAYS, weeks)), repeat)
+        array = best_time(lambda: get_days_array(1, 1, 1, ALL_DAYS, weeks), repeat)
+        count = len(get_days_array(1, 1, 1, ALL_DAYS, weeks))
+        print("{:>10} {:>14.2f} {:>14.2f} {:>7.1f}x".format(
+            count, python * 1000, array * 1000, python / array))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+"""
+Compare lines per second for the buffered writer and a print() per line.
+
+Both write the same formatted dates to a pipe that a background thread
+drains, so the per-line cost includes the write syscalls a real pipeline
+would see.
+
+Run from the repository root with: python benchmarks/bench_output.py [NUM_WEEKS]
+"""
+
+import io
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from days import _format_day, _write_lines, iter_days  # noqa: E402
+
+ALL_DAYS = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
+
+
+def print_loop(dates, stream):
+    for day in dates:
+        print(_format_day(day), file=stream)
+    stream.flush()
+
+
+def buffered(dates, stream):
+    _write_lines(map(_format_day, dates), stream)
+
+
+def timed(writer, dates):
+    """Run ``writer`` against an unbuffered-at-line-level pipe; return seconds."""
+    read_fd, write_fd = os.pipe()
+
+    def drain():
+        while os.read(read_fd, 1 << 16):
+            pass
+
+    reader = threading.Thread(target=drain)
+    reader.start()
+    # line_buffering mirrors stdout attached to a terminal or PYTHONUNBUFFERED.
+    stream = io.TextIOWrapper(io.FileIO(write_fd, 'w'), encoding='utf-8',
+                              line_buffering=True)
+    start = time.perf_counter()
+    writer(dates, stream)
+    elapsed = time.perf_counter() - start
+    stream.close()
+    reader.join()
+    os.close(read_fd)
+    return elapsed
+
+
+def main():
+    weeks = int(sys.argv[1]) if len(sys.argv) > 1 else 150_000
+    dates = list(iter_days(1900, 1, 1, ALL_DAYS, weeks))
+    print("{:<10} {:>12} {:>14}".format("writer", "seconds", "lines/sec"))
+    for name, writer in (('print', print_loop), ('buffered', buffered)):
+        elapsed = min(timed(writer, dates) for _ in range(3))
+        print("{:<10} {:>12.3f} {:>14.0f}".format(name, elapsed, len(dates) / elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+"""
+Check that profiling costs next to nothing while it is switched off.
+
+For get_days() and for a whole CLI run (main() writing to /dev/null), times
+three variants, taking the best of several repeats:
+
+- baseline: the same pipeline with no profiling checks at all
+- disabled: the public entry point with no profile hook registered
+- enabled:  the public entry point with a profile hook registered
+
+and reports the overhead of the disabled and enabled variants relative to
+the baseline. Exits with status 1 if the disabled overhead exceeds
+--max-overhead percent.
+
+Run from the repository root with: python benchmarks/bench_profile.py
+"""
+
+import argparse
+import os
+import sys
+import timeit
+from array import array
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import days  # noqa: E402
+
+
+def baseline_get_days(weeks):
+    ordinals = array('i', days._iter_ordinals(2000, 1, 3, ['Mon', 'Wed', 'Fri'], weeks))
+    return days.DateArray._from_ordinals(ordinals).strings()
+
+
+def public_get_days(weeks):
+    return days.get_days(2000, 1, 3, ['Mon', 'Wed', 'Fri'], weeks=weeks)
+
+
+def baseline_main(weeks):
+    # main() and _main() for these arguments, without the profiling checks.
+    args = SimpleNamespace(year=2000, month=1, day=3, dows=['Mon', 'Wed', 'Fri'],
+                           weeks=weeks, chunk=False)
+    getattr(args, 'locale', None)
+    dows = args.dows or ['Tue', 'Thu']
+    getattr(args, 'date_format', None)
+    format_day = days._formatter(None)
+    getattr(args, 'exclude', None)
+    every = getattr(args, 'every', 1)
+    nth = getattr(args, 'nth', None)
+    getattr(args, 'cache', False)
+    results = days.iter_days(args.year, args.month, args.day, dows, weeks=args.weeks,
+                             exclude=None, every=every, nth=nth)
+    getattr(args, 'format', 'text')
+    days._write_lines(map(format_day, results), newline='\n')
+
+
+def public_main(weeks):
+    days.main(SimpleNamespace(year=2000, month=1, day=3, dows=['Mon', 'Wed', 'Fri'],
+                              weeks=weeks, chunk=False))
+
+
+def best(funcs, weeks, repeat, number):
+    """Best time per call for each function, interleaving runs to share any noise."""
+    timers = [timeit.Timer(lambda func=func: func(weeks)) for func in funcs]
+    times = [[] for _ in funcs]
+    for _ in range(repeat):
+        for timer, samples in zip(timers, times):
+            samples.append(timer.timeit(number) / number)
+    return [min(samples) for samples in times]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure profiling overhead.')
+    parser.add_argument('--repeat', type=int, default=30, help='Repeats per variant (default: 30)')
+    parser.add_argument('--max-overhead', type=float, default=5,
+                        help='Largest acceptable disabled overhead, in percent (default: 5)')
+    args = parser.parse_args()
+
+    cases = [
+        ('get_days', baseline_get_days, public_get_days, (14, 1400)),
+        ('main', baseline_main, public_main, (14, 1400)),
+    ]
+    failed = False
+    stdout = sys.stdout
+    with open(os.devnull, 'w') as devnull:
+        sys.stdout = devnull
+        try:
+            rows = []
+            for name, baseline, public, sizes in cases:
+                for weeks in sizes:
+                    number = max(1, 20000 // weeks)
+                    base, disabled = best((baseline, public), weeks, args.repeat, number)
+                    days.add_profile_hook(lambda profile: None)
+                    try:
+                        enabled, = best((public,), weeks, args.repeat, number)
+                    finally:
+                        days._profile_hooks.clear()
+                    rows.append((name, weeks, base, disabled, enabled))
+        finally:
+            sys.stdout = stdout
+
+    print("{:<10} {:>6} {:>12} {:>10} {:>10}".format(
+        "function", "weeks", "baseline", "disabled", "enabled"))
+    for name, weeks, base, disabled, enabled in rows:
+        off = (disabled - base) / base * 100
+        on = (enabled - base) / base * 100
+        failed |= off > args.max_overhead
+        print("{:<10} {:>6} {:>9.1f} us {:>+9.1f}% {:>+9.1f}%".format(
+            name, weeks, base * 1e6, off, on))
+    if failed:
+        print("Disabled profiling costs more than {}%".format(args.max_overhead), file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+"""
+Compare Schedule set operations against filtering get_days() string lists.
+
+The list version is what callers did before Schedule existed: materialize
+both schedules with get_days() and test each date for membership in the
+other list, which is O(n*m). The Schedule version builds both schedules as
+segments and subtracts them, then counts the dates in one month.
+
+Run from the repository root with: python benchmarks/bench_schedule.py
+"""
+
+import os
+import sys
+import timeit
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from days import Schedule, get_days  # noqa: E402
+
+
+def with_lists(weeks):
+    sessions = list(get_days(2000, 1, 3, ['Tue', 'Thu'], weeks=weeks))
+    blocked = list(get_days(2000, 1, 3, ['Thu', 'Fri'], weeks=weeks))
+    remaining = [day for day in sessions if day not in blocked]
+    return len(remaining), sum(1 for day in remaining if day.startswith('Thu Mar')
+                               or day.startswith('Tue Mar'))
+
+
+def with_schedules(weeks):
+    sessions = Schedule.from_days(2000, 1, 3, ['Tue', 'Thu'], weeks=weeks)
+    blocked = Schedule.from_days(2000, 1, 3, ['Thu', 'Fri'], weeks=weeks)
+    remaining = sessions - blocked
+    march = sum(remaining.count_between(date(year, 3, 1), date(year, 3, 31))
+                for year in range(2000, 2000 + weeks // 52 + 1))
+    return len(remaining), march
+
+
+def main():
+    print("{:>6} {:>14} {:>16} {:>8}".format("weeks", "lists (us)", "Schedule (us)", "speedup"))
+    for weeks in (14, 52, 520, 2600):
+        assert with_lists(weeks) == with_schedules(weeks)
+        number = max(1, 2000 // weeks)
+        old = min(timeit.repeat(lambda: with_lists(weeks), number=number, repeat=3)) / number
+        new = min(timeit.repeat(lambda: with_schedules(weeks), number=number, repeat=3)) / number
+        print("{:>6} {:>14.1f} {:>16.1f} {:>7.1f}x".format(weeks, old * 1e6, new * 1e6, old / new))
+
+
+if __name__ == '__main__':
+    main()
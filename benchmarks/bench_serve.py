@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+"""
+Load-test the `days serve` HTTP server on localhost.
+
+Run from the repository root with: python benchmarks/bench_serve.py
+
+By default a server is started in this process on a free port. To measure a
+separate server process instead (the clients then don't share its GIL):
+
+    python days.py serve --port 8000 &
+    python benchmarks/bench_serve.py --url http://127.0.0.1:8000
+
+Each client thread sends requests for a few seconds, first over one
+keep-alive connection and then with a new connection per request. The
+server's /metrics are printed at the end.
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from http.client import HTTPConnection
+from urllib.parse import urlsplit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from days import _make_server  # noqa: E402
+
+
+PATTERNS = ['Tue,Thu', 'Mon,Wed,Fri', 'Mon', 'Sat,Sun']
+
+
+def make_paths(count):
+    return ['/days?start_date=2025-01-{:02d}&weekdays={}&weeks={}'.format(
+                1 + n % 28, PATTERNS[n % len(PATTERNS)], 14 + n % 40)
+            for n in range(count)]
+
+
+def client(host, port, paths, deadline, keep_alive, counts):
+    conn = HTTPConnection(host, port, timeout=10)
+    done = 0
+    while time.perf_counter() < deadline:
+        path = paths[done % len(paths)]
+        if keep_alive:
+            conn.request('GET', path)
+        else:
+            conn.request('GET', path, headers={'Connection': 'close'})
+        response = conn.getresponse()
+        response.read()
+        if response.status != 200:
+            raise RuntimeError('{} returned {}'.format(path, response.status))
+        if not keep_alive:
+            conn.close()
+        done += 1
+    conn.close()
+    counts.append(done)
+
+
+def run(host, port, paths, clients, seconds, keep_alive):
+    counts = []
+    deadline = time.perf_counter() + seconds
+    threads = [threading.Thread(target=client,
+                                args=(host, port, paths, deadline, keep_alive, counts))
+               for _ in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return sum(counts) / seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load-test days serve.')
+    parser.add_argument('--url', help='Server to test (default: start one in-process)')
+    parser.add_argument('-c', '--clients', type=int, default=8, help='Client threads (default: 8)')
+    parser.add_argument('-s', '--seconds', type=float, default=3, help='Seconds per run (default: 3)')
+    parser.add_argument('--distinct', type=int, default=200,
+                        help='Distinct queries in the mix (default: 200)')
+    args = parser.parse_args()
+
+    server = None
+    if args.url:
+        url = urlsplit(args.url)
+        host, port = url.hostname, url.port or 80
+    else:
+        server = _make_server(port=0)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        host, port = server.server_address[:2]
+
+    paths = make_paths(args.distinct)
+    print("{:>12} {:>8} {:>12}".format("connection", "clients", "requests/s"))
+    for keep_alive in (True, False):
+        rate = run(host, port, paths, args.clients, args.seconds, keep_alive)
+        print("{:>12} {:>8} {:>12.0f}".format(
+            'keep-alive' if keep_alive else 'close', args.clients, rate))
+
+    conn = HTTPConnection(host, port, timeout=10)
+    conn.request('GET', '/metrics')
+    print(json.dumps(json.loads(conn.getresponse().read()), indent=2))
+    conn.close()
+    if server:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
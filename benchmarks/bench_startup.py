@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+"""
+Measure cold-start latency of the days command line.
+
+Reports the cumulative import time of the days module from ``-X importtime``
+and the wall-clock time of whole invocations, with the bare interpreter as a
+baseline, as one JSON object tagged with the project version so results can
+be tracked from release to release.
+
+Run from the repository root with: python benchmarks/bench_startup.py [RUNS]
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+import tomllib
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DAYS = os.path.join(ROOT, 'days.py')
+
+COMMANDS = {
+    'interpreter': ['-c', 'pass'],
+    'fast_path': [DAYS, '--start-date', '2025-01-13', '-w', 'Tue', 'Thu', '-n', '14'],
+    'argparse_path': [DAYS, '--start-date', '2025-01-13', '--on', 'Tue', 'Thu', '--num', '14'],
+}
+
+
+def import_time_us():
+    """Return the cumulative ``-X importtime`` microseconds for ``import days``."""
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import days'],
+                          cwd=ROOT, capture_output=True, text=True, check=True)
+    for line in proc.stderr.splitlines():
+        fields = [field.strip() for field in line.split('|')]
+        if len(fields) == 3 and fields[2] == 'days':
+            return int(fields[1])
+    raise RuntimeError('days not found in -X importtime output')
+
+
+def wall_time_ms(args):
+    start = time.perf_counter()
+    subprocess.run([sys.executable] + args, cwd=ROOT, stdout=subprocess.DEVNULL, check=True)
+    return (time.perf_counter() - start) * 1000
+
+
+def summarize(samples):
+    return {
+        'min': min(samples),
+        'median': statistics.median(samples),
+        'mean': statistics.mean(samples),
+        'stdev': statistics.stdev(samples) if len(samples) > 1 else 0.0,
+    }
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    with open(os.path.join(ROOT, 'pyproject.toml'), 'rb') as f:
+        version = tomllib.load(f)['project']['version']
+
+    results = {
+        'version': version,
+        'python': sys.version.split()[0],
+        'runs': runs,
+        'import_days_us': summarize([import_time_us() for _ in range(runs)]),
+    }
+    for name, args in COMMANDS.items():
+        results[name + '_ms'] = summarize([wall_time_ms(args) for _ in range(runs)])
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,210 @@
+#!/usr/bin/env python
+"""
+Benchmark suite for days, with JSON results and a regression check.
+
+Run from the repository root:
+
+    python benchmarks/suite.py run -o before.json
+    # ... change something ...
+    python benchmarks/suite.py run -o after.json
+    python benchmarks/suite.py compare before.json after.json --threshold 10
+
+``run`` times each benchmark the way pyperf does: the number of loops per
+run is calibrated so a run lasts at least ``--min-time`` seconds, one warmup
+run is discarded, and the per-loop time of each of ``--runs`` runs is kept.
+Results are written as JSON with the raw values and their min, median, mean
+and standard deviation, and a summary table goes to stderr.
+
+``compare`` matches benchmarks by name, reports the change in median time
+and exits with status 1 if any benchmark got slower by more than
+``--threshold`` percent. Changes smaller than twice the larger of the two
+standard deviations are reported as noise rather than flagged.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+import tomllib
+from functools import partial
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from days import (_format_day, _group_weeks, _grouped_lines, _write_lines, get_days,  # noqa: E402
+                  get_days_multi, iter_days)
+
+DAYS = os.path.join(ROOT, 'days.py')
+WEEKDAYS = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
+
+
+def bench_get_days(weeks, weekdays):
+    list(get_days(2000, 1, 3, weekdays, weeks=weeks))
+
+
+def bench_get_days_multi(weeks, patterns):
+    get_days_multi(2000, 1, 3, patterns, weeks=weeks)
+
+
+def bench_output(weeks, group, stream):
+    dates = iter_days(2000, 1, 3, ['Mon', 'Wed', 'Fri'], weeks=weeks)
+    if group:
+        lines = _grouped_lines(_group_weeks(dates), _format_day)
+    else:
+        lines = map(_format_day, dates)
+    _write_lines(lines, stream=stream)
+
+
+def bench_cold_start(args):
+    subprocess.run([sys.executable, DAYS] + args, cwd=ROOT, stdout=subprocess.DEVNULL, check=True)
+
+
+def benchmarks(devnull):
+    """Return ``(name, function)`` pairs, in the order they are run."""
+    suite = []
+    for weeks in (14, 140, 1400, 14000):
+        suite.append(('get_days/weeks={}'.format(weeks), partial(bench_get_days, weeks, ['Tue', 'Thu'])))
+    for size in (1, 3, 5, 7):
+        suite.append(('get_days/weekdays={}'.format(size),
+                      partial(bench_get_days, 1400, WEEKDAYS[:size])))
+    suite.append(('get_days_multi/patterns=16',
+                  partial(bench_get_days_multi, 140, [WEEKDAYS[i:i + 3] for i in range(5)] * 3
+                          + [WEEKDAYS])))
+    for group in (False, True):
+        suite.append(('output/{}'.format('group' if group else 'flat'),
+                      partial(bench_output, 1400, group, devnull)))
+    suite.append(('cli/cold_start', partial(bench_cold_start, ['--start-date', '2025-01-13', '-n', '14'])))
+    suite.append(('cli/cold_start_group',
+                  partial(bench_cold_start, ['--start-date', '2025-01-13', '-n', '14', '--group'])))
+    return suite
+
+
+def calibrate(func, min_time):
+    """Return the smallest power-of-two loop count that runs for ``min_time``."""
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        if time.perf_counter() - start >= min_time:
+            return loops
+        loops *= 2
+
+
+def measure(func, runs, min_time):
+    loops = calibrate(func, min_time)
+    values = []
+    for run in range(runs + 1):
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        elapsed = (time.perf_counter() - start) / loops
+        if run:
+            values.append(elapsed)
+    return {
+        'loops': loops,
+        'values': values,
+        'min': min(values),
+        'median': statistics.median(values),
+        'mean': statistics.mean(values),
+        'stdev': statistics.stdev(values) if len(values) > 1 else 0.0,
+    }
+
+
+def run(args):
+    with open(os.path.join(ROOT, 'pyproject.toml'), 'rb') as f:
+        version = tomllib.load(f)['project']['version']
+    results = {
+        'version': version,
+        'python': sys.version.split()[0],
+        'platform': sys.platform,
+        'runs': args.runs,
+        'benchmarks': {},
+    }
+    with open(os.devnull, 'w') as devnull:
+        for name, func in benchmarks(devnull):
+            if args.filter and args.filter not in name:
+                continue
+            stats = measure(func, args.runs, args.min_time)
+            results['benchmarks'][name] = stats
+            print("{:<24} {:>12} +- {:>10}".format(
+                name, format_time(stats['median']), format_time(stats['stdev'])), file=sys.stderr)
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
+
+
+def compare(args):
+    with open(args.old) as f:
+        old = json.load(f)['benchmarks']
+    with open(args.new) as f:
+        new = json.load(f)['benchmarks']
+
+    regressions = []
+    print("{:<24} {:>12} {:>12} {:>9}".format("benchmark", "old", "new", "change"))
+    for name in old:
+        if name not in new:
+            continue
+        before, after = old[name]['median'], new[name]['median']
+        change = (after - before) / before * 100
+        noise = 2 * max(old[name]['stdev'], new[name]['stdev'])
+        flag = ''
+        if abs(after - before) <= noise:
+            if abs(change) > args.threshold:
+                flag = '  (noise)'
+        elif change > args.threshold:
+            flag = '  REGRESSION'
+            regressions.append(name)
+        elif change < -args.threshold:
+            flag = '  faster'
+        print("{:<24} {:>12} {:>12} {:>+8.1f}%{}".format(
+            name, format_time(before), format_time(after), change, flag))
+
+    if regressions:
+        print("\n{} benchmark(s) slower by more than {}%: {}".format(
+            len(regressions), args.threshold, ', '.join(regressions)), file=sys.stderr)
+        return 1
+    return 0
+
+
+def format_time(seconds):
+    for unit, scale in (('s', 1), ('ms', 1e-3), ('us', 1e-6)):
+        if seconds >= scale:
+            return '{:.2f} {}'.format(seconds / scale, unit)
+    return '{:.0f} ns'.format(seconds / 1e-9)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark suite for days.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help='Run the benchmarks and write JSON results')
+    run_parser.add_argument('-o', '--output', help='Write results to this file (default: stdout)')
+    run_parser.add_argument('--runs', type=int, default=10, help='Timed runs per benchmark (default: 10)')
+    run_parser.add_argument('--min-time', type=float, default=0.1,
+                            help='Minimum seconds per run, used to pick the loop count (default: 0.1)')
+    run_parser.add_argument('-k', '--filter', help='Only run benchmarks whose name contains this')
+
+    compare_parser = commands.add_parser('compare', help='Compare two result files')
+    compare_parser.add_argument('old')
+    compare_parser.add_argument('new')
+    compare_parser.add_argument('--threshold', type=float, default=10,
+                                help='Percent slowdown in median time that counts as a regression '
+                                     '(default: 10)')
+
+    args = parser.parse_args()
+    if args.command == 'run':
+        run(args)
+    else:
+        sys.exit(compare(args))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,72 +1,2137 @@
 #!/usr/bin/env python
 
-import argparse
-import calendar
+# argparse, asyncio, json, tempfile, concurrent.futures and http.server are
+# comparatively slow to import, so they are imported by the functions that
+# need them to keep startup fast for the common command-line path.
+import os
+import sys
+import threading
 
-from datetime import date, datetime
-from itertools import zip_longest
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict, deque, namedtuple
+from collections.abc import Sequence
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache, partial
+from itertools import batched, islice
+from time import perf_counter
+from types import SimpleNamespace
 
 
-def _grouper(iterable, n, fillvalue=None):
-    args = [iter(iterable)] * n
-    return zip_longest(*args, fillvalue=fillvalue)
+# Weekday and month names are fixed, not taken from the locale, so matching
+# and the default output are the same on every machine.
+_DAY_NAMES = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+_DAY_ABBRS = tuple(name[:3] for name in _DAY_NAMES)
+_MONTH_ABBRS = (None, 'Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+                'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
 
 
-def get_days(year, month, day, days, weeks=14):
+@lru_cache(maxsize=256)
+def _weekday_mask(days):
+    """Parse a tuple of weekday names into a bitmask of ``date.weekday()`` bits.
+
+    A name matches every weekday whose English name starts with it, ignoring
+    case, so 'Tue', 'tuesday' and 'T' (Tuesday and Thursday) all work.
+    Raises ValueError for a name that matches no weekday.
+    """
+    mask = 0
+    for dow in days:
+        prefix = dow.casefold()
+        bits = 0
+        for i, name in enumerate(_DAY_NAMES):
+            if name.casefold().startswith(prefix):
+                bits |= 1 << i
+        if not bits:
+            raise ValueError('unknown weekday: {!r}'.format(dow))
+        mask |= bits
+    return mask
+
+
+def _weekday_set(days):
+    """Resolve weekday names to a sorted tuple of ``date.weekday()`` integers.
+
+    Repeated or overlapping names collapse into one entry, so callers can emit
+    each offset once per week without checking what they already emitted.
+    """
+    mask = _weekday_mask(tuple(days))
+    return tuple(i for i in range(7) if mask >> i & 1)
+
+
+class WeekdayPattern:
+    """An O(1) index over the dates that fall on a set of weekdays.
+
+    Matching dates repeat with a 7-day period, so numbering them from the
+    first Monday of the proleptic Gregorian calendar (ordinal 1) lets the
+    k-th match after a date, or the number of matches between two dates,
+    be found with a division and a table lookup instead of iteration.
+
+    """
+
+    __slots__ = ('offsets', '_before')
+
+    def __init__(self, days):
+        self._init(_weekday_set(days))
+
+    @classmethod
+    def _from_offsets(cls, offsets):
+        pattern = cls.__new__(cls)
+        pattern._init(offsets)
+        return pattern
+
+    def _init(self, offsets):
+        self.offsets = offsets
+        # _before[w] is the number of matching weekdays earlier than w.
+        self._before = tuple(sum(1 for o in offsets if o < w) for w in range(8))
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def __repr__(self):
+        return 'WeekdayPattern({})'.format(list(self.offsets))
+
+    def index(self, day):
+        """Return how many matching dates come before ``day``."""
+        return self._index(day.toordinal())
+
+    def _index(self, ordinal):
+        week, weekday = divmod(ordinal - 1, 7)
+        return week * len(self.offsets) + self._before[weekday]
+
+    def _ordinal(self, index):
+        week, r = divmod(index, len(self.offsets))
+        return 1 + 7 * week + self.offsets[r]
+
+    def nth(self, day, k):
+        """Return the k-th (0-based) matching date on or after ``day``."""
+        if not self.offsets:
+            raise ValueError('pattern matches no weekdays')
+        return date.fromordinal(self._ordinal(self.index(day) + k))
+
+    def count_between(self, start, end):
+        """Return the number of matching dates from ``start`` to ``end``, inclusive."""
+        if end < start:
+            return 0
+        # Ordinals, since the day after date.max is not a date.
+        return self._index(end.toordinal() + 1) - self.index(start)
+
+
+@lru_cache(maxsize=128)
+def _pattern(offsets):
+    return WeekdayPattern._from_offsets(offsets)
+
+
+def _pattern_for(days):
+    """Return the shared ``WeekdayPattern`` for a list of weekday names."""
+    return _pattern(_weekday_set(days))
+
+
+class ExclusionSet:
+    """Dates and date ranges to skip, e.g. holidays and breaks.
+
+    Entries may be ``date`` objects, ``(start, end)`` pairs of dates
+    (inclusive), or strings in the exclusion file format: 'YYYY-MM-DD' or
+    'YYYY-MM-DD..YYYY-MM-DD'. Overlapping and adjacent entries are merged
+    into sorted, disjoint intervals, so a lookup is one binary search.
+
+    """
+
+    __slots__ = ('_starts', '_ends')
+
+    def __init__(self, entries=()):
+        self._merge(map(_exclusion_interval, entries))
+
+    def _merge(self, intervals):
+        starts, ends = array('i'), array('i')
+        for start, end in sorted(intervals):
+            if ends and start <= ends[-1] + 1:
+                ends[-1] = max(ends[-1], end)
+            else:
+                starts.append(start)
+                ends.append(end)
+        self._starts = starts
+        self._ends = ends
+
+    @classmethod
+    def from_lines(cls, lines):
+        """Parse exclusion file lines; blank lines and '#' comments are ignored."""
+        intervals = []
+        for n, line in enumerate(lines, start=1):
+            line = line.split('#', 1)[0].strip()
+            if not line:
+                continue
+            try:
+                intervals.append(_exclusion_interval(line))
+            except ValueError as e:
+                raise ValueError('line {}: {}'.format(n, e)) from None
+        self = cls.__new__(cls)
+        self._merge(intervals)
+        return self
+
+    @property
+    def intervals(self):
+        """The merged ``(start, end)`` date pairs, in order."""
+        return tuple((date.fromordinal(start), date.fromordinal(end))
+                     for start, end in zip(self._starts, self._ends))
+
+    def __contains__(self, day):
+        ordinal = day.toordinal()
+        i = bisect_right(self._starts, ordinal) - 1
+        return i >= 0 and ordinal <= self._ends[i]
+
+    def __bool__(self):
+        return bool(self._starts)
+
+    def __or__(self, other):
+        return ExclusionSet(self.intervals + other.intervals)
+
+    def __eq__(self, other):
+        if not isinstance(other, ExclusionSet):
+            return NotImplemented
+        return self._starts == other._starts and self._ends == other._ends
+
+    def __hash__(self):
+        return hash((self._starts.tobytes(), self._ends.tobytes()))
+
+    def __repr__(self):
+        return 'ExclusionSet({!r})'.format(list(self.intervals))
+
+    def digest(self):
+        """A short, stable hex digest of the intervals, for cache keys."""
+        import hashlib
+
+        data = self._starts.tobytes() + b'|' + self._ends.tobytes()
+        return hashlib.sha1(data).hexdigest()[:16]
+
+
+def _exclusion_interval(entry):
+    """Return an inclusive ``(start, end)`` pair of ordinals for one entry."""
+    if isinstance(entry, str):
+        first, sep, last = entry.strip().partition('..')
+        entry = (date.fromisoformat(first.strip()),
+                 date.fromisoformat(last.strip()) if sep else None)
+    if isinstance(entry, date):
+        return entry.toordinal(), entry.toordinal()
+    start, end = entry
+    end = start if end is None else end
+    if end < start:
+        raise ValueError('range ends before it starts: {} > {}'.format(start, end))
+    return start.toordinal(), end.toordinal()
+
+
+def _exclusions(exclude):
+    """Accept an ``ExclusionSet`` or anything its constructor takes."""
+    if exclude is None or isinstance(exclude, ExclusionSet):
+        return exclude
+    return ExclusionSet(exclude)
+
+
+def load_exclusions(*paths):
+    """Read and merge exclusion files into one ``ExclusionSet``.
+
+    Parsed files are cached until they are modified, so batch jobs sharing a
+    holiday calendar only read it once.
+    """
+    result = ExclusionSet()
+    for path in paths:
+        st = os.stat(path)
+        result = result | _load_exclusions(os.path.abspath(path), st.st_mtime_ns, st.st_size)
+    return result
+
+
+@lru_cache(maxsize=32)
+def _load_exclusions(path, mtime_ns, size):
+    with open(path) as f:
+        return ExclusionSet.from_lines(f)
+
+
+class Recurrence:
+    """A recurrence rule: a small, weekly-based subset of RFC 5545 RRULE.
+
+    ``days`` are weekday names as for ``get_days``. ``every`` keeps every Nth
+    Monday-to-Sunday week, counting from the week of the start date, like
+    ``FREQ=WEEKLY;INTERVAL=N``. ``nth`` keeps only the given occurrences of
+    each weekday within its month, 1 for the first and -1 for the last, like
+    ``BYDAY=1MO,3MO`` or ``BYDAY=-1FR``.
+
+    Occurrences are found by stepping from one to the next with arithmetic
+    on date ordinals, never by testing each day.
+
+    """
+
+    __slots__ = ('offsets', 'every', 'nth')
+
+    def __init__(self, days, every=1, nth=()):
+        if not isinstance(every, int) or isinstance(every, bool) or every < 1:
+            raise ValueError('every must be a positive integer')
+        nth = tuple(sorted(set(nth or ())))
+        if not all(isinstance(n, int) and 1 <= abs(n) <= 5 for n in nth):
+            raise ValueError('nth values must be 1 to 5, or -1 to -5 to count from the end')
+        self.offsets = _weekday_set(days)
+        self.every = every
+        self.nth = nth
+
+    def __repr__(self):
+        return 'Recurrence({!r}, every={}, nth={})'.format(
+            [_DAY_ABBRS[o] for o in self.offsets], self.every, self.nth)
+
+    def __eq__(self, other):
+        if not isinstance(other, Recurrence):
+            return NotImplemented
+        return (self.offsets, self.every, self.nth) == (other.offsets, other.every, other.nth)
+
+    def __hash__(self):
+        return hash((self.offsets, self.every, self.nth))
+
+    def iter_days(self, start, until=None):
+        """Lazily yield every occurrence from ``start`` through ``until`` (or ``date.max``)."""
+        last = (until or date.max).toordinal()
+        yield from map(date.fromordinal, self._ordinals(start.toordinal(), last))
+
+    def _ordinals(self, first, last, anchor=None):
+        """Occurrences from ``first`` to ``last``, counting ``every`` from ``anchor``'s week."""
+        if not self.offsets or first > last:
+            return iter(())
+        # Ordinal 1 was a Monday.
+        anchor = first if anchor is None else anchor
+        anchor -= (anchor - 1) % 7
+        if self.nth:
+            ordinals = self._monthly(first, last)
+            if self.every > 1:
+                ordinals = (o for o in ordinals if (o - anchor) // 7 % self.every == 0)
+            return ordinals
+        if self.every > 1:
+            return self._weekly(first, last, anchor)
+        start = date.fromordinal(first)
+        days = [_DAY_ABBRS[o] for o in self.offsets]
+        return _iter_ordinals(start.year, start.month, start.day, days,
+                              None, date.fromordinal(last))
+
+    def _weekly(self, first, last, anchor):
+        step = 7 * self.every
+        # The first week of the rule on or after the week of ``first``.
+        monday = first - (first - 1) % 7
+        monday += -(monday - anchor) % step
+        offsets = [o for o in self.offsets if monday + o >= first]
+        while True:
+            for o in offsets:
+                if monday + o > last:
+                    return
+                yield monday + o
+            offsets = self.offsets
+            monday += step
+
+    def _monthly(self, first, last):
+        start = date.fromordinal(first)
+        year, month = start.year, start.month
+        month_start = date(year, month, 1).toordinal()
+        while month_start <= last:
+            if month == 12:
+                year, month = year + 1, 1
+            else:
+                month += 1
+            month_end = (date(year, month, 1).toordinal() if year <= 9999
+                         else date.max.toordinal() + 1)
+            weekday = (month_start - 1) % 7
+            found = set()
+            for o in self.offsets:
+                # The first such weekday of the month, and how many there are.
+                earliest = month_start + (o - weekday) % 7
+                count = (month_end - 1 - earliest) // 7 + 1
+                for n in self.nth:
+                    index = n - 1 if n > 0 else count + n
+                    if 0 <= index < count:
+                        found.add(earliest + 7 * index)
+            for ordinal in sorted(found):
+                if ordinal > last:
+                    return
+                if ordinal >= first:
+                    yield ordinal
+            month_start = month_end
+
+
+class Cursor:
+    """Where a schedule left off, so that it can be extended cheaply.
+
+    ``start`` is the schedule's first day, ``last`` the last date emitted so
+    far (None before any) and ``weeks`` the number of weeks with a date so
+    far, which is also the group number of ``last``. Passing a cursor to
+    ``get_days``, ``iter_days`` or ``iter_weeks`` resumes right after
+    ``last``: the next ``weeks`` weeks cost the same as computing just
+    them, and the pages put together match one long run.
+
+    ``to_dict`` and ``from_dict`` convert cursors to and from JSON-ready
+    dicts so they can be handed to a client and back.
+
+    """
+
+    __slots__ = ('start', 'last', 'weeks')
+
+    def __init__(self, start, last=None, weeks=0):
+        self.start = start
+        self.last = last
+        self.weeks = weeks
+
+    def advance(self, dates):
+        """Return the cursor after ``dates``, the next dates of the schedule in order."""
+        last, weeks = self.last, self.weeks
+        monday = None if last is None else last.toordinal() - last.weekday()
+        for day in dates:
+            ordinal = day.toordinal()
+            if monday is None or ordinal - monday >= 7:
+                weeks += 1
+                monday = ordinal - day.weekday()
+            last = day
+        return Cursor(self.start, last, weeks)
+
+    def to_dict(self):
+        return {
+            'start': self.start.isoformat(),
+            'last': self.last.isoformat() if self.last is not None else None,
+            'weeks': self.weeks,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        if not isinstance(data, dict):
+            raise ValueError('cursor must be an object, not {!r}'.format(data))
+        last = data.get('last')
+        return cls(date.fromisoformat(data.get('start')),
+                   date.fromisoformat(last) if last else None,
+                   int(data.get('weeks', 0)))
+
+    def __eq__(self, other):
+        if not isinstance(other, Cursor):
+            return NotImplemented
+        return (self.start, self.last, self.weeks) == (other.start, other.last, other.weeks)
+
+    def __hash__(self):
+        return hash((self.start, self.last, self.weeks))
+
+    def __repr__(self):
+        return 'Cursor({!r}, last={!r}, weeks={})'.format(self.start, self.last, self.weeks)
+
+
+class Schedule:
+    """A set of dates stored as weekly-periodic segments.
+
+    Each segment is a first and a last date plus a set of weekdays, and
+    stands for every date between them that falls on one of those
+    weekdays, so a plain weekly schedule is one segment however long it
+    runs. ``Schedule(days, start, end)`` is one such segment; with no
+    ``start`` or ``end`` it runs from ``date.min`` or to ``date.max``.
+
+    Schedules combine with ``|`` (union), ``&`` (intersection) and ``-``
+    (difference), in time proportional to the number of segments, not
+    dates. ``count_between`` takes O(log n) time and ``slice_between``
+    O(log n + k) for n segments, k of them in the range. Iterating yields
+    the dates in order.
+
+    """
+
+    __slots__ = ('_starts', '_ends', '_masks', '_counts')
+
+    def __init__(self, days=(), start=None, end=None):
+        first = (start or date.min).toordinal()
+        last = (end or date.max).toordinal()
+        self._build([(first, last, _weekday_mask(tuple(days)))])
+
+    @classmethod
+    def from_days(cls, year, month, day, days, weeks=14, exclude=None, every=1, nth=None):
+        """The schedule ``get_days`` computes for the same arguments.
+
+        ``weeks`` may be None for an open-ended schedule. A plain weekly
+        schedule becomes one segment without visiting its dates; with
+        ``exclude``, ``every`` or ``nth`` the dates are generated once and
+        compressed into segments.
+        """
+        if not _exclusions(exclude) and every == 1 and not nth:
+            first = next(_iter_ordinals(year, month, day, days, None), None)
+            if first is None:
+                return cls()
+            last = date.max.toordinal()
+            if weeks is not None:
+                weeks = max(weeks, 0)
+                # The first week is short by however many matches precede the start.
+                pattern = _pattern_for(days)
+                index = pattern._index(first)
+                stop = index - index % len(pattern) + weeks * len(pattern)
+                last = min(last, pattern._ordinal(stop - 1))
+            return cls._from_segments([(first, last, _weekday_mask(tuple(days)))])
+        return cls.from_dates(iter_days(year, month, day, days, weeks, exclude=exclude,
+                                        every=every, nth=nth))
+
+    @classmethod
+    def from_dates(cls, dates):
+        """Compress any dates into segments, merging runs that repeat weekly."""
+        segments = []
+        first = last = mask = None
+        for ordinal in sorted(set(map(date.toordinal, dates))):
+            bit = 1 << (ordinal - 1) % 7
+            if first is not None:
+                if ordinal - first < 7:
+                    # Every weekday seen so far is distinct, so skipped days
+                    # are not on the segment's weekdays.
+                    mask |= bit
+                    last = ordinal
+                    continue
+                if mask & bit and _next_on(last, mask) == ordinal:
+                    last = ordinal
+                    continue
+                segments.append((first, last, mask))
+            first = last = ordinal
+            mask = bit
+        if first is not None:
+            segments.append((first, last, mask))
+        return cls._from_segments(segments)
+
+    @classmethod
+    def _from_segments(cls, segments):
+        self = cls.__new__(cls)
+        self._build(segments)
+        return self
+
+    def _build(self, segments):
+        """Store ``(first, last, mask)`` ordinal segments, given in order.
+
+        Segments are trimmed to their first and last matching dates, short
+        ones drop the weekdays they don't contain, and neighbours with the
+        same weekdays and nothing between them are merged.
+        """
+        starts, ends, masks, counts = array('i'), array('i'), array('B'), array('q', [0])
+        for first, last, mask in segments:
+            if not mask or last < first:
+                continue
+            pattern = _mask_pattern(mask)
+            start, stop = pattern._index(first), pattern._index(last + 1)
+            if start == stop:
+                continue
+            first, last = pattern._ordinal(start), pattern._ordinal(stop - 1)
+            if last - first < 6:
+                mask &= _span_mask(first, last)
+            if masks and masks[-1] == mask and _next_on(ends[-1], mask) == first:
+                ends[-1] = last
+                counts[-1] += stop - start
+                continue
+            starts.append(first)
+            ends.append(last)
+            masks.append(mask)
+            counts.append(counts[-1] + stop - start)
+        self._starts, self._ends, self._masks, self._counts = starts, ends, masks, counts
+
+    @property
+    def segments(self):
+        """The ``(first, last, weekdays)`` segments, in order."""
+        return tuple((date.fromordinal(first), date.fromordinal(last),
+                      tuple(_DAY_ABBRS[o] for o in _mask_pattern(mask).offsets))
+                     for first, last, mask in zip(self._starts, self._ends, self._masks))
+
+    def _combine(self, other, op):
+        if not isinstance(other, Schedule):
+            return NotImplemented
+        cuts = sorted(set(self._starts).union(other._starts,
+                                               (end + 1 for end in self._ends),
+                                               (end + 1 for end in other._ends)))
+        pieces = []
+        i = j = 0
+        for first, stop in zip(cuts, cuts[1:]):
+            while i < len(self._ends) and self._ends[i] < first:
+                i += 1
+            while j < len(other._ends) and other._ends[j] < first:
+                j += 1
+            a = self._masks[i] if i < len(self._starts) and self._starts[i] <= first else 0
+            b = other._masks[j] if j < len(other._starts) and other._starts[j] <= first else 0
+            pieces.append((first, stop - 1, op(a, b)))
+        return Schedule._from_segments(pieces)
+
+    def __or__(self, other):
+        return self._combine(other, int.__or__)
+
+    def __and__(self, other):
+        return self._combine(other, int.__and__)
+
+    def __sub__(self, other):
+        return self._combine(other, lambda a, b: a & ~b & 0x7f)
+
+    def count_between(self, start, end):
+        """Return the number of dates from ``start`` to ``end``, inclusive."""
+        first, last = start.toordinal(), end.toordinal()
+        i, j = self._overlapping(first, last)
+        if i > j or last < first:
+            return 0
+        count = self._counts[j + 1] - self._counts[i]
+        if self._starts[i] < first:
+            count -= _count_on(self._starts[i], first - 1, self._masks[i])
+        if self._ends[j] > last:
+            count -= _count_on(last + 1, self._ends[j], self._masks[j])
+        return count
+
+    def slice_between(self, start, end):
+        """Return the dates from ``start`` to ``end``, inclusive, as a ``Schedule``."""
+        first, last = start.toordinal(), end.toordinal()
+        i, j = self._overlapping(first, last)
+        return Schedule._from_segments(
+            (max(self._starts[k], first), min(self._ends[k], last), self._masks[k])
+            for k in range(i, j + 1))
+
+    def _overlapping(self, first, last):
+        """Indices of the first and last segments that overlap ``first..last``."""
+        return bisect_left(self._ends, first), bisect_right(self._starts, last) - 1
+
+    def __contains__(self, day):
+        ordinal = day.toordinal()
+        i = bisect_right(self._starts, ordinal) - 1
+        return (i >= 0 and ordinal <= self._ends[i]
+                and bool(self._masks[i] >> (ordinal - 1) % 7 & 1))
+
+    def __iter__(self):
+        for first, last, mask in zip(self._starts, self._ends, self._masks):
+            pattern = _mask_pattern(mask)
+            for index in range(pattern._index(first), pattern._index(last + 1)):
+                yield date.fromordinal(pattern._ordinal(index))
+
+    def __len__(self):
+        return self._counts[-1]
+
+    def __bool__(self):
+        return bool(self._starts)
+
+    def __eq__(self, other):
+        if not isinstance(other, Schedule):
+            return NotImplemented
+        # Different segments can hold the same dates, so compare the sets.
+        return len(self) == len(other) and not self - other
+
+    __hash__ = None
+
+    def __repr__(self):
+        return 'Schedule({!r})'.format(list(self.segments))
+
+
+@lru_cache(maxsize=128)
+def _mask_pattern(mask):
+    """The shared ``WeekdayPattern`` for a bitmask of weekdays."""
+    return _pattern(tuple(i for i in range(7) if mask >> i & 1))
+
+
+def _span_mask(first, last):
+    """The bitmask of the weekdays from ordinal ``first`` to ``last`` (under a week)."""
+    weekday = (first - 1) % 7
+    bits = (1 << (last - first + 1)) - 1
+    return (bits << weekday | bits >> (7 - weekday)) & 0x7f
+
+
+def _next_on(ordinal, mask):
+    """The first ordinal after ``ordinal`` that falls on a weekday in ``mask``."""
+    pattern = _mask_pattern(mask)
+    return pattern._ordinal(pattern._index(ordinal + 1))
+
+
+def _count_on(first, last, mask):
+    """The number of ordinals from ``first`` to ``last`` on a weekday in ``mask``."""
+    pattern = _mask_pattern(mask)
+    return pattern._index(last + 1) - pattern._index(first)
+
+
+def iter_days(year, month, day, days, weeks=14, *, until=None, exclude=None, every=1, nth=None,
+              cursor=None):
+    """Yield matching days of the calendar one at a time, as ``date`` objects.
+
+    Takes the same arguments as ``get_days``, but everything after
+    ``weeks`` is keyword-only. ``weeks`` may be None for an open-ended
+    sequence, and ``until`` is an optional last ``date`` to yield.
+
+    Weeks run Monday through Sunday, and only weeks containing at least one
+    matching day count towards ``weeks``.
+
+    """
+    yield from map(date.fromordinal, _iter_ordinals(year, month, day, days, weeks, until,
+                                                    exclude, every, nth, cursor))
+
+
+def _iter_ordinals(year, month, day, days, weeks=14, until=None, exclude=None,
+                   every=1, nth=None, cursor=None):
+    """Like ``iter_days``, but yield ``date.toordinal()`` integers."""
+    exclude = _exclusions(exclude)
+    if weeks is not None and weeks < 0:
+        # Only None is open-ended.
+        weeks = 0
+    if cursor is not None:
+        if cursor.start != date(year, month, day):
+            raise ValueError('cursor belongs to a schedule starting on {}'.format(cursor.start))
+        if cursor.last is None:
+            cursor = None
+    if exclude or every != 1 or nth or cursor:
+        anchor = date(year, month, day).toordinal()
+        first, monday = anchor, None
+        if cursor:
+            first = cursor.last.toordinal() + 1
+            monday = cursor.last.toordinal() - cursor.last.weekday()
+        last = (until or date.max).toordinal()
+        ordinals = Recurrence(days, every, nth)._ordinals(first, last, anchor)
+        yield from _limit_weeks(ordinals, weeks, exclude, monday)
+        return
+
+    pattern = _pattern_for(days)
+    size = len(pattern)
+    if not size:
+        return
+
+    first = pattern.index(date(year, month, day))
+    last = until.toordinal() if until is not None else date.max.toordinal()
+    if weeks is not None:
+        # The first week is short by however many matches precede the start.
+        stop = first - first % size + weeks * size
+        if stop <= first:
+            return
+        last = min(last, pattern._ordinal(stop - 1))
+
+    offsets = pattern.offsets
+    week, r = divmod(first, size)
+    monday = 1 + 7 * week
+    current = offsets[r:]
+    while True:
+        for o in current:
+            if monday + o > last:
+                return
+            yield monday + o
+        current = offsets
+        monday += 7
+
+
+def _limit_weeks(ordinals, weeks, exclude=None, monday=None):
+    """Stop after ``weeks`` weeks with a date, dropping excluded ordinals.
+
+    ``monday`` is the week already under way, whose dates don't start a
+    new week.
+    """
+    starts, ends = (exclude._starts, exclude._ends) if exclude else ((), ())
+    num_weeks = 0
+    for ordinal in ordinals:
+        if starts:
+            i = bisect_right(starts, ordinal) - 1
+            if i >= 0 and ordinal <= ends[i]:
+                continue
+        if monday is None or ordinal - monday >= 7:
+            if num_weeks == weeks:
+                return
+            num_weeks += 1
+            # Ordinal 1 was a Monday.
+            monday = ordinal - (ordinal - 1) % 7
+        yield ordinal
+
+
+def iter_weeks(year, month, day, days, weeks=14, *, until=None, exclude=None, every=1, nth=None,
+               cursor=None):
+    """Yield the dates ``iter_days`` would, grouped into one tuple per week.
+
+    Weeks run Monday through Sunday, so the first tuple may be short when
+    the start date falls mid-week. Takes the same arguments as ``iter_days``.
+
+    """
+    return _group_weeks(iter_days(year, month, day, days, weeks, until=until, exclude=exclude,
+                                  every=every, nth=nth, cursor=cursor))
+
+
+def _group_weeks(dates):
+    """Group an ordered stream of dates into tuples, one per Monday-to-Sunday week."""
+    week = []
+    monday = None
+    for day in dates:
+        ordinal = day.toordinal()
+        if monday is None or ordinal - monday >= 7:
+            if week:
+                yield tuple(week)
+                week = []
+            monday = ordinal - day.weekday()
+        week.append(day)
+    if week:
+        yield tuple(week)
+
+
+async def aiter_days(year, month, day, days, weeks=14, *, until=None, exclude=None,
+                     every=1, nth=None, cursor=None, batch_size=1024):
+    """Asynchronously yield matching days, like ``iter_days``.
+
+    Control is handed back to the event loop after every ``batch_size``
+    dates, so long schedules can be consumed inside an asyncio service
+    without stalling other tasks.
+
+    """
+    import asyncio
+
+    ordinals = _iter_ordinals(year, month, day, days, weeks, until, exclude, every, nth, cursor)
+    for batch in batched(ordinals, batch_size):
+        for ordinal in batch:
+            yield date.fromordinal(ordinal)
+        await asyncio.sleep(0)
+
+
+class DateArray(Sequence):
+    """An immutable sequence of dates stored compactly as ordinals.
+
+    Dates are kept in an ``array('i')`` of ``date.toordinal()`` values, 4
+    bytes each. Indexing and iteration produce ``date`` objects, slicing
+    produces another ``DateArray``, and ``strings()`` gives a view that
+    formats dates only when they are read.
+
+    """
+
+    __slots__ = ('_ordinals',)
+
+    def __init__(self, dates=()):
+        self._ordinals = array('i', map(date.toordinal, dates))
+
+    @classmethod
+    def _from_ordinals(cls, ordinals):
+        result = cls.__new__(cls)
+        result._ordinals = ordinals
+        return result
+
+    @property
+    def ordinals(self):
+        """A read-only ``memoryview`` of the underlying ordinals."""
+        return memoryview(self._ordinals).toreadonly()
+
+    def __len__(self):
+        return len(self._ordinals)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._from_ordinals(self._ordinals[index])
+        return date.fromordinal(self._ordinals[index])
+
+    def __iter__(self):
+        return map(date.fromordinal, self._ordinals)
+
+    def __contains__(self, value):
+        return isinstance(value, date) and value.toordinal() in self._ordinals
+
+    def __eq__(self, other):
+        if isinstance(other, DateArray):
+            return self._ordinals == other._ordinals
+        if isinstance(other, (list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __sizeof__(self):
+        return object.__sizeof__(self) + self._ordinals.__sizeof__()
+
+    def __repr__(self):
+        return 'DateArray({!r})'.format(list(self))
+
+    def strings(self, format_day=None):
+        """Return a ``DateStrings`` view, formatting with ``format_day``.
+
+        The default format is the C-locale ``%c`` that ``get_days`` returns,
+        e.g. 'Tue Jan 23 00:00:00 2018'.
+        """
+        return DateStrings(self, format_day or _format_c)
+
+
+class DateStrings(Sequence):
+    """A read-only view of a ``DateArray`` as formatted strings.
+
+    Strings are produced on access, so the view costs no more memory than
+    the dates it wraps. It compares equal to a list or tuple of the same
+    strings.
+
+    """
+
+    __slots__ = ('dates', '_format', '_cursor')
+
+    def __init__(self, dates, format_day=None):
+        self.dates = dates
+        self._format = format_day or _format_c
+        self._cursor = None
+
+    @property
+    def cursor(self):
+        """For a ``get_days`` result, the ``Cursor`` after its last date; otherwise None."""
+        if self._cursor is None:
+            return None
+        return self._cursor.advance(self.dates)
+
+    def __len__(self):
+        return len(self.dates)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return DateStrings(self.dates[index], self._format)
+        return self._format(self.dates[index])
+
+    def __iter__(self):
+        return map(self._format, self.dates)
+
+    def __eq__(self, other):
+        if isinstance(other, (DateStrings, list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __sizeof__(self):
+        return object.__sizeof__(self) + self.dates.__sizeof__()
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+# date.toordinal() of 1970-01-01, the epoch of numpy.datetime64.
+_UNIX_EPOCH = 719163
+
+
+def get_days_array(year, month, day, days, weeks=14, until=None):
+    """Return the dates ``iter_days`` yields as a NumPy ``datetime64[D]`` array.
+
+    This is an optional backend for very long schedules and requires NumPy;
+    without it, use ``iter_days`` or ``get_days``. ``weeks`` must be a
+    non-negative integer.
+
+    The dates are computed with array arithmetic: a Monday for every week,
+    stepped by 7 days, plus each weekday offset. The result is contiguous,
+    so ``result.view('int64')`` (days since 1970-01-01), the buffer protocol
+    and DLPack all expose it without copying.
+
+    """
+    import numpy as np
+
+    if weeks is None or weeks < 0:
+        raise ValueError('weeks must be a non-negative integer')
+    pattern = _pattern_for(days)
+    size = len(pattern)
+    if not size or not weeks:
+        return np.empty(0, dtype='datetime64[D]')
+
+    first = pattern.index(date(year, month, day))
+    week, skip = divmod(first, size)
+    mondays = np.arange(weeks, dtype=np.int64) * 7 + (1 + 7 * week - _UNIX_EPOCH)
+    offsets = np.array(pattern.offsets, dtype=np.int64)
+    result = (mondays[:, None] + offsets).ravel()[skip:weeks * size]
+
+    last = until.toordinal() if until is not None else date.max.toordinal()
+    result = result[:np.searchsorted(result, last - _UNIX_EPOCH, side='right')]
+    return result.view('datetime64[D]')
+
+
+def get_days(year, month, day, days, weeks=14, exclude=None, every=1, nth=None, cursor=None):
     """Print some days of the calendar sequentially.
 
-    - year: starting year, e.g. 2018
-    - month: integer month, e.g. 1 for January
-    - day: day of the month, e.g. 20
-    - days: A list of days of the week in which we're interested. These should
-      be written as the first 3 chars; default is ['Tue', 'Thu']
-    - weeks: Number of weeks we print; default is 14
+    - year: starting year, e.g. 2018
+    - month: integer month, e.g. 1 for January
+    - day: day of the month, e.g. 20
+    - days: A list of days of the week in which we're interested, e.g.
+      ['Tue', 'Thu']. Any case-insensitive prefix of an English weekday name
+      works; unknown names raise ValueError
+    - weeks: Number of weeks we print; default is 14. Negative numbers
+      count as 0
+    - exclude: Optional dates or date ranges to skip, as an ``ExclusionSet``
+      or anything it accepts. Skipped dates are not output, and weeks left
+      without any dates do not count towards ``weeks``
+    - every: Only use every Nth week, counting from the start date's week
+    - nth: Only use these occurrences of each weekday within its month,
+      e.g. (1, 3) for the first and third, or (-1,) for the last
+    - cursor: A ``Cursor`` from an earlier result for the same schedule;
+      results then pick up right after it
+
+    Results continue across month and year boundaries for as many weeks as
+    requested. See ``iter_days`` for a lazy version.
+
+    The result is a ``DateStrings`` sequence of strings like
+    'Tue Jan 23 00:00:00 2018', formatted as they are read from a compact
+    ``DateArray``; its ``dates`` attribute gives the dates themselves, and
+    its ``cursor`` attribute where they leave off.
+
+    """
+    if _profile_hooks:
+        ordinals = _get_days_profiled(year, month, day, days, weeks, exclude, every, nth, cursor)
+    else:
+        ordinals = array('i', _iter_ordinals(year, month, day, days, weeks, None, exclude,
+                                             every, nth, cursor))
+    result = DateArray._from_ordinals(ordinals).strings()
+    result._cursor = cursor or Cursor(date(year, month, day))
+    return result
+
+
+def _get_days_profiled(year, month, day, days, weeks, exclude, every, nth, cursor):
+    profile = Profile('get_days')
+    start = perf_counter()
+    ordinals = array('i', _iter_ordinals(year, month, day, days, weeks, None, exclude,
+                                         every, nth, cursor))
+    seconds = perf_counter() - start
+    # Counted after the clock stops, so the timing matches an unprofiled call.
+    for _ in _tally(ordinals, profile.counters):
+        pass
+    profile._finish('generate', seconds)
+    return ordinals
+
+
+def get_days_multi(year, month, day, patterns, weeks=14, exclude=None, every=1, nth=None):
+    """Compute ``get_days`` for many weekday lists that share a start date.
+
+    ``patterns`` is an iterable of weekday lists such as ``[['Mon', 'Wed',
+    'Fri'], ['Tue', 'Thu']]``; the other arguments are as for ``get_days``.
+    Returns a list with one ``DateStrings`` result per pattern, in order,
+    each equal to what ``get_days`` returns for that pattern alone.
+
+    Without ``exclude`` or ``nth``, every pattern's dates are cut from the
+    same weekly grid: one column of ordinals per weekday in use (at most
+    seven, however many patterns there are), interleaved into each result
+    with slice assignment. Other schedules are computed one by one.
+
+    """
+    patterns = [list(days) for days in patterns]
+    rules = [Recurrence(days, every, nth) for days in patterns]
+    start = date(year, month, day)
+    results = None
+    if not _exclusions(exclude) and not nth:
+        results = _multi_ordinals(start.toordinal(), [rule.offsets for rule in rules],
+                                  weeks, every)
+    if results is None:
+        results = [array('i', _iter_ordinals(year, month, day, days, weeks, None, exclude,
+                                             every, nth))
+                   for days in patterns]
+    results = [DateArray._from_ordinals(ordinals).strings() for ordinals in results]
+    for result in results:
+        result._cursor = Cursor(start)
+    return results
+
+
+def _multi_ordinals(first, offset_sets, weeks, every):
+    """Ordinal arrays for each tuple of weekday offsets, or None if out of range.
+
+    Row k of the grid is the week starting ``7 * every * k`` days after the
+    Monday of ``first``. A pattern with no match left in row 0 starts at
+    row 1, so ``weeks + 1`` rows cover every pattern.
+    """
+    if weeks is None or weeks < 0:
+        return None
+    # Ordinal 1 was a Monday.
+    monday = first - (first - 1) % 7
+    step = 7 * every
+    rows = weeks + 1
+    if monday + step * weeks + 6 > date.max.toordinal():
+        return None
+    columns = {}
+    results = []
+    weekday = first - monday
+    for offsets in offset_sets:
+        size = len(offsets)
+        grid = array('i', bytes(4 * size * rows))
+        for i, o in enumerate(offsets):
+            column = columns.get(o)
+            if column is None:
+                column = columns[o] = array('i', range(monday + o, monday + o + step * rows, step))
+            grid[i::size] = column
+        skip = sum(1 for o in offsets if o < weekday)
+        if skip < size:
+            results.append(grid[skip:size * weeks])
+        else:
+            results.append(grid[size:])
+    return results
+
+
+class Profile:
+    """Per-stage timings and counters from one ``get_days`` call or CLI run.
+
+    ``stages`` maps each stage ('generate', 'group', 'format', 'output') to
+    the seconds spent in that stage alone, in pipeline order. ``counters``
+    holds ``dates_emitted``, ``weeks_emitted`` (weeks with a date),
+    ``days_spanned`` and ``weeks_spanned`` (the calendar walked from the
+    first date to the last) and, for the CLI, ``lines_written`` and
+    ``bytes_written``; ``--count`` reports ``dates_counted`` instead of the
+    date counters.
+
+    Profiles are only collected while a hook is registered with
+    ``add_profile_hook``, or for ``--profile``; otherwise the cost is one
+    check per call.
+
+    """
+
+    __slots__ = ('name', 'stages', 'counters', '_chain')
+
+    def __init__(self, name):
+        self.name = name
+        self.stages = {}
+        self.counters = {}
+        self._chain = []
+
+    def as_dict(self):
+        return {
+            'name': self.name,
+            'seconds': sum(self.stages.values()),
+            'stages': dict(self.stages),
+            'counters': dict(self.counters),
+        }
+
+    def _timed(self, stage, iterable):
+        """Time a lazy stage; each stage must wrap the one timed before it."""
+        timed = _Timed(iterable)
+        self._chain.append((stage, timed))
+        return timed
+
+    def _finish(self, stage=None, seconds=0.0):
+        """Turn nested stage times into per-stage times and call the hooks."""
+        inner = 0.0
+        for name, timed in self._chain:
+            self.stages[name] = timed.seconds - inner
+            inner = timed.seconds
+        if stage is not None:
+            self.stages[stage] = seconds - inner
+        for hook in list(_profile_hooks):
+            hook(self)
+
+
+class _Timed:
+    """An iterable that adds up the time spent producing its items.
+
+    Items are pulled ``batch_size`` at a time so the clock is read twice
+    per batch rather than twice per item.
+    """
+
+    __slots__ = ('_iterable', 'batch_size', 'seconds', 'count')
+
+    def __init__(self, iterable, batch_size=256):
+        self._iterable = iterable
+        self.batch_size = batch_size
+        self.seconds = 0.0
+        self.count = 0
+
+    def __iter__(self):
+        iterator = iter(self._iterable)
+        while True:
+            start = perf_counter()
+            batch = list(islice(iterator, self.batch_size))
+            self.seconds += perf_counter() - start
+            if not batch:
+                return
+            self.count += len(batch)
+            yield from batch
+
+
+def _tally(items, counters, key=None):
+    """Pass ``items`` through, counting dates, weeks and the days they span."""
+    count = weeks = 0
+    first = last = monday = None
+    try:
+        for item in items:
+            ordinal = item if key is None else key(item)
+            if monday is None or ordinal - monday >= 7:
+                weeks += 1
+                # Ordinal 1 was a Monday.
+                monday = ordinal - (ordinal - 1) % 7
+            if first is None:
+                first = ordinal
+            last = ordinal
+            count += 1
+            yield item
+    finally:
+        counters['dates_emitted'] = count
+        counters['weeks_emitted'] = weeks
+        counters['days_spanned'] = last - first + 1 if count else 0
+        counters['weeks_spanned'] = (last - first + (first - 1) % 7) // 7 + 1 if count else 0
+
+
+_profile_hooks = []
+
+
+def add_profile_hook(hook):
+    """Call ``hook(profile)`` with a ``Profile`` after each ``get_days`` call and CLI run."""
+    _profile_hooks.append(hook)
+
+
+def remove_profile_hook(hook):
+    """Stop calling a hook registered with ``add_profile_hook``."""
+    _profile_hooks.remove(hook)
+
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'evictions', 'maxsize', 'currsize'])
+
+
+class _ScheduleCache:
+    """A thread-safe LRU mapping of normalized arguments to result tuples."""
+
+    def __init__(self, maxsize=128):
+        self.maxsize = _check_maxsize(maxsize)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = 0
+
+    def get(self, key, compute):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+        value = compute()
+        with self._lock:
+            self._entries[key] = value
+            self._evict()
+        return value
+
+    def resize(self, maxsize):
+        _check_maxsize(maxsize)
+        with self._lock:
+            self.maxsize = maxsize
+            self._evict()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def info(self):
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.evictions,
+                             self.maxsize, len(self._entries))
+
+    def _evict(self):
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+
+def _check_maxsize(maxsize):
+    if not isinstance(maxsize, int) or maxsize < 0:
+        raise ValueError('cache size must be a non-negative integer, not {!r}'.format(maxsize))
+    return maxsize
+
+
+_cache = _ScheduleCache()
+
+
+def get_days_cached(year, month, day, days, weeks=14, exclude=None, every=1, nth=None):
+    """Like ``get_days``, but memoized in a bounded LRU cache.
+
+    Equivalent requests share an entry: weekdays are compared by the days
+    they match, so ['Thu', 'Tue'] and ['tue', 'thu'] hit the same result.
+    Results are tuples so that cached values can be shared safely.
+
+    """
+    exclude = _exclusions(exclude)
+    key = (date(year, month, day).toordinal(), _weekday_set(days), weeks, exclude or None,
+           every, tuple(sorted(set(nth or ()))))
+    return _cache.get(key, lambda: tuple(get_days(year, month, day, days, weeks, exclude,
+                                                  every, nth)))
+
+
+def cache_info():
+    """Return hit, miss and eviction counters for ``get_days_cached``."""
+    return _cache.info()
+
+
+def cache_clear():
+    """Empty the ``get_days_cached`` cache and reset its counters."""
+    _cache.clear()
+
+
+def set_cache_size(maxsize):
+    """Bound the ``get_days_cached`` cache to ``maxsize`` entries.
 
+    Raises ValueError if ``maxsize`` is negative.
     """
-    results = []
+    _cache.resize(maxsize)
 
-    c = calendar.Calendar()
-    start_date = date(year, month, day)
 
-    num_weeks = 0
-    for m in range(13)[month:]:
-        for week in c.monthdatescalendar(year, m):
-            if num_weeks == weeks:
-                return results
+class _DiskCache:
+    """Schedules stored as JSON files of date ordinals, shared across processes.
+
+    Entries are written to a temporary file and renamed into place, so a
+    reader never sees a partial entry. Once there are more than
+    ``maxentries`` files, the least recently used ones are removed.
+
+    """
+
+    # Longer schedules are streamed without being stored.
+    max_dates = 100_000
+
+    def __init__(self, path=None, maxentries=256):
+        if path is None:
+            base = os.environ.get('XDG_CACHE_HOME') or os.path.join(
+                os.path.expanduser('~'), '.cache')
+            path = os.path.join(base, 'days')
+        self.path = path
+        self.maxentries = maxentries
+
+    def _file(self, key):
+        start, offsets, weeks, *extra = key
+        name = 'v1-{}-{}-{}.json'.format(
+            start, ''.join(map(str, offsets)), '-'.join(map(str, [weeks] + extra)))
+        return os.path.join(self.path, name)
+
+    def load(self, key):
+        """Return the cached ordinals for ``key``, or None on a miss."""
+        import json
+
+        filename = self._file(key)
+        try:
+            with open(filename) as f:
+                ordinals = json.load(f)
+            os.utime(filename)
+        except (OSError, ValueError):
+            return None
+        return ordinals
+
+    def store(self, key, ordinals):
+        """Atomically write ``ordinals`` for ``key``, then evict old entries."""
+        import json
+        import tempfile
+
+        tmp = None
+        try:
+            os.makedirs(self.path, exist_ok=True)
+            with tempfile.NamedTemporaryFile('w', dir=self.path, suffix='.tmp',
+                                             delete=False) as f:
+                tmp = f.name
+                json.dump(ordinals, f)
+            os.replace(tmp, self._file(key))
+            tmp = None
+            self._evict()
+        except OSError:
+            if tmp is not None:
+                try:
+                    os.unlink(tmp)
+                except OSError:
+                    pass
+
+    def clear(self):
+        """Remove every cached entry."""
+        for name in self._entries():
+            try:
+                os.unlink(os.path.join(self.path, name))
+            except OSError:
+                pass
+
+    def _entries(self):
+        try:
+            return [name for name in os.listdir(self.path)
+                    if name.startswith('v1-') and name.endswith('.json')]
+        except OSError:
+            return []
+
+    def _evict(self):
+        names = self._entries()
+        if len(names) <= self.maxentries:
+            return
+
+        def mtime(name):
+            try:
+                return os.stat(os.path.join(self.path, name)).st_mtime
+            except OSError:
+                return 0
+
+        names.sort(key=mtime)
+        for name in names[:len(names) - self.maxentries]:
+            try:
+                os.unlink(os.path.join(self.path, name))
+            except OSError:
+                pass
+
+
+def _iter_disk_cached(cache, year, month, day, days, weeks, exclude=None, every=1, nth=None):
+    """Yield ``iter_days`` results, served from or saved to a ``_DiskCache``."""
+    key = (date(year, month, day).toordinal(), _weekday_set(days), weeks)
+    if exclude:
+        key += ('x' + exclude.digest(),)
+    if every != 1:
+        key += ('e{}'.format(every),)
+    if nth:
+        key += ('n' + '_'.join(map(str, sorted(set(nth)))),)
+    ordinals = cache.load(key)
+    if ordinals is not None:
+        yield from map(date.fromordinal, ordinals)
+        return
+
+    ordinals = []
+    for dt in iter_days(year, month, day, days, weeks=weeks, exclude=exclude,
+                        every=every, nth=nth):
+        if ordinals is not None:
+            ordinals.append(dt.toordinal())
+            if len(ordinals) > cache.max_dates:
+                ordinals = None
+        yield dt
+    if ordinals is not None and weeks is not None and weeks >= 0:
+        cache.store(key, ordinals)
+
+
+def _format_c(day):
+    """Format a date like ``strftime('%c')`` in the C locale."""
+    return '{} {} {:2d} 00:00:00 {}'.format(
+        _DAY_ABBRS[day.weekday()], _MONTH_ABBRS[day.month], day.day, day.year)
+
+
+def _format_day(day):
+    """Format a date the way ``main`` prints it, e.g. 'Tue Jan 23'."""
+    return '{} {} {:2d}'.format(_DAY_ABBRS[day.weekday()], _MONTH_ABBRS[day.month], day.day)
+
+
+def _formatter(date_format=None):
+    """Return a function that formats dates for output.
+
+    Without ``date_format`` this is ``_format_day``, which does not depend
+    on the locale; otherwise dates are passed through ``strftime``.
+    """
+    if date_format is None:
+        return _format_day
+    return lambda day: day.strftime(date_format)
+
+
+def run_job(job, today=None):
+    """Compute one schedule described by a ``job`` dict.
+
+    Recognized keys are ``id``, ``start_date`` ('YYYY-MM-DD') or ``year``,
+    ``month`` and ``day``, ``weekdays`` (a list or a space-separated string),
+    ``weeks``, ``group``, ``exclude`` (an exclusion file path, or a list of
+    paths), ``every`` and ``nth`` (a list of integers or a string like
+    '1,3,-1'). Missing fields fall back to the CLI defaults, starting from
+    ``today``. A ``cursor`` key (None, or a ``Cursor.to_dict()`` dict from
+    an earlier result) asks for the page of ``weeks`` weeks after it.
+
+    Returns a dict with the job's ``id`` and either its formatted ``days``
+    (a list of lists, one per week, when ``group`` is set) or an ``error``.
+    Jobs with a ``cursor`` key also get the ``cursor`` for the next page.
+
+    """
+    today = today or date.today()
+    try:
+        if job.get('start_date'):
+            start = datetime.strptime(job['start_date'], '%Y-%m-%d').date()
+        else:
+            start = date(job.get('year', today.year), job.get('month', today.month),
+                         job.get('day', today.day))
+        dows = job.get('weekdays') or ['Tue', 'Thu']
+        if isinstance(dows, str):
+            dows = dows.split()
+        weeks = job.get('weeks', 14)
+        if not isinstance(weeks, int) or isinstance(weeks, bool) or weeks < 0:
+            raise ValueError('weeks must be a non-negative integer')
+        exclude = job.get('exclude')
+        if exclude:
+            exclude = load_exclusions(*([exclude] if isinstance(exclude, str) else exclude))
+        nth = job.get('nth')
+        if isinstance(nth, str):
+            nth = _parse_nth(nth)
+        rule = Recurrence(dows, job.get('every', 1), nth)
+        cursor = job.get('cursor')
+        if cursor is not None:
+            cursor = Cursor.from_dict(cursor)
+        results = iter_days(start.year, start.month, start.day, dows, weeks=weeks,
+                            exclude=exclude, every=rule.every, nth=rule.nth, cursor=cursor)
+        if 'cursor' in job:
+            results = list(results)
+            cursor = (cursor or Cursor(start)).advance(results)
+        if job.get('group'):
+            days = [[_format_day(day) for day in group] for group in _group_weeks(results)]
+        else:
+            days = [_format_day(day) for day in results]
+    except (OSError, TypeError, ValueError) as e:
+        return {'id': job.get('id'), 'error': str(e)}
+    if 'cursor' in job:
+        return {'id': job.get('id'), 'days': days, 'cursor': cursor.to_dict()}
+    return {'id': job.get('id'), 'days': days}
+
+
+def run_batch(jobs, today=None, workers=None, chunksize=16):
+    """Run many ``job`` dicts, yielding ``run_job`` results in input order.
+
+    Jobs without an ``id`` are tagged with their 1-based position. With
+    ``workers`` greater than 1 the jobs are spread across a process pool,
+    sent to each worker ``chunksize`` jobs at a time.
+
+    """
+    _check_chunksize(chunksize)
+    jobs = (job if 'id' in job else dict(job, id=n)
+            for n, job in enumerate(jobs, start=1))
+    today = today or date.today()
+    if not workers or workers <= 1:
+        for job in jobs:
+            yield run_job(job, today=today)
+        return
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(partial(run_job, today=today), jobs, chunksize=chunksize)
+
+
+async def arun_batch(jobs, today=None, executor=None, concurrency=4, chunksize=16):
+    """Run many ``job`` dicts off the event loop; return results in input order.
+
+    Jobs are sent to ``executor`` (the loop's default thread pool if None)
+    ``chunksize`` at a time, with at most ``concurrency`` chunks in flight.
+    Pass a ``ProcessPoolExecutor`` to use more than one CPU.
+
+    """
+    import asyncio
+
+    _check_chunksize(chunksize)
+    jobs = [job if 'id' in job else dict(job, id=n)
+            for n, job in enumerate(jobs, start=1)]
+    work = partial(_run_jobs, today=today or date.today())
+    loop = asyncio.get_running_loop()
+    limit = asyncio.Semaphore(concurrency)
+
+    async def run(chunk):
+        async with limit:
+            return await loop.run_in_executor(executor, work, chunk)
+
+    chunks = await asyncio.gather(*map(run, batched(jobs, chunksize)))
+    return [result for chunk in chunks for result in chunk]
+
+
+def _check_chunksize(chunksize):
+    if not isinstance(chunksize, int) or isinstance(chunksize, bool) or chunksize < 1:
+        raise ValueError('chunksize must be a positive integer, not {!r}'.format(chunksize))
 
-            found = False
-            for day in week:
-                if day < start_date:
-                    continue
-                dt = day.strftime('%c')
-                for dow in days:
-                    if dt.startswith(dow) and dt not in results:
-                        results.append(dt)
-                        found = True
-            if found:
-                num_weeks += 1
-    return results
+
+def _run_jobs(jobs, today):
+    """Run a chunk of jobs in one executor call."""
+    return [run_job(job, today=today) for job in jobs]
+
+
+def _batch_main(stream, today=None, workers=None, chunksize=16):
+    """Read JSON Lines job specs from ``stream``, write JSON Lines."""
+    import json
+
+    entries = _read_jobs(stream)
+
+    jobs = [job for job, error in entries if error is None]
+    results = run_batch(jobs, today=today, workers=workers, chunksize=chunksize)
+    _write_lines(json.dumps(next(results) if error is None else error)
+                 for job, error in entries)
+
+
+def _read_jobs(stream):
+    """Parse JSON Lines job specs into ``(job, error)`` pairs, one per line."""
+    import json
+
+    entries = []
+    for n, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            job = json.loads(line)
+            if not isinstance(job, dict):
+                raise ValueError('job must be a JSON object')
+        except ValueError as e:
+            entries.append((None, {'id': n, 'error': str(e)}))
+        else:
+            entries.append((dict({'id': n}, **job), None))
+    return entries
+
+
+class _ServeState:
+    """Response cache, in-flight requests and metrics shared by ``serve`` threads."""
+
+    def __init__(self, cache_size=1024, max_weeks=10000, samples=10000):
+        self.cache = _ScheduleCache(cache_size)
+        self.max_weeks = max_weeks
+        self._inflight = {}
+        self._lock = threading.Lock()
+        self._latencies = deque(maxlen=samples)
+        self.requests = self.errors = self.coalesced = 0
+
+    def respond(self, query, today=None):
+        """Return ``(status, body)`` for a parsed ``/days`` query string."""
+        import json
+
+        try:
+            job = _serve_job(query, today or date.today(), self.max_weeks)
+        except ValueError as e:
+            return 400, json.dumps({'error': str(e)}).encode()
+        key = (job['start_date'], tuple(job['weekdays']), job['weeks'], job['group'],
+               job['every'], job['nth'])
+        return self.cache.get(key, lambda: self._coalesce(key, job))
+
+    def _coalesce(self, key, job):
+        """Compute ``job`` once, however many threads ask for ``key`` meanwhile."""
+        import json
+        from concurrent.futures import Future
+
+        with self._lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+            else:
+                self.coalesced += 1
+        if not leader:
+            return future.result()
+        try:
+            result = run_job(job)
+            del result['id']
+            response = (400 if 'error' in result else 200), json.dumps(result).encode()
+            future.set_result(response)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                del self._inflight[key]
+        return response
+
+    def record(self, seconds, status):
+        with self._lock:
+            self.requests += 1
+            if status >= 400:
+                self.errors += 1
+            self._latencies.append(seconds)
+
+    def metrics(self):
+        """Request counts, latency percentiles (ms) and response cache counters."""
+        with self._lock:
+            latencies = sorted(self._latencies)
+            requests, errors, coalesced = self.requests, self.errors, self.coalesced
+        info = self.cache.info()
+        lookups = info.hits + info.misses
+        return {
+            'requests': requests,
+            'errors': errors,
+            'coalesced': coalesced,
+            'latency_ms': {name: _percentile(latencies, p)
+                           for name, p in (('p50', 0.5), ('p90', 0.9), ('p99', 0.99), ('max', 1))},
+            'cache': dict(info._asdict(), hit_rate=info.hits / lookups if lookups else None),
+        }
+
+
+def _percentile(seconds, p):
+    """Nearest-rank percentile of sorted durations, in milliseconds."""
+    if not seconds:
+        return None
+    return round(seconds[min(len(seconds) - 1, int(p * len(seconds)))] * 1000, 3)
+
+
+def _serve_job(query, today, max_weeks):
+    """Turn a ``parse_qs`` dict into a normalized ``run_job`` dict."""
+    weeks = query.get('weeks', ['14'])[-1]
+    if not weeks.isdigit() or int(weeks) > max_weeks:
+        raise ValueError('weeks must be an integer from 0 to {}'.format(max_weeks))
+    every = query.get('every', ['1'])[-1]
+    if not every.isdigit():
+        raise ValueError('every must be a positive integer')
+    weekdays = [name for value in query.get('weekdays', ()) for name in value.replace(',', ' ').split()]
+    return {
+        'start_date': query.get('start_date', [today.isoformat()])[-1],
+        'weekdays': weekdays or ['Tue', 'Thu'],
+        'weeks': int(weeks),
+        'group': query.get('group', ['0'])[-1].lower() in ('1', 'true', 'yes'),
+        'every': int(every),
+        'nth': query.get('nth', [''])[-1],
+    }
+
+
+def _make_server(host='127.0.0.1', port=8000, cache_size=1024, max_weeks=10000):
+    """Return a ``ThreadingHTTPServer`` for ``serve``, with its state as ``.state``."""
+    import json
+    import time
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    from urllib.parse import parse_qs, urlsplit
+
+    state = _ServeState(cache_size, max_weeks)
+
+    class Handler(BaseHTTPRequestHandler):
+        # HTTP/1.1 with a Content-Length on every response keeps connections
+        # alive; without Nagle's algorithm, the header and body writes of one
+        # response don't wait on the client's delayed ACK.
+        protocol_version = 'HTTP/1.1'
+        disable_nagle_algorithm = True
+        timeout = 60
+
+        def do_GET(self):
+            start = time.perf_counter()
+            url = urlsplit(self.path)
+            if url.path == '/days':
+                status, body = state.respond(parse_qs(url.query))
+            elif url.path == '/metrics':
+                status, body = 200, json.dumps(state.metrics()).encode()
+            else:
+                status, body = 404, b'{"error": "not found"}'
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            state.record(time.perf_counter() - start, status)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.state = state
+    return server
+
+
+def serve(host='127.0.0.1', port=8000, cache_size=1024, max_weeks=10000):
+    """Serve schedules over HTTP until interrupted.
+
+    ``GET /days?start_date=2018-01-22&weekdays=Tue,Thu&weeks=14&group=1``
+    returns ``{"days": [...]}`` as ``run_job`` does, and ``GET /metrics``
+    reports request latency percentiles and response cache hit rates.
+    Concurrent identical requests share one computation.
+
+    """
+    with _make_server(host, port, cache_size, max_weeks) as server:
+        print('Serving on http://{}:{}'.format(*server.server_address[:2]), file=sys.stderr)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+def _serve_cli(argv):
+    """Parse ``days serve`` options and run the server."""
+    import argparse
+
+    parser = argparse.ArgumentParser(prog='days serve',
+                                     description='Serve schedules as JSON over HTTP.')
+    parser.add_argument('--host', default='127.0.0.1', help='Address to bind (default: 127.0.0.1)')
+    parser.add_argument('-p', '--port', type=int, default=8000, help='Port to listen on (default: 8000)')
+    parser.add_argument('--cache-size', type=int, default=1024,
+                        help='Responses kept in memory (default: 1024)')
+    parser.add_argument('--max-weeks', type=int, default=10000,
+                        help='Largest weeks value accepted per request (default: 10000)')
+    args = parser.parse_args(argv)
+    if args.cache_size < 0:
+        parser.error('--cache-size must not be negative')
+    serve(args.host, args.port, args.cache_size, args.max_weeks)
 
 
 def main(args):
+    locale_name = getattr(args, 'locale', None)
+    if locale_name is None:
+        return _main(args)
+
+    import locale
+
+    saved = locale.setlocale(locale.LC_TIME)
+    locale.setlocale(locale.LC_TIME, locale_name)
+    try:
+        return _main(args)
+    finally:
+        locale.setlocale(locale.LC_TIME, saved)
+
+
+def _main(args):
     dows = args.dows or ['Tue', 'Thu']
-    results = get_days(args.year, args.month, args.day, dows, weeks=args.weeks)
-    if args.chunk:
-        results = _grouper(results, len(dows))
-        for group in results:
-            for day in group:
-                if day is not None:
-                    print(day[:10])
-            print("-" * 10)
+    date_format = getattr(args, 'date_format', None)
+    if date_format is None and getattr(args, 'locale', None) is not None:
+        date_format = '%a %b %d'
+    format_day = _formatter(date_format)
+    exclude = getattr(args, 'exclude', None)
+    if exclude:
+        exclude = load_exclusions(*exclude)
+    every = getattr(args, 'every', 1)
+    nth = getattr(args, 'nth', None)
+    if isinstance(nth, str):
+        nth = _parse_nth(nth)
+    patterns = getattr(args, 'patterns', None)
+    if patterns:
+        return _main_patterns(args, patterns, format_day, exclude, every, nth)
+    between = getattr(args, 'between', None)
+    if between is not None:
+        between = tuple(map(date.fromordinal, _exclusion_interval(between)))
+    operations = getattr(args, 'operations', None)
+    if getattr(args, 'count', False):
+        profile = None
+        if getattr(args, 'profile', False) or _profile_hooks:
+            profile = Profile('main')
+        start = perf_counter()
+        schedule = _cli_schedule(args, dows, exclude, every, nth, operations)
+        count = schedule.count_between(*between) if between else len(schedule)
+        if profile is not None:
+            profile.counters['dates_counted'] = count
+            profile.stages['generate'] = perf_counter() - start
+        return _emit([str(count)], '\n', profile, args)
+    if operations or between:
+        schedule = _cli_schedule(args, dows, exclude, every, nth, operations)
+        if between:
+            schedule = schedule.slice_between(*between)
+        results = iter(schedule)
+    elif getattr(args, 'cache', False):
+        results = _iter_disk_cached(_DiskCache(), args.year, args.month, args.day,
+                                    dows, args.weeks, exclude, every, nth)
     else:
-        for day in results:
-            print(day[:10])
+        results = iter_days(args.year, args.month, args.day, dows, weeks=args.weeks,
+                            exclude=exclude, every=every, nth=nth)
+    profile = None
+    if getattr(args, 'profile', False) or _profile_hooks:
+        profile = Profile('main')
+        results = profile._timed('generate', _tally(results, profile.counters, date.toordinal))
 
+    output_format = getattr(args, 'format', 'text')
+    newline = '\n'
+    if output_format != 'text':
+        serialize, newline = _SERIALIZERS[output_format]
+        lines = serialize(_records(results))
+    elif args.chunk:
+        groups = _group_weeks(results)
+        if profile is not None:
+            groups = profile._timed('group', groups)
+        lines = _grouped_lines(groups, format_day)
+    else:
+        lines = map(format_day, results)
+
+    _emit(lines, newline, profile, args)
+
+
+def _emit(lines, newline, profile, args):
+    """Write ``lines`` to stdout, timing them into ``profile`` if there is one."""
+    if profile is None:
+        _write_lines(lines, newline=newline)
+        return
+    lines = profile._timed('format', lines)
+    start = perf_counter()
+    written = _write_lines(lines, newline=newline)
+    profile.counters['lines_written'] = lines.count
+    profile.counters['bytes_written'] = written
+    profile._finish('output', perf_counter() - start)
+    if getattr(args, 'profile', False):
+        import json
+
+        print(json.dumps(profile.as_dict()), file=sys.stderr)
+
+
+def _cli_schedule(args, dows, exclude, every, nth, operations):
+    """Build the ``Schedule`` for the arguments, then apply ``--union`` and friends in order."""
+    schedule = Schedule.from_days(args.year, args.month, args.day, dows, args.weeks,
+                                  exclude, every, nth)
+    # Weekday-only specs cover the main schedule from its first date to its last.
+    bounds = None
+    if schedule:
+        bounds = date.fromordinal(schedule._starts[0]), date.fromordinal(schedule._ends[-1])
+    for operation, spec in operations or ():
+        days, span = _parse_schedule_spec(spec)
+        if span is None:
+            other = Schedule(days, *bounds) if bounds else Schedule()
+        else:
+            other = Schedule(days or _DAY_ABBRS, *span)
+        if operation == 'union':
+            schedule = schedule | other
+        elif operation == 'intersect':
+            schedule = schedule & other
+        else:
+            schedule = schedule - other
+    return schedule
+
+
+def _main_patterns(args, patterns, format_day, exclude, every, nth):
+    """Print the schedule of each ``--pattern``, one section after another."""
+    patterns = [_parse_pattern(pattern) for pattern in patterns]
+    profile = None
+    if getattr(args, 'profile', False) or _profile_hooks:
+        profile = Profile('main')
+    start = perf_counter()
+    results = get_days_multi(args.year, args.month, args.day, patterns, args.weeks,
+                             exclude, every, nth)
+    if profile is not None:
+        profile.counters['dates_emitted'] = sum(map(len, results))
+        # Not _finish: that would call the hooks before the output is timed.
+        profile.stages['generate'] = perf_counter() - start
+
+    labels = [' '.join(pattern) for pattern in patterns]
+    output_format = getattr(args, 'format', 'text')
+    newline = '\n'
+    if output_format != 'text':
+        serialize, newline = _SERIALIZERS[output_format]
+        records = ({'pattern': label, **record}
+                   for label, result in zip(labels, results)
+                   for record in _records(iter(result.dates)))
+        if output_format == 'csv':
+            lines = _csv_lines(records, ('pattern',) + _RECORD_FIELDS)
+        else:
+            lines = serialize(records)
+    else:
+        lines = _pattern_lines(labels, results, format_day, args.chunk)
+
+    _emit(lines, newline, profile, args)
+
+
+def _pattern_lines(labels, results, format_day, chunk=False):
+    """Lines for ``--pattern`` text output: a ``[label]`` header, then the dates.
+
+    Patterns share most of their dates, so each date is formatted only once.
+    """
+    strings = {}
+
+    def format_ordinal(ordinal):
+        text = strings.get(ordinal)
+        if text is None:
+            text = strings[ordinal] = format_day(date.fromordinal(ordinal))
+        return text
+
+    for n, (label, result) in enumerate(zip(labels, results)):
+        if n:
+            yield ''
+        yield '[{}]'.format(label)
+        if chunk:
+            for group in _group_weeks(iter(result.dates)):
+                yield from (format_ordinal(day.toordinal()) for day in group)
+                yield "-" * 10
+        else:
+            yield from map(format_ordinal, result.dates._ordinals)
 
-def cli():
-    now = datetime.now()
 
-    parser = argparse.ArgumentParser("Print a list of days over a given number of weeks.")
+def _records(dates):
+    """Describe each date as a dict for the machine-readable output formats.
+
+    ``index`` counts dates from 1, ``week`` is the ISO 8601 week number and
+    ``group`` counts the Monday-to-Sunday weeks of the schedule from 1.
+    """
+    index = 0
+    for group, days in enumerate(_group_weeks(dates), start=1):
+        for day in days:
+            index += 1
+            yield {
+                'index': index,
+                'date': day.isoformat(),
+                'weekday': _DAY_ABBRS[day.weekday()],
+                'week': day.isocalendar().week,
+                'group': group,
+            }
+
+
+_RECORD_FIELDS = ('index', 'date', 'weekday', 'week', 'group')
+
+
+def _jsonl_lines(records):
+    import json
+
+    return map(json.dumps, records)
+
+
+def _json_lines(records):
+    """Stream a JSON array, one record per line, without building it in memory."""
+    import json
+
+    yield '['
+    previous = None
+    for record in records:
+        if previous is not None:
+            yield '  ' + previous + ','
+        previous = json.dumps(record)
+    if previous is not None:
+        yield '  ' + previous
+    yield ']'
+
+
+def _csv_lines(records, fields=_RECORD_FIELDS):
+    # Every field is a number, an ISO date, a weekday or a list of weekday
+    # names, so none need quoting.
+    yield ','.join(fields)
+    for record in records:
+        yield ','.join(str(record[field]) for field in fields)
+
+
+def _ics_lines(records):
+    """Stream an iCalendar (RFC 5545) document with an all-day event per date."""
+    stamp = datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+    yield 'BEGIN:VCALENDAR'
+    yield 'VERSION:2.0'
+    yield 'PRODID:-//days//days//EN'
+    yield 'CALSCALE:GREGORIAN'
+    for record in records:
+        day = date.fromisoformat(record['date'])
+        yield 'BEGIN:VEVENT'
+        yield 'UID:{:%Y%m%d}-{}@days'.format(day, record['index'])
+        yield 'DTSTAMP:' + stamp
+        yield 'DTSTART;VALUE=DATE:{:%Y%m%d}'.format(day)
+        yield 'DTEND;VALUE=DATE:{:%Y%m%d}'.format(day + timedelta(days=1))
+        yield 'SUMMARY:Week {} ({})'.format(record['group'], record['weekday'])
+        yield 'END:VEVENT'
+    yield 'END:VCALENDAR'
+
+
+# Output format name -> (serializer, line terminator).
+_SERIALIZERS = {
+    'json': (_json_lines, '\n'),
+    'jsonl': (_jsonl_lines, '\n'),
+    'csv': (_csv_lines, '\r\n'),
+    'ics': (_ics_lines, '\r\n'),
+}
+
+
+def _grouped_lines(groups, format_day):
+    for group in groups:
+        yield from map(format_day, group)
+        yield "-" * 10
+
+
+def _write_lines(lines, stream=None, batch_size=1024, newline='\n'):
+    """Write ``lines`` to ``stream`` (default: stdout) in large chunks.
+
+    Lines are joined ``batch_size`` at a time and, when the stream has a
+    binary ``buffer``, encoded and written to it directly, so a long
+    listing costs a few large writes instead of one write per line. Each
+    line ends with ``newline``. Returns the number of bytes (or characters, for text-only streams)
+    written.
+
+    """
+    stream = stream or sys.stdout
+    buffer = getattr(stream, 'buffer', None)
+    if buffer is not None:
+        # Anything already printed must come out before our first chunk.
+        stream.flush()
+        encoding = stream.encoding or 'utf-8'
+    written = 0
+    for chunk in batched(lines, batch_size):
+        text = newline.join(chunk) + newline
+        if buffer is not None:
+            data = text.encode(encoding)
+            buffer.write(data)
+            written += len(data)
+        else:
+            stream.write(text)
+            written += len(text)
+    if buffer is not None:
+        buffer.flush()
+    else:
+        stream.flush()
+    return written
+
+
+def _cache_default():
+    return os.environ.get('DAYS_CACHE', '') not in ('', '0')
+
+
+# Options that _parse_fast understands, mapped to their destinations.
+_FAST_INTS = {'-y': 'year', '--year': 'year', '-m': 'month', '--month': 'month',
+              '-d': 'day', '--dom': 'day', '-n': 'weeks', '--num-weeks': 'weeks',
+              '--every': 'every'}
+_FAST_WEEKDAYS = ('-w', '--weekdays', '--on')
+_FORMATS = ('text', 'json', 'jsonl', 'csv', 'ics')
+
+
+def _parse_nth(value):
+    """Parse a comma-separated ``--nth`` value such as '1,3,-1'."""
+    if not value.strip():
+        return ()
+    try:
+        return tuple(int(part) for part in value.split(','))
+    except ValueError:
+        raise ValueError('nth must be comma-separated integers, e.g. 1,3 or -1') from None
+
+
+def _parse_pattern(value):
+    """Split a ``--pattern`` value such as 'Mon Wed Fri' or 'Mon,Wed,Fri' into names."""
+    return value.replace(',', ' ').split()
+
+
+def _parse_schedule_spec(spec):
+    """Parse a ``--union``, ``--intersect`` or ``--subtract`` value.
+
+    The value is weekdays ('Mon,Wed'), a date or date range
+    ('2025-03-10..2025-03-14'), or both joined by '@'. Returns a
+    ``(weekdays, (start, end))`` pair with None for a missing part.
+    """
+    days, sep, span = spec.strip().partition('@')
+    if not sep and days[:1].isdigit():
+        days, span = '', days
+    days = _parse_pattern(days) or None
+    if days is not None:
+        _weekday_set(days)
+    if span:
+        span = tuple(map(date.fromordinal, _exclusion_interval(span)))
+    elif sep or days is None:
+        raise ValueError('expected WEEKDAYS, START..END or WEEKDAYS@START..END: {!r}'.format(spec))
+    return days, span or None
+
+
+def _parse_iso_date(value):
+    """Parse a strict 'YYYY-MM-DD' string, returning None for anything else."""
+    if len(value) != 10 or value[4] != '-' or value[7] != '-':
+        return None
+    parts = value[:4], value[5:7], value[8:]
+    if not all(part.isdigit() and part.isascii() for part in parts):
+        return None
+    try:
+        return date(*map(int, parts))
+    except ValueError:
+        return None
+
+
+def _parse_fast(argv, now):
+    """Parse the common options without building an argparse parser.
+
+    Returns a namespace with the same attributes ``_build_parser`` produces,
+    or None when ``argv`` uses anything else (including help and anything
+    invalid), so that argparse can handle it and report errors.
+
+    """
+    args = SimpleNamespace(
+        start_date=None, year=now.year, month=now.month, day=now.day, weeks=14,
+        dows=None, patterns=None, every=1, nth=None, operations=None, between=None,
+        count=False, chunk=False, exclude=None, format='text',
+        date_format=None, locale=None, profile=False, batch=None,
+        workers=1, chunksize=16, cache=_cache_default(), clear_cache=False)
+    start = None
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg in _FAST_INTS:
+            try:
+                setattr(args, _FAST_INTS[arg], int(argv[i + 1]))
+            except (IndexError, ValueError):
+                return None
+            i += 2
+        elif arg in _FAST_WEEKDAYS:
+            j = i + 1
+            while j < len(argv) and not argv[j].startswith('-'):
+                j += 1
+            if j == i + 1:
+                return None
+            args.dows = argv[i + 1:j]
+            i = j
+        elif arg in ('-g', '--group'):
+            args.chunk = True
+            i += 1
+        elif arg == '--nth' and i + 1 < len(argv):
+            # argparse only takes a value starting with '-' if it is a single
+            # negative number; '-1,-2' must be written --nth=-1,-2.
+            if argv[i + 1].startswith('-') and not argv[i + 1][1:].isdecimal():
+                return None
+            args.nth = argv[i + 1]
+            i += 2
+        elif arg in ('-p', '--pattern') and i + 1 < len(argv):
+            args.patterns = (args.patterns or []) + [argv[i + 1]]
+            i += 2
+        elif arg in ('--union', '--intersect', '--subtract') and i + 1 < len(argv):
+            args.operations = (args.operations or []) + [(arg[2:], argv[i + 1])]
+            i += 2
+        elif arg == '--between' and i + 1 < len(argv):
+            args.between = argv[i + 1]
+            i += 2
+        elif arg == '--count':
+            args.count = True
+            i += 1
+        elif arg == '--exclude' and i + 1 < len(argv):
+            args.exclude = (args.exclude or []) + [argv[i + 1]]
+            i += 2
+        elif arg == '--format' and i + 1 < len(argv) and argv[i + 1] in _FORMATS:
+            args.format = argv[i + 1]
+            i += 2
+        elif arg == '--profile':
+            args.profile = True
+            i += 1
+        elif arg in ('--cache', '--no-cache'):
+            args.cache = arg == '--cache'
+            i += 1
+        elif arg == '--start-date' and i + 1 < len(argv):
+            start = _parse_iso_date(argv[i + 1])
+            if start is None:
+                return None
+            i += 2
+        else:
+            return None
+
+    # --start-date overrides -y, -m and -d wherever it appears.
+    if start is not None:
+        args.year, args.month, args.day = start.year, start.month, start.day
+    return args
+
+
+def _build_parser(now):
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        "Print a list of days over a given number of weeks.",
+        epilog="Run 'days serve --help' to serve schedules over HTTP instead.")
     parser.add_argument(
         '--start-date',
         dest='start_date',
@@ -117,6 +2182,72 @@ def cli():
         nargs='+',
         help='Weekdays to print (e.g., Tue Thu) (default: Tue Thu)'
     )
+    parser.add_argument(
+        '-p',
+        '--pattern',
+        dest='patterns',
+        action='append',
+        default=None,
+        metavar='WEEKDAYS',
+        help="Print a schedule for each of several weekday sets, e.g. --pattern 'Mon Wed Fri' "
+             "--pattern Tue,Thu; may be repeated"
+    )
+    parser.add_argument(
+        '--every',
+        dest='every',
+        type=int,
+        default=1,
+        metavar='N',
+        help='Only print every Nth week, counting from the start date (default: 1)'
+    )
+    parser.add_argument(
+        '--nth',
+        dest='nth',
+        default=None,
+        metavar='N[,N...]',
+        help='Only print these occurrences of each weekday in its month, e.g. 1,3 or -1 for the last; '
+             'write several negative values as --nth=-1,-2'
+    )
+    parser.add_argument(
+        '--union',
+        dest='operations',
+        action='append',
+        default=None,
+        type=lambda spec: ('union', spec),
+        metavar='SPEC',
+        help="Add the dates of SPEC: weekdays (Sat,Sun), a range (2025-03-10..2025-03-14) "
+             "or both joined by '@' (Mon@2025-03-01..2025-03-31)"
+    )
+    parser.add_argument(
+        '--intersect',
+        dest='operations',
+        action='append',
+        type=lambda spec: ('intersect', spec),
+        metavar='SPEC',
+        help='Keep only the dates also in SPEC'
+    )
+    parser.add_argument(
+        '--subtract',
+        dest='operations',
+        action='append',
+        type=lambda spec: ('subtract', spec),
+        metavar='SPEC',
+        help='Remove the dates in SPEC; --union, --intersect and --subtract apply in order'
+    )
+    parser.add_argument(
+        '--between',
+        dest='between',
+        default=None,
+        metavar='START..END',
+        help='Only print dates from START to END, inclusive (YYYY-MM-DD..YYYY-MM-DD)'
+    )
+    parser.add_argument(
+        '--count',
+        dest='count',
+        action='store_true',
+        default=False,
+        help='Print the number of dates instead of the dates'
+    )
     parser.add_argument(
         '-g',
         '--group',
@@ -125,7 +2256,177 @@ def cli():
         default=False,
         help="Group output by weeks"
     )
-    args = parser.parse_args()
+    parser.add_argument(
+        '-x',
+        '--exclude',
+        dest='exclude',
+        action='append',
+        default=None,
+        metavar='FILE',
+        help='Skip the dates and YYYY-MM-DD..YYYY-MM-DD ranges listed in FILE; may be repeated'
+    )
+    parser.add_argument(
+        '-f',
+        '--format',
+        dest='format',
+        choices=_FORMATS,
+        default='text',
+        help='Output format; json, jsonl, csv and ics give ISO dates, weekday, ISO week and group number (default: text)'
+    )
+    parser.add_argument(
+        '--date-format',
+        dest='date_format',
+        type=str,
+        default=None,
+        metavar='FORMAT',
+        help="strftime format for each date (default: 'Tue Jan 23' style, in English)"
+    )
+    parser.add_argument(
+        '--locale',
+        dest='locale',
+        type=str,
+        default=None,
+        help="Locale for weekday and month names in the output, e.g. de_DE.UTF-8 (default format: '%%a %%b %%d')"
+    )
+    parser.add_argument(
+        '--profile',
+        dest='profile',
+        action='store_true',
+        default=False,
+        help='Print per-stage timings and counters as JSON on stderr'
+    )
+    parser.add_argument(
+        '--batch',
+        dest='batch',
+        type=str,
+        default=None,
+        metavar='FILE',
+        help='Read JSON Lines job specs from FILE (- for stdin) and write one JSON result per job'
+    )
+    parser.add_argument(
+        '-j',
+        '--jobs',
+        dest='workers',
+        type=int,
+        default=1,
+        help='Number of worker processes for --batch (default: 1)'
+    )
+    parser.add_argument(
+        '--chunksize',
+        dest='chunksize',
+        type=int,
+        default=16,
+        help='Jobs sent to a worker at a time with --jobs (default: 16)'
+    )
+    parser.add_argument(
+        '--cache',
+        dest='cache',
+        action=argparse.BooleanOptionalAction,
+        default=_cache_default(),
+        help='Reuse results saved on disk by earlier runs (default: on if $DAYS_CACHE is set)'
+    )
+    parser.add_argument(
+        '--clear-cache',
+        dest='clear_cache',
+        action='store_true',
+        default=False,
+        help='Remove all saved results and exit'
+    )
+    return parser
+
+
+def cli():
+    if sys.argv[1:2] == ['serve']:
+        return _serve_cli(sys.argv[2:])
+
+    now = datetime.now()
+
+    parser = None
+    args = _parse_fast(sys.argv[1:], now)
+    if args is None:
+        parser = _build_parser(now)
+        args = parser.parse_args()
+
+    if args.clear_cache:
+        _DiskCache().clear()
+        return
+
+    if args.weeks < 0:
+        (parser or _build_parser(now)).error('--num-weeks must not be negative')
+
+    if args.chunksize < 1:
+        (parser or _build_parser(now)).error('--chunksize must be at least 1')
+
+    if args.dows:
+        try:
+            _weekday_set(args.dows)
+        except ValueError as e:
+            (parser or _build_parser(now)).error(str(e))
+
+    if args.patterns:
+        if args.dows:
+            (parser or _build_parser(now)).error('--pattern cannot be combined with --weekdays')
+        if args.format == 'ics':
+            (parser or _build_parser(now)).error('--pattern does not support --format ics')
+        for pattern in args.patterns:
+            try:
+                if not _weekday_set(_parse_pattern(pattern)):
+                    raise ValueError('no weekdays given')
+            except ValueError as e:
+                (parser or _build_parser(now)).error('--pattern: {}'.format(e))
+
+    if args.operations or args.between or args.count:
+        if args.patterns:
+            (parser or _build_parser(now)).error(
+                '--pattern cannot be combined with --union, --intersect, --subtract, '
+                '--between or --count')
+        for operation, spec in args.operations or ():
+            try:
+                _parse_schedule_spec(spec)
+            except ValueError as e:
+                (parser or _build_parser(now)).error('--{}: {}'.format(operation, e))
+        if args.between:
+            try:
+                _exclusion_interval(args.between)
+            except ValueError as e:
+                (parser or _build_parser(now)).error('--between: {}'.format(e))
+
+    if args.every != 1 or args.nth:
+        try:
+            Recurrence(args.dows or ['Tue', 'Thu'], args.every,
+                       _parse_nth(args.nth) if args.nth else None)
+        except ValueError as e:
+            (parser or _build_parser(now)).error(str(e))
+
+    if args.exclude:
+        try:
+            load_exclusions(*args.exclude)
+        except (OSError, ValueError) as e:
+            (parser or _build_parser(now)).error('--exclude: {}'.format(e))
+
+    if args.locale:
+        import locale
+
+        saved = locale.setlocale(locale.LC_TIME)
+        try:
+            locale.setlocale(locale.LC_TIME, args.locale)
+        except locale.Error:
+            parser.error('unsupported locale: {}'.format(args.locale))
+        finally:
+            locale.setlocale(locale.LC_TIME, saved)
+
+    if args.batch:
+        try:
+            stream = sys.stdin if args.batch == '-' else open(args.batch)
+        except OSError as e:
+            (parser or _build_parser(now)).error('--batch: {}'.format(e))
+        try:
+            _run(partial(_batch_main, stream, today=now.date(), workers=args.workers,
+                         chunksize=args.chunksize))
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+        return
     
     # Handle --start-date if provided
     if args.start_date:
@@ -137,7 +2438,19 @@ def cli():
         except ValueError:
             parser.error('--start-date must be in YYYY-MM-DD format')
     
-    main(args)
+    _run(main, args)
+
+
+def _run(func, *args):
+    """Call ``func``, exiting quietly if stdout is closed early, e.g. by ``head``."""
+    try:
+        func(*args)
+    except BrokenPipeError:
+        # Python flushes stdout again at exit; send that to devnull so it
+        # cannot fail a second time.
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        sys.exit(1)
 
 
 if __name__ == "__main__":
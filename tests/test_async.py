@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+
+import asyncio
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from days import aiter_days, arun_batch, get_days, iter_days, run_batch
+
+ALL_DAYS = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
+
+
+class _Ticker:
+    """Measure the largest gap between wake-ups of a 1ms periodic task."""
+
+    def __init__(self):
+        self.ticks = 0
+        self.max_gap = 0.0
+
+    async def run(self):
+        last = time.perf_counter()
+        while True:
+            await asyncio.sleep(0.001)
+            now = time.perf_counter()
+            self.max_gap = max(self.max_gap, now - last)
+            self.ticks += 1
+            last = now
+
+
+class TestAiterDays(unittest.IsolatedAsyncioTestCase):
+    """Test the cooperative async iterator."""
+
+    async def test_matches_iter_days(self):
+        """Test that the async iterator yields the same dates."""
+        results = [d async for d in aiter_days(2018, 1, 22, ['Tue', 'Thu'], weeks=30,
+                                                batch_size=7)]
+        self.assertEqual(results, list(iter_days(2018, 1, 22, ['Tue', 'Thu'], weeks=30)))
+
+    async def test_exclude_and_until(self):
+        """Test that keyword arguments are passed through."""
+        results = [d async for d in aiter_days(2018, 1, 22, ['Tue'], weeks=None,
+                                                until=date(2018, 2, 28),
+                                                exclude=['2018-02-06'])]
+        self.assertEqual(results, [date(2018, 1, 23), date(2018, 1, 30), date(2018, 2, 13),
+                                   date(2018, 2, 20), date(2018, 2, 27)])
+
+    async def test_cursor(self):
+        """Test resuming from a get_days cursor."""
+        cursor = get_days(2018, 1, 22, ['Tue', 'Thu'], weeks=3).cursor
+        results = [d async for d in aiter_days(2018, 1, 22, ['Tue', 'Thu'], weeks=2,
+                                                cursor=cursor)]
+        self.assertEqual(results, list(iter_days(2018, 1, 22, ['Tue', 'Thu'], weeks=5))[6:])
+
+    async def test_event_loop_stays_responsive(self):
+        """Test that other tasks keep running while a long schedule is generated."""
+        ticker = _Ticker()
+        task = asyncio.create_task(ticker.run())
+        await asyncio.sleep(0.01)
+        start = time.perf_counter()
+        count = 0
+        async for _ in aiter_days(1900, 1, 1, ALL_DAYS, weeks=50_000):
+            count += 1
+        elapsed = time.perf_counter() - start
+        task.cancel()
+
+        self.assertEqual(count, 350_000)
+        # Generating 1024 dates takes well under a millisecond, so the ticker
+        # should never wait anywhere near as long as the whole run.
+        self.assertGreater(ticker.ticks, 0)
+        self.assertLess(ticker.max_gap, max(0.05, elapsed / 4))
+
+
+class TestArunBatch(unittest.IsolatedAsyncioTestCase):
+    """Test the async bulk helper."""
+
+    JOBS = [
+        {'id': 'a', 'start_date': '2018-01-22', 'weekdays': ['Tue', 'Thu'], 'weeks': 2},
+        {'start_date': '2018-01-22', 'weekdays': 'Mon', 'weeks': 1},
+        {'weeks': 'x'},
+    ] * 5
+
+    async def test_matches_run_batch(self):
+        """Test results, ids and order against the synchronous batch."""
+        today = date(2018, 1, 22)
+        results = await arun_batch(self.JOBS, today=today, chunksize=2)
+        self.assertEqual(results, list(run_batch(self.JOBS, today=today)))
+
+    async def test_bad_chunksize(self):
+        """Test that chunksize must be a positive integer."""
+        with self.assertRaises(ValueError):
+            await arun_batch(self.JOBS, chunksize=0)
+
+    async def test_bounded_concurrency(self):
+        """Test that no more than ``concurrency`` chunks run at once."""
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            running = peak = 0
+            loop = asyncio.get_running_loop()
+            original = loop.run_in_executor
+
+            async def counting(executor, func, *args):
+                nonlocal running, peak
+                running += 1
+                peak = max(peak, running)
+                try:
+                    return await original(executor, func, *args)
+                finally:
+                    running -= 1
+
+            loop.run_in_executor = counting
+            try:
+                results = await arun_batch(self.JOBS, executor=executor, concurrency=2,
+                                           chunksize=1)
+            finally:
+                del loop.run_in_executor
+        self.assertEqual(len(results), len(self.JOBS))
+        self.assertEqual(peak, 2)
+
+    async def test_event_loop_stays_responsive(self):
+        """Test that the loop keeps running while big jobs are computed."""
+        ticker = _Ticker()
+        task = asyncio.create_task(ticker.run())
+        jobs = [{'start_date': '1900-01-01', 'weekdays': ALL_DAYS, 'weeks': 2000}] * 8
+        results = await arun_batch(jobs, concurrency=2, chunksize=1)
+        task.cancel()
+        self.assertEqual([len(result['days']) for result in results], [14_000] * 8)
+        self.assertGreater(ticker.ticks, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,165 @@
+#!/usr/bin/env python
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from datetime import date
+from io import StringIO
+from unittest.mock import patch
+from days import cli, run_batch, run_job
+
+
+class TestRunJob(unittest.TestCase):
+    """Test computing a single job spec."""
+
+    def test_run_job_start_date(self):
+        """Test a job with start_date, weekdays and weeks."""
+        result = run_job({'id': 'a', 'start_date': '2018-01-22',
+                          'weekdays': ['Tue', 'Thu'], 'weeks': 2})
+        self.assertEqual(result, {
+            'id': 'a',
+            'days': ['Tue Jan 23', 'Thu Jan 25', 'Tue Jan 30', 'Thu Feb  1'],
+        })
+
+    def test_run_job_year_month_day(self):
+        """Test a job using year/month/day and a weekday string."""
+        result = run_job({'year': 2018, 'month': 1, 'day': 22,
+                          'weekdays': 'Mon', 'weeks': 2})
+        self.assertEqual(result['days'], ['Mon Jan 22', 'Mon Jan 29'])
+
+    def test_run_job_defaults(self):
+        """Test that missing fields use the CLI defaults."""
+        result = run_job({}, today=date(2018, 1, 22))
+        self.assertEqual(len(result['days']), 28)
+        self.assertEqual(result['days'][0], 'Tue Jan 23')
+
+    def test_run_job_group(self):
+        """Test that grouped jobs return one list per week."""
+        result = run_job({'start_date': '2018-01-22', 'weeks': 2, 'group': True})
+        self.assertEqual(result['days'], [['Tue Jan 23', 'Thu Jan 25'],
+                                          ['Tue Jan 30', 'Thu Feb  1']])
+
+    def test_run_job_invalid(self):
+        """Test that invalid specs report an error instead of raising."""
+        for job in ({'start_date': '2018-13-01'}, {'weeks': 'x'}, {'weeks': None},
+                    {'weeks': -1}):
+            with self.subTest(job=job):
+                result = run_job(dict(job, id=7))
+                self.assertEqual(result['id'], 7)
+                self.assertIn('error', result)
+
+
+class TestRunBatch(unittest.TestCase):
+    """Test running many jobs in one call."""
+
+    def test_run_batch_order_and_ids(self):
+        """Test that results come back in input order, tagged by position."""
+        jobs = [{'start_date': '2018-01-22', 'weeks': 1},
+                {'id': 'x', 'start_date': '2018-01-22', 'weekdays': 'Fri', 'weeks': 1}]
+        results = list(run_batch(jobs))
+        self.assertEqual([r['id'] for r in results], [1, 'x'])
+        self.assertEqual(results[1]['days'], ['Fri Jan 26'])
+
+    def test_run_batch_process_pool(self):
+        """Test that a process pool gives the same results in the same order."""
+        jobs = [{'start_date': '2018-01-{:02d}'.format(d), 'weeks': d}
+                for d in range(1, 29)]
+        jobs.append({'start_date': 'bad'})
+        serial = list(run_batch(jobs))
+        parallel = list(run_batch(jobs, workers=2, chunksize=5))
+        self.assertEqual(parallel, serial)
+        self.assertEqual([r['id'] for r in parallel], list(range(1, 30)))
+
+    def test_run_batch_bad_chunksize(self):
+        """Test that chunksize must be a positive integer."""
+        for chunksize in (0, -1, 1.5):
+            with self.subTest(chunksize=chunksize), self.assertRaises(ValueError):
+                list(run_batch([{}], workers=2, chunksize=chunksize))
+
+
+class TestBatchCLI(unittest.TestCase):
+    """Test the --batch command-line option."""
+
+    def setUp(self):
+        """Capture stdout for testing."""
+        self.held_output = StringIO()
+        self.original_stdout = sys.stdout
+        sys.stdout = self.held_output
+
+    def tearDown(self):
+        """Restore stdout."""
+        sys.stdout = self.original_stdout
+
+    def test_cli_batch_file(self):
+        """Test reading jobs from a file and writing JSON Lines."""
+        lines = [
+            '{"id": "a", "start_date": "2018-01-22", "weeks": 1}',
+            '',
+            'not json',
+            '{"start_date": "2018-01-22", "weekdays": "Mon", "weeks": 1}',
+        ]
+        with tempfile.NamedTemporaryFile('w', suffix='.jsonl', delete=False) as f:
+            f.write('\n'.join(lines) + '\n')
+        self.addCleanup(os.unlink, f.name)
+
+        with patch.object(sys, 'argv', ['days.py', '--batch', f.name]):
+            cli()
+
+        results = [json.loads(l) for l in self.held_output.getvalue().splitlines()]
+        self.assertEqual(results[0], {'id': 'a', 'days': ['Tue Jan 23', 'Thu Jan 25']})
+        self.assertEqual(results[1]['id'], 3)
+        self.assertIn('error', results[1])
+        self.assertEqual(results[2], {'id': 4, 'days': ['Mon Jan 22']})
+
+    def test_cli_batch_jobs(self):
+        """Test that --jobs keeps output in input order."""
+        stdin = StringIO(''.join(
+            '{{"id": {0}, "start_date": "2018-01-22", "weeks": {0}}}\n'.format(n)
+            for n in range(1, 11)) + 'oops\n')
+        with patch.object(sys, 'argv', ['days.py', '--batch', '-', '-j', '2', '--chunksize', '3']), \
+                patch.object(sys, 'stdin', stdin):
+            cli()
+
+        results = [json.loads(l) for l in self.held_output.getvalue().splitlines()]
+        self.assertEqual([r['id'] for r in results], list(range(1, 12)))
+        self.assertEqual([len(r['days']) for r in results[:10]], [2 * n for n in range(1, 11)])
+        self.assertIn('error', results[10])
+
+    def test_cli_batch_stdin(self):
+        """Test reading jobs from stdin with '-'."""
+        stdin = StringIO('{"start_date": "2018-01-22", "weekdays": "Sat", "weeks": 1}\n')
+        with patch.object(sys, 'argv', ['days.py', '--batch', '-']), \
+                patch.object(sys, 'stdin', stdin):
+            cli()
+
+        result = json.loads(self.held_output.getvalue())
+        self.assertEqual(result, {'id': 1, 'days': ['Sat Jan 27']})
+
+    def test_cli_batch_missing_file(self):
+        """Test that an unreadable job file is a usage error, not a traceback."""
+        stderr = StringIO()
+        with patch.object(sys, 'argv', ['days.py', '--batch', '/nonexistent/jobs.jsonl']), \
+                patch('sys.stderr', stderr), self.assertRaises(SystemExit) as raised:
+            cli()
+        self.assertEqual(raised.exception.code, 2)
+        self.assertIn('--batch:', stderr.getvalue())
+        self.assertNotIn('Traceback', stderr.getvalue())
+
+    def test_cli_batch_bad_chunksize(self):
+        """Test that --chunksize below 1 is a usage error, not a traceback."""
+        for chunksize in ('0', '-3'):
+            stderr = StringIO()
+            with self.subTest(chunksize=chunksize), \
+                    patch.object(sys, 'argv', ['days.py', '--batch', '-', '-j', '2',
+                                               '--chunksize', chunksize]), \
+                    patch.object(sys, 'stdin', StringIO('{}\n')), \
+                    patch('sys.stderr', stderr), self.assertRaises(SystemExit) as raised:
+                cli()
+            self.assertEqual(raised.exception.code, 2)
+            self.assertIn('--chunksize must be at least 1', stderr.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+
+import unittest
+from days import cache_clear, cache_info, get_days, get_days_cached, set_cache_size
+
+
+class TestGetDaysCached(unittest.TestCase):
+    """Test the memoized get_days_cached function."""
+
+    def setUp(self):
+        """Start each test from an empty, default-sized cache."""
+        set_cache_size(128)
+        cache_clear()
+
+    def tearDown(self):
+        """Leave an empty, default-sized cache behind."""
+        set_cache_size(128)
+        cache_clear()
+
+    def test_cached_matches_get_days(self):
+        """Test that cached results equal get_days, as a tuple."""
+        results = get_days_cached(2018, 1, 22, ['Tue', 'Thu'], weeks=14)
+        self.assertIsInstance(results, tuple)
+        self.assertEqual(list(results), get_days(2018, 1, 22, ['Tue', 'Thu'], weeks=14))
+
+    def test_cache_hits_and_misses(self):
+        """Test that repeated requests are counted as hits."""
+        first = get_days_cached(2018, 1, 22, ['Tue', 'Thu'])
+        second = get_days_cached(2018, 1, 22, ['Tue', 'Thu'])
+        self.assertIs(first, second)
+        info = cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (1, 1, 1))
+
+    def test_equivalent_weekdays_share_an_entry(self):
+        """Test that weekday order, case and repeats are normalized."""
+        get_days_cached(2018, 1, 22, ['Tue', 'Thu'])
+        get_days_cached(2018, 1, 22, ['Thu', 'Tue'])
+        get_days_cached(2018, 1, 22, ['thu', 'TUE', 'Tue'])
+        info = cache_info()
+        self.assertEqual((info.hits, info.misses), (2, 1))
+
+    def test_different_arguments_miss(self):
+        """Test that start date and weeks are part of the key."""
+        get_days_cached(2018, 1, 22, ['Tue'], weeks=2)
+        get_days_cached(2018, 1, 23, ['Tue'], weeks=2)
+        get_days_cached(2018, 1, 22, ['Tue'], weeks=3)
+        self.assertEqual(cache_info().misses, 3)
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted first."""
+        set_cache_size(2)
+        get_days_cached(2018, 1, 22, ['Mon'], weeks=1)
+        get_days_cached(2018, 1, 22, ['Tue'], weeks=1)
+        get_days_cached(2018, 1, 22, ['Mon'], weeks=1)
+        get_days_cached(2018, 1, 22, ['Wed'], weeks=1)  # evicts Tue
+        get_days_cached(2018, 1, 22, ['Mon'], weeks=1)
+        get_days_cached(2018, 1, 22, ['Tue'], weeks=1)
+        info = cache_info()
+        self.assertEqual((info.hits, info.misses, info.evictions), (2, 4, 2))
+        self.assertEqual((info.maxsize, info.currsize), (2, 2))
+
+    def test_set_cache_size_shrinks(self):
+        """Test that shrinking the cache evicts extra entries."""
+        for weeks in range(1, 6):
+            get_days_cached(2018, 1, 22, ['Mon'], weeks=weeks)
+        set_cache_size(3)
+        info = cache_info()
+        self.assertEqual((info.currsize, info.evictions), (3, 2))
+
+    def test_negative_cache_size(self):
+        """Test that a negative size raises ValueError and keeps the old size."""
+        with self.assertRaises(ValueError):
+            set_cache_size(-1)
+        self.assertEqual(cache_info().maxsize, 128)
+
+    def test_cache_clear_resets_counters(self):
+        """Test that cache_clear empties the cache and resets counters."""
+        get_days_cached(2018, 1, 22, ['Mon'])
+        cache_clear()
+        self.assertEqual(cache_info(), (0, 0, 0, 128, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,11 +1,13 @@
 #!/usr/bin/env python
 
 import unittest
+import os
+import subprocess
 import sys
 from io import StringIO
 from unittest.mock import patch
 from datetime import datetime
-from days import cli
+from days import _build_parser, _parse_fast, cli
 
 
 class TestCLI(unittest.TestCase):
@@ -146,6 +148,133 @@ class TestCLI(unittest.TestCase):
         # Should get 5 weekdays in one week
         self.assertEqual(len(lines), 5)
 
+    def test_cli_unknown_weekday(self):
+        """Test that an unknown weekday is reported as a usage error."""
+        test_args = ['days.py', '-w', 'Tue', 'Xyz']
+        with patch.object(sys, 'argv', test_args), patch('sys.stderr', StringIO()):
+            with self.assertRaises(SystemExit):
+                cli()
+        self.assertEqual(self.held_output.getvalue(), '')
+
+    def test_cli_negative_weeks(self):
+        """Test that a negative -n is a usage error rather than an endless listing."""
+        for flag in ('-n', '--num-weeks'):
+            test_args = ['days.py', '--start-date', '2025-11-01', flag, '-1']
+            with patch.object(sys, 'argv', test_args), patch('sys.stderr', StringIO()):
+                with self.assertRaises(SystemExit):
+                    cli()
+        self.assertEqual(self.held_output.getvalue(), '')
+
+    def test_cli_date_format(self):
+        """Test that --date-format controls how dates are printed."""
+        test_args = ['days.py', '--start-date', '2018-01-22', '-n', '1',
+                     '--date-format', '%Y-%m-%d']
+        with patch.object(sys, 'argv', test_args):
+            cli()
+
+        self.assertEqual(self.held_output.getvalue(), '2018-01-23\n2018-01-25\n')
+
+    def test_cli_locale(self):
+        """Test that --locale is applied to output only, then restored."""
+        import locale
+        before = locale.setlocale(locale.LC_TIME)
+        test_args = ['days.py', '--start-date', '2018-01-22', '-n', '1', '--locale', 'C']
+        with patch.object(sys, 'argv', test_args):
+            cli()
+
+        self.assertEqual(self.held_output.getvalue(), 'Tue Jan 23\nThu Jan 25\n')
+        self.assertEqual(locale.setlocale(locale.LC_TIME), before)
+
+    def test_cli_unknown_locale(self):
+        """Test that an unsupported --locale is a usage error."""
+        test_args = ['days.py', '--locale', 'xx_NOPE']
+        with patch.object(sys, 'argv', test_args), patch('sys.stderr', StringIO()):
+            with self.assertRaises(SystemExit):
+                cli()
+
+    def test_cli_broken_pipe(self):
+        """Test that closing the pipe early exits without a traceback."""
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        proc = subprocess.Popen(
+            [sys.executable, os.path.join(root, 'days.py'), '-n', '1000000',
+             '-w', 'Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun'],
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        proc.stdout.readline()
+        proc.stdout.close()
+        stderr = proc.stderr.read()
+        proc.stderr.close()
+        self.assertEqual(proc.wait(), 1)
+        self.assertEqual(stderr, b'')
+
+
+class TestFastParser(unittest.TestCase):
+    """Test the argparse-free parser for common options."""
+
+    now = datetime(2018, 1, 22, 10, 0, 0)
+
+    def parse_slow(self, argv):
+        args = _build_parser(self.now).parse_args(argv)
+        if args.start_date:
+            start = datetime.strptime(args.start_date, '%Y-%m-%d')
+            args.year, args.month, args.day = start.year, start.month, start.day
+            args.start_date = None
+        return vars(args)
+
+    def test_fast_path_matches_argparse(self):
+        """Test that common options parse the same way as with argparse."""
+        argvs = [
+            [],
+            ['-y', '2018', '-m', '1', '-d', '22', '-n', '1'],
+            ['--year', '2019', '--month', '3', '--dom', '4', '--num-weeks', '0'],
+            ['--start-date', '2018-01-22', '-w', 'Mon', 'Wed', '-g'],
+            ['--on', 'Tue', '-n', '3', '--weekdays', 'Fri', 'Sat'],
+            ['-y', '2020', '--start-date', '2018-01-22', '-m', '6'],
+            ['--cache', '--group', '--format', 'csv'],
+            ['--no-cache', '-n', '-1'],
+            ['-p', 'Mon Wed', '--pattern', 'Tue'],
+            ['--union', 'Sat', '--subtract', '2025-03-10..2025-03-14', '--intersect', 'Tue',
+             '--between', '2025-03-01..2025-03-31', '--count'],
+            ['--on', 'Fri', '--nth', '-1', '--every', '2'],
+            ['--nth', '1,-1'],
+        ]
+        for argv in argvs:
+            with self.subTest(argv=argv):
+                fast = _parse_fast(argv, self.now)
+                self.assertIsNotNone(fast)
+                self.assertEqual(vars(fast), self.parse_slow(argv))
+
+    def test_fast_path_falls_back(self):
+        """Test that anything unusual is left to argparse."""
+        argvs = [
+            ['-h'],
+            ['--batch', 'jobs.jsonl'],
+            ['--num', '3'],
+            ['-n', 'three'],
+            ['-n'],
+            ['-w'],
+            ['--start-date', '2018-1-22'],
+            ['--start-date', '2018-02-30'],
+            ['--start-date'],
+            ['--clear-cache'],
+            ['--format', 'xml'],
+            ['--nth', '-1,-2'],
+            ['--nth=-1,-2'],
+            ['extra'],
+        ]
+        for argv in argvs:
+            with self.subTest(argv=argv):
+                self.assertIsNone(_parse_fast(argv, self.now))
+
+    def test_import_skips_slow_modules(self):
+        """Test that importing days leaves argparse and friends unloaded."""
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        code = ("import sys; sys.path.insert(0, {!r}); import days; "
+                "print(sorted(m for m in ('argparse', 'asyncio', 'json', 'tempfile', "
+                "'concurrent.futures', 'http.server') if m in sys.modules))").format(root)
+        output = subprocess.run([sys.executable, '-S', '-c', code],
+                                capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.strip(), '[]')
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+
+import json
+import random
+import unittest
+from datetime import date, timedelta
+from itertools import islice
+from days import Cursor, get_days, iter_days, iter_weeks, run_batch, run_job
+
+
+NAMES = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
+
+
+def _pages(start, days, sizes, **kwargs):
+    """Page through a schedule with get_days, returning all dates and the last cursor."""
+    cursor = None
+    results = []
+    for weeks in sizes:
+        page = get_days(start.year, start.month, start.day, days, weeks=weeks, cursor=cursor,
+                        **kwargs)
+        results.extend(page.dates)
+        cursor = page.cursor
+    return results, cursor
+
+
+class TestCursor(unittest.TestCase):
+    """Test resuming schedules from a cursor."""
+
+    def test_pages_match_one_run(self):
+        """Test that 14-week pages add up to one long run, across year boundaries."""
+        start = date(2024, 11, 20)
+        long_run = get_days(2024, 11, 20, ['Tue', 'Thu'], weeks=56)
+        results, cursor = _pages(start, ['Tue', 'Thu'], [14] * 4)
+        self.assertEqual(results, long_run.dates)
+        self.assertEqual(cursor, long_run.cursor)
+        self.assertEqual(cursor, Cursor(start, date(2025, 12, 11), 56))
+
+    def test_property_against_one_run(self):
+        """Test random schedules, rules and page sizes against a single call."""
+        rng = random.Random(2023)
+        for _ in range(200):
+            start = date(2000, 1, 1) + timedelta(days=rng.randrange(366 * 30))
+            days = rng.sample(NAMES, rng.randint(1, 7))
+            sizes = [rng.randint(0, 8) for _ in range(rng.randint(1, 4))]
+            kwargs = {
+                'every': rng.choice([1, 1, 2, 3]),
+                'nth': tuple(rng.sample([1, 2, -1, 5], rng.randint(0, 2))),
+                'exclude': [start + timedelta(days=rng.randrange(120)) for _ in range(3)],
+            }
+            with self.subTest(start=start, days=days, sizes=sizes, **kwargs):
+                long_run = get_days(start.year, start.month, start.day, days, weeks=sum(sizes),
+                                    **kwargs)
+                results, cursor = _pages(start, days, sizes, **kwargs)
+                self.assertEqual(results, long_run.dates)
+                self.assertEqual(cursor, long_run.cursor)
+
+    def test_resume_mid_week(self):
+        """Test that a cursor in the middle of a week continues that week."""
+        start = date(2025, 1, 1)
+        head = list(iter_days(2025, 1, 1, ['Mon', 'Wed', 'Fri'], weeks=None,
+                              until=date(2025, 1, 8)))
+        cursor = Cursor(start).advance(head)
+        self.assertEqual(cursor, Cursor(start, date(2025, 1, 8), 2))
+        self.assertEqual(list(iter_weeks(2025, 1, 1, ['Mon', 'Wed', 'Fri'], weeks=1,
+                                         cursor=cursor)),
+                         [(date(2025, 1, 10),),
+                          (date(2025, 1, 13), date(2025, 1, 15), date(2025, 1, 17))])
+
+    def test_open_ended(self):
+        """Test an open-ended resumed iteration."""
+        cursor = Cursor(date(2025, 1, 1), date(2025, 12, 30), 52)
+        self.assertEqual(list(islice(iter_days(2025, 1, 1, ['Tue'], weeks=None, cursor=cursor),
+                                     2)),
+                         [date(2026, 1, 6), date(2026, 1, 13)])
+
+    def test_empty_cursor(self):
+        """Test that a cursor before any date starts from the beginning."""
+        self.assertEqual(get_days(2025, 1, 1, ['Mon'], weeks=2, cursor=Cursor(date(2025, 1, 1))),
+                         get_days(2025, 1, 1, ['Mon'], weeks=2))
+        self.assertEqual(get_days(2025, 1, 1, ['Mon'], weeks=0).cursor,
+                         Cursor(date(2025, 1, 1)))
+
+    def test_wrong_schedule(self):
+        """Test that a cursor from another start date raises ValueError."""
+        with self.assertRaises(ValueError):
+            get_days(2025, 1, 2, ['Mon'], cursor=Cursor(date(2025, 1, 1)))
+
+    def test_serialization(self):
+        """Test the JSON round trip."""
+        cursor = get_days(2025, 1, 1, ['Mon'], weeks=3).cursor
+        data = json.loads(json.dumps(cursor.to_dict()))
+        self.assertEqual(data, {'start': '2025-01-01', 'last': '2025-01-20', 'weeks': 3})
+        self.assertEqual(Cursor.from_dict(data), cursor)
+        self.assertEqual(Cursor.from_dict({'start': '2025-01-01'}), Cursor(date(2025, 1, 1)))
+
+    def test_run_job(self):
+        """Test paging batch jobs with the cursor key."""
+        job = {'start_date': '2025-12-20', 'weekdays': 'Mon', 'weeks': 2, 'cursor': None}
+        first = run_job(job)
+        self.assertEqual(first['days'], ['Mon Dec 22', 'Mon Dec 29'])
+        second = run_job(dict(job, cursor=first['cursor']))
+        self.assertEqual(second['days'], ['Mon Jan  5', 'Mon Jan 12'])
+        self.assertEqual(second['cursor'], {'start': '2025-12-20', 'last': '2026-01-12',
+                                            'weeks': 4})
+        self.assertNotIn('cursor', run_job({'start_date': '2025-12-20'}))
+        self.assertIn('error', run_job(dict(job, cursor={'start': '2025-12-21'})))
+
+    def test_batch_bad_cursor(self):
+        """Test that a malformed cursor fails only its own batch job."""
+        jobs = [{'start_date': '2025-12-20', 'cursor': 'abc'},
+                {'start_date': '2025-12-20', 'cursor': ['2025-12-20']},
+                {'start_date': '2025-12-20', 'weekdays': 'Mon', 'weeks': 1, 'cursor': None}]
+        results = list(run_batch(jobs))
+        self.assertEqual([result['id'] for result in results], [1, 2, 3])
+        self.assertIn('error', results[0])
+        self.assertIn('error', results[1])
+        self.assertEqual(results[2]['days'], ['Mon Dec 22'])
+        with self.assertRaises(ValueError):
+            Cursor.from_dict('abc')
+
+
+if __name__ == '__main__':
+    unittest.main()
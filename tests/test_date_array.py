@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+
+import sys
+import unittest
+from datetime import date
+from days import DateArray, DateStrings, get_days, iter_days
+
+
+class TestDateArray(unittest.TestCase):
+    """Test the compact DateArray container."""
+
+    def setUp(self):
+        self.dates = list(iter_days(2018, 1, 22, ['Tue', 'Thu'], weeks=3))
+        self.array = DateArray(self.dates)
+
+    def test_len_and_iteration(self):
+        """Test that iteration yields the original dates."""
+        self.assertEqual(len(self.array), 6)
+        self.assertEqual(list(self.array), self.dates)
+
+    def test_indexing(self):
+        """Test positive and negative indexes."""
+        self.assertEqual(self.array[0], date(2018, 1, 23))
+        self.assertEqual(self.array[-1], date(2018, 2, 8))
+        with self.assertRaises(IndexError):
+            self.array[6]
+
+    def test_slicing(self):
+        """Test that slices are DateArrays too."""
+        part = self.array[1:5:2]
+        self.assertIsInstance(part, DateArray)
+        self.assertEqual(list(part), self.dates[1:5:2])
+
+    def test_contains_and_index(self):
+        """Test membership and Sequence helpers."""
+        self.assertIn(date(2018, 1, 30), self.array)
+        self.assertNotIn(date(2018, 1, 31), self.array)
+        self.assertNotIn('Tue Jan 30', self.array)
+        self.assertEqual(self.array.index(date(2018, 1, 30)), 2)
+
+    def test_equality(self):
+        """Test comparison with other DateArrays and with lists."""
+        self.assertEqual(self.array, DateArray(self.dates))
+        self.assertEqual(self.array, self.dates)
+        self.assertNotEqual(self.array, DateArray(self.dates[:-1]))
+
+    def test_immutable(self):
+        """Test that items cannot be assigned and ordinals are read-only."""
+        with self.assertRaises(TypeError):
+            self.array[0] = date(2018, 1, 1)
+        with self.assertRaises(TypeError):
+            self.array.ordinals[0] = 1
+        with self.assertRaises(AttributeError):
+            self.array.extra = 1
+
+    def test_memory_per_date(self):
+        """Test that storage is an order of magnitude below formatted strings."""
+        results = get_days(2018, 1, 22, ['Tue', 'Thu'], weeks=5000)
+        as_strings = list(results)
+        string_bytes = sys.getsizeof(as_strings) + sum(map(sys.getsizeof, as_strings))
+        self.assertLess(sys.getsizeof(results) * 10, string_bytes)
+
+
+class TestDateStrings(unittest.TestCase):
+    """Test the string view over a DateArray."""
+
+    def test_get_days_returns_string_view(self):
+        """Test that get_days wraps a DateArray."""
+        results = get_days(2018, 1, 22, ['Tue'], weeks=2)
+        self.assertIsInstance(results, DateStrings)
+        self.assertIsInstance(results.dates, DateArray)
+        self.assertEqual(results, ['Tue Jan 23 00:00:00 2018', 'Tue Jan 30 00:00:00 2018'])
+        self.assertEqual(results.dates, [date(2018, 1, 23), date(2018, 1, 30)])
+
+    def test_custom_format_and_slicing(self):
+        """Test strings() with a formatting function, and slices of the view."""
+        view = DateArray(iter_days(2018, 1, 22, ['Tue'], weeks=3)).strings(date.isoformat)
+        self.assertEqual(view[0], '2018-01-23')
+        self.assertEqual(view[1:], ['2018-01-30', '2018-02-06'])
+        self.assertEqual(repr(view[:1]), "['2018-01-23']")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+
+import os
+import sys
+import tempfile
+import unittest
+from datetime import date
+from io import StringIO
+from unittest.mock import patch
+from days import _DiskCache, _iter_disk_cached, cli, iter_days
+
+
+class TestDiskCache(unittest.TestCase):
+    """Test the on-disk schedule cache."""
+
+    def setUp(self):
+        """Use a fresh cache directory for each test."""
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = os.path.join(tmp.name, 'days')
+        self.cache = _DiskCache(self.path, maxentries=3)
+
+    def test_miss_then_hit(self):
+        """Test that a second run is served without computing."""
+        first = list(_iter_disk_cached(self.cache, 2018, 1, 22, ['Tue', 'Thu'], 2))
+        with patch('days.iter_days') as mock_iter_days:
+            second = list(_iter_disk_cached(self.cache, 2018, 1, 22, ['Thu', 'tue'], 2))
+        mock_iter_days.assert_not_called()
+        self.assertEqual(first, second)
+        self.assertEqual(first, list(iter_days(2018, 1, 22, ['Tue', 'Thu'], weeks=2)))
+
+    def test_store_leaves_no_temporary_files(self):
+        """Test that entries are renamed into place."""
+        self.cache.store((1, (0,), 1), [1])
+        self.assertEqual(os.listdir(self.path), ['v1-1-0-1.json'])
+
+    def test_failed_store_removes_temporary_file(self):
+        """Test that a write that cannot be renamed into place leaves nothing behind."""
+        with patch('os.replace', side_effect=OSError):
+            self.cache.store((1, (0,), 1), [1])
+        self.assertEqual(os.listdir(self.path), [])
+        self.assertIsNone(self.cache.load((1, (0,), 1)))
+
+    def test_corrupt_entry_is_a_miss(self):
+        """Test that an unreadable entry is recomputed."""
+        key = (date(2018, 1, 22).toordinal(), (1,), 1)
+        self.cache.store(key, [])
+        with open(self.cache._file(key), 'w') as f:
+            f.write('{not json')
+        self.assertIsNone(self.cache.load(key))
+        results = list(_iter_disk_cached(self.cache, 2018, 1, 22, ['Tue'], 1))
+        self.assertEqual(results, [date(2018, 1, 23)])
+        self.assertEqual(self.cache.load(key), [date(2018, 1, 23).toordinal()])
+
+    def test_eviction_keeps_recent_entries(self):
+        """Test that only ``maxentries`` entries are kept, newest first."""
+        for weeks in range(1, 6):
+            self.cache.store((1, (0,), weeks), [weeks])
+            os.utime(self.cache._file((1, (0,), weeks)), (weeks, weeks))
+        self.assertEqual(len(os.listdir(self.path)), 3)
+        self.assertIsNone(self.cache.load((1, (0,), 1)))
+        self.assertEqual(self.cache.load((1, (0,), 5)), [5])
+
+    def test_open_ended_results_are_not_stored(self):
+        """Test that unbounded schedules bypass the cache."""
+        list(_iter_disk_cached(self.cache, 9999, 12, 1, ['Mon'], -1))
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_clear(self):
+        """Test that clear removes every entry."""
+        self.cache.store((1, (0,), 1), [1])
+        self.cache.store((1, (0,), 2), [2])
+        self.cache.clear()
+        self.assertEqual(os.listdir(self.path), [])
+
+
+class TestDiskCacheCLI(unittest.TestCase):
+    """Test the --cache, --no-cache and --clear-cache options."""
+
+    def setUp(self):
+        """Capture stdout and point XDG_CACHE_HOME at a temporary directory."""
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = os.path.join(tmp.name, 'days')
+        env = patch.dict(os.environ, {'XDG_CACHE_HOME': tmp.name})
+        env.start()
+        self.addCleanup(env.stop)
+        self.held_output = StringIO()
+        self.original_stdout = sys.stdout
+        sys.stdout = self.held_output
+
+    def tearDown(self):
+        """Restore stdout."""
+        sys.stdout = self.original_stdout
+
+    def run_cli(self, *args):
+        with patch.object(sys, 'argv', ['days.py', '--start-date', '2018-01-22', '-n', '2'] + list(args)):
+            cli()
+
+    def test_cache_flag_writes_and_reuses(self):
+        """Test that --cache output is the same on a hit."""
+        self.run_cli('--cache')
+        self.assertEqual(len(os.listdir(self.path)), 1)
+        self.run_cli('--cache')
+        lines = self.held_output.getvalue().splitlines()
+        self.assertEqual(lines[:4], lines[4:])
+
+    def test_no_cache_overrides_environment(self):
+        """Test that --no-cache wins over $DAYS_CACHE."""
+        with patch.dict(os.environ, {'DAYS_CACHE': '1'}):
+            self.run_cli('--no-cache')
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_environment_enables_cache(self):
+        """Test that $DAYS_CACHE turns the cache on."""
+        with patch.dict(os.environ, {'DAYS_CACHE': '1'}):
+            self.run_cli()
+        self.assertEqual(len(os.listdir(self.path)), 1)
+
+    def test_clear_cache(self):
+        """Test that --clear-cache empties the cache and prints nothing."""
+        self.run_cli('--cache')
+        self.held_output.truncate(0)
+        self.run_cli('--clear-cache')
+        self.assertEqual(os.listdir(self.path), [])
+        self.assertEqual(self.held_output.getvalue(), '')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,176 @@
+#!/usr/bin/env python
+
+import os
+import sys
+import tempfile
+import unittest
+from datetime import date, timedelta
+from io import StringIO
+from unittest.mock import patch
+from days import (ExclusionSet, _DiskCache, _iter_disk_cached, cli, get_days,
+                  get_days_cached, cache_clear, iter_days, iter_weeks, load_exclusions, run_job)
+
+
+def _write(directory, name, text):
+    path = os.path.join(directory, name)
+    with open(path, 'w') as f:
+        f.write(text)
+    return path
+
+
+class TestExclusionSet(unittest.TestCase):
+    """Test the sorted interval index of skipped dates."""
+
+    def test_merges_overlapping_and_adjacent_entries(self):
+        """Test that entries collapse into disjoint, sorted intervals."""
+        exclude = ExclusionSet([
+            '2018-02-05..2018-02-09',
+            date(2018, 1, 30),
+            (date(2018, 2, 8), date(2018, 2, 12)),
+            '2018-02-13',
+        ])
+        self.assertEqual(exclude.intervals, (
+            (date(2018, 1, 30), date(2018, 1, 30)),
+            (date(2018, 2, 5), date(2018, 2, 13)),
+        ))
+
+    def test_contains(self):
+        """Test membership against a day-by-day reference."""
+        entries = ['2018-01-01', '2018-03-01..2018-03-31', '2018-12-24..2018-12-26']
+        exclude = ExclusionSet(entries)
+        expected = {date(2018, 1, 1), date(2018, 12, 24), date(2018, 12, 25), date(2018, 12, 26)}
+        expected.update(date(2018, 3, d) for d in range(1, 32))
+        day = date(2017, 12, 1)
+        while day < date(2019, 2, 1):
+            self.assertEqual(day in exclude, day in expected, day)
+            day += timedelta(days=1)
+
+    def test_from_lines(self):
+        """Test comments, blank lines and error line numbers."""
+        exclude = ExclusionSet.from_lines(['# holidays\n', '\n', '2018-01-30  # Tue\n'])
+        self.assertEqual(exclude, ExclusionSet([date(2018, 1, 30)]))
+        with self.assertRaisesRegex(ValueError, 'line 2'):
+            ExclusionSet.from_lines(['2018-01-30', 'soon'])
+        with self.assertRaisesRegex(ValueError, 'line 1'):
+            ExclusionSet.from_lines(['2018-02-09..2018-02-05'])
+
+    def test_load_exclusions_is_cached(self):
+        """Test that an unchanged file is parsed once and merged with others."""
+        with tempfile.TemporaryDirectory() as tmp:
+            first = _write(tmp, 'a.txt', '2018-01-30\n')
+            second = _write(tmp, 'b.txt', '2018-02-01\n')
+            with patch('days.ExclusionSet.from_lines', wraps=ExclusionSet.from_lines) as parse:
+                load_exclusions(first)
+                load_exclusions(first)
+                merged = load_exclusions(first, second)
+            self.assertEqual(parse.call_count, 2)
+        self.assertEqual(merged, ExclusionSet(['2018-01-30', '2018-02-01']))
+
+
+class TestExcludedSchedules(unittest.TestCase):
+    """Test that skipped dates are dropped without using up weeks."""
+
+    def test_get_days_skips_dates(self):
+        """Test a single excluded date."""
+        result = get_days(2018, 1, 22, ['Tue', 'Thu'], weeks=2, exclude=['2018-01-25'])
+        self.assertEqual(result.dates, [date(2018, 1, 23), date(2018, 1, 30), date(2018, 2, 1)])
+
+    def test_empty_weeks_do_not_count(self):
+        """Test that a fully excluded week extends the schedule."""
+        result = list(iter_days(2018, 1, 22, ['Tue', 'Thu'], weeks=2,
+                                exclude=['2018-01-29..2018-02-04']))
+        self.assertEqual(result, [date(2018, 1, 23), date(2018, 1, 25),
+                                  date(2018, 2, 6), date(2018, 2, 8)])
+
+    def test_matches_filtered_reference(self):
+        """Test against filtering a long unexcluded run."""
+        exclude = ExclusionSet(['2018-03-01..2018-03-20', '2018-07-04', '2018-12-20..2019-01-06'])
+        days = ['Mon', 'Wed', 'Fri']
+        kept = [d for d in iter_days(2018, 1, 1, days, weeks=None, until=date(2020, 1, 1))
+                if d not in exclude]
+        weeks = sorted({d - timedelta(days=d.weekday()) for d in kept})[:52]
+        expected = [d for d in kept if d - timedelta(days=d.weekday()) in weeks]
+        self.assertEqual(list(iter_days(2018, 1, 1, days, weeks=52, exclude=exclude)), expected)
+
+    def test_empty_exclusion_set(self):
+        """Test that an empty set changes nothing."""
+        self.assertEqual(list(get_days(2018, 1, 22, ['Tue'], weeks=3, exclude=ExclusionSet())),
+                         list(get_days(2018, 1, 22, ['Tue'], weeks=3)))
+
+    def test_options_are_keyword_only(self):
+        """Test that an exclusion set can't be passed positionally as ``until``."""
+        holidays = ExclusionSet(['2018-01-23'])
+        for func in (iter_days, iter_weeks):
+            with self.subTest(func=func.__name__), self.assertRaises(TypeError):
+                list(func(2018, 1, 22, ['Tue'], 3, holidays))
+        self.assertEqual(list(iter_days(2018, 1, 22, ['Tue'], 2, exclude=holidays)),
+                         [date(2018, 1, 30), date(2018, 2, 6)])
+
+    def test_cached_results_depend_on_exclusions(self):
+        """Test that the LRU cache keys on the exclusion set."""
+        cache_clear()
+        self.addCleanup(cache_clear)
+        plain = get_days_cached(2018, 1, 22, ['Tue'], weeks=2)
+        skipped = get_days_cached(2018, 1, 22, ['Tue'], weeks=2, exclude=['2018-01-23'])
+        self.assertEqual(plain, ('Tue Jan 23 00:00:00 2018', 'Tue Jan 30 00:00:00 2018'))
+        self.assertEqual(skipped, ('Tue Jan 30 00:00:00 2018', 'Tue Feb  6 00:00:00 2018'))
+
+    def test_disk_cache_keys_on_exclusions(self):
+        """Test that excluded schedules get their own cache entries."""
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = _DiskCache(os.path.join(tmp, 'days'))
+            exclude = ExclusionSet(['2018-01-23'])
+            plain = list(_iter_disk_cached(cache, 2018, 1, 22, ['Tue'], 2))
+            skipped = list(_iter_disk_cached(cache, 2018, 1, 22, ['Tue'], 2, exclude))
+            self.assertNotEqual(plain, skipped)
+            self.assertEqual(skipped, list(_iter_disk_cached(cache, 2018, 1, 22, ['Tue'], 2, exclude)))
+            self.assertEqual(len(os.listdir(cache.path)), 2)
+
+
+class TestExcludeCLI(unittest.TestCase):
+    """Test the --exclude option and the batch ``exclude`` field."""
+
+    def setUp(self):
+        """Capture stdout and create a holiday file."""
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.holidays = _write(tmp.name, 'holidays.txt', '2018-01-30\n2018-02-05..2018-02-11\n')
+        self.bad = _write(tmp.name, 'bad.txt', 'someday\n')
+        self.held_output = StringIO()
+        self.original_stdout = sys.stdout
+        sys.stdout = self.held_output
+
+    def tearDown(self):
+        """Restore stdout."""
+        sys.stdout = self.original_stdout
+
+    def test_cli_exclude(self):
+        """Test that --exclude skips the listed dates."""
+        test_args = ['days.py', '--start-date', '2018-01-22', '-n', '3', '--exclude', self.holidays]
+        with patch.object(sys, 'argv', test_args):
+            cli()
+        self.assertEqual(self.held_output.getvalue().splitlines(), [
+            'Tue Jan 23', 'Thu Jan 25', 'Thu Feb  1', 'Tue Feb 13', 'Thu Feb 15',
+        ])
+
+    def test_cli_bad_exclude_file(self):
+        """Test that unreadable or malformed files are usage errors."""
+        for path in (self.bad, self.bad + '.missing'):
+            with patch.object(sys, 'argv', ['days.py', '-x', path]), \
+                    patch('sys.stderr', StringIO()) as stderr:
+                with self.assertRaises(SystemExit):
+                    cli()
+            self.assertIn('--exclude', stderr.getvalue())
+
+    def test_run_job_exclude(self):
+        """Test that batch jobs accept an exclusion file path."""
+        result = run_job({'start_date': '2018-01-22', 'weekdays': ['Tue'], 'weeks': 2,
+                          'exclude': self.holidays})
+        self.assertEqual(result['days'], ['Tue Jan 23', 'Tue Feb 13'])
+        error = run_job({'id': 1, 'exclude': [self.holidays, self.bad]})
+        self.assertEqual(error['id'], 1)
+        self.assertIn('line 1', error['error'])
+
+
+if __name__ == '__main__':
+    unittest.main()
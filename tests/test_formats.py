@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+
+import csv
+import json
+import sys
+import unittest
+from io import StringIO
+from itertools import islice
+from unittest.mock import patch
+from days import _json_lines, _records, cli, iter_days
+
+
+EXPECTED = [
+    {'index': 1, 'date': '2018-01-25', 'weekday': 'Thu', 'week': 4, 'group': 1},
+    {'index': 2, 'date': '2018-01-30', 'weekday': 'Tue', 'week': 5, 'group': 2},
+    {'index': 3, 'date': '2018-02-01', 'weekday': 'Thu', 'week': 5, 'group': 2},
+]
+
+
+class TestFormats(unittest.TestCase):
+    """Test the machine-readable --format outputs."""
+
+    def setUp(self):
+        """Capture stdout for testing."""
+        self.held_output = StringIO()
+        self.original_stdout = sys.stdout
+        sys.stdout = self.held_output
+
+    def tearDown(self):
+        """Restore stdout."""
+        sys.stdout = self.original_stdout
+
+    def run_cli(self, output_format, *args):
+        argv = ['days.py', '--start-date', '2018-01-24', '-n', '2', '--format', output_format]
+        with patch.object(sys, 'argv', argv + list(args)):
+            cli()
+        return self.held_output.getvalue()
+
+    def test_records(self):
+        """Test the fields produced for each date."""
+        self.assertEqual(list(_records(iter_days(2018, 1, 24, ['Tue', 'Thu'], weeks=2))), EXPECTED)
+
+    def test_json(self):
+        """Test that --format json is a single JSON array."""
+        self.assertEqual(json.loads(self.run_cli('json')), EXPECTED)
+
+    def test_json_empty(self):
+        """Test that an empty schedule is still valid JSON."""
+        self.assertEqual(json.loads(self.run_cli('json', '-n', '0')), [])
+
+    def test_jsonl(self):
+        """Test that --format jsonl is one JSON object per line."""
+        lines = self.run_cli('jsonl').splitlines()
+        self.assertEqual([json.loads(line) for line in lines], EXPECTED)
+
+    def test_csv(self):
+        """Test that --format csv has a header row and CRLF line endings."""
+        output = self.run_cli('csv')
+        self.assertTrue(output.startswith('index,date,weekday,week,group\r\n'))
+        rows = list(csv.DictReader(StringIO(output, newline='')))
+        self.assertEqual([row['date'] for row in rows], [r['date'] for r in EXPECTED])
+        self.assertEqual([int(row['group']) for row in rows], [1, 2, 2])
+
+    def test_ics(self):
+        """Test that --format ics is a calendar with one all-day event per date."""
+        output = self.run_cli('ics')
+        self.assertTrue(output.endswith('END:VCALENDAR\r\n'))
+        lines = output.split('\r\n')
+        self.assertEqual(lines[0], 'BEGIN:VCALENDAR')
+        self.assertEqual(lines.count('BEGIN:VEVENT'), 3)
+        self.assertIn('DTSTART;VALUE=DATE:20180130', lines)
+        self.assertIn('DTEND;VALUE=DATE:20180131', lines)
+        self.assertEqual(len(set(l for l in lines if l.startswith('UID:'))), 3)
+
+    def test_group_does_not_change_formats(self):
+        """Test that -g only affects text output."""
+        self.assertEqual(json.loads(self.run_cli('json', '-g')), EXPECTED)
+
+    def test_unknown_format(self):
+        """Test that unknown formats are rejected."""
+        with patch('sys.stderr', StringIO()), self.assertRaises(SystemExit):
+            self.run_cli('xml')
+
+    def test_serialization_is_streaming(self):
+        """Test that output starts before an open-ended schedule ends."""
+        records = _records(iter_days(2018, 1, 22, ['Mon'], weeks=None))
+        lines = list(islice(_json_lines(records), 3))
+        self.assertEqual(lines[0], '[')
+        self.assertEqual(json.loads(lines[1].rstrip(','))['date'], '2018-01-22')
+
+
+if __name__ == '__main__':
+    unittest.main()
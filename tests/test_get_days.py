@@ -1,7 +1,51 @@
 #!/usr/bin/env python
 
+import calendar
 import unittest
-from days import get_days
+from datetime import date, timedelta
+from days import get_days, iter_days
+
+
+def _calendar_walk(year, month, day, days, weeks=14):
+    """Reference: the original calendar-walking implementation of get_days."""
+    results = []
+    start_date = date(year, month, day)
+    num_weeks = 0
+    for m in range(13)[month:]:
+        for week in calendar.Calendar().monthdatescalendar(year, m):
+            if num_weeks == weeks:
+                return results
+            found = False
+            for d in week:
+                if d < start_date:
+                    continue
+                dt = d.strftime('%c')
+                for dow in days:
+                    if dt.startswith(dow) and dt not in results:
+                        results.append(dt)
+                        found = True
+            if found:
+                num_weeks += 1
+    return results
+
+
+def _brute_force(start_date, days, weeks):
+    """Reference: check every day from the start, one at a time."""
+    names = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
+    results = []
+    week = None
+    num_weeks = 0
+    d = start_date
+    while True:
+        if names[d.weekday()] in days:
+            monday = d - timedelta(days=d.weekday())
+            if monday != week:
+                if num_weeks == weeks:
+                    return results
+                week = monday
+                num_weeks += 1
+            results.append(d)
+        d += timedelta(days=1)
 
 
 class TestGetDays(unittest.TestCase):
@@ -83,8 +127,37 @@ class TestGetDays(unittest.TestCase):
         # Start late December, get dates into January
         results = get_days(2018, 12, 25, ['Tue', 'Thu'], weeks=3)
         
-        # Verify we get results
-        self.assertGreater(len(results), 0)
+        # Should continue into January: Dec 25, 27, Jan 1, 3, 8, 10
+        self.assertEqual(len(results), 6)
+        self.assertTrue(results[-1].startswith('Thu Jan 10'))
+        self.assertTrue(results[-1].endswith('2019'))
+
+    def test_get_days_full_year_from_november(self):
+        """Test that a year of weeks is not cut off at December."""
+        results = get_days(2025, 11, 1, ['Mon'], weeks=52)
+        self.assertEqual(len(results), 52)
+        self.assertTrue(results[-1].startswith('Mon Oct 26'))
+        self.assertTrue(results[-1].endswith('2026'))
+
+    def test_get_days_ten_year_horizon(self):
+        """Test multi-year ranges against a brute-force walk."""
+        results = get_days(2021, 8, 30, ['Tue', 'Thu'], weeks=522)
+        expected = _brute_force(date(2021, 8, 30), ['Tue', 'Thu'], 522)
+        self.assertEqual(results, [d.strftime('%c') for d in expected])
+
+    def test_get_days_gregorian_cycle(self):
+        """Test every start date in a 400-year Gregorian cycle."""
+        # Rotate through all 127 non-empty weekday sets as the start moves.
+        names = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
+        start = date(2000, 1, 1).toordinal()
+        for ordinal in range(start, start + 146097):
+            d = date.fromordinal(ordinal)
+            mask = ordinal % 127 + 1
+            dows = [name for i, name in enumerate(names) if mask & (1 << i)]
+            expected = _brute_force(d, dows, 2)
+            results = list(iter_days(d.year, d.month, d.day, dows, weeks=2))
+            if results != expected:
+                self.fail('{} {}: {} != {}'.format(d, dows, results, expected))
     
     def test_get_days_leap_year(self):
         """Test with leap year (2020 has Feb 29)."""
@@ -104,6 +177,36 @@ class TestGetDays(unittest.TestCase):
         # Should get 7 days for one week
         self.assertEqual(len(results), 7)
     
+    def test_get_days_ignores_case(self):
+        """Test that weekday names are matched without regard to case."""
+        results = get_days(2018, 1, 22, ['tue', 'THU'], weeks=1)
+        self.assertEqual(results, get_days(2018, 1, 22, ['Tue', 'Thu'], weeks=1))
+
+    def test_get_days_full_names(self):
+        """Test that full and partial weekday names are accepted."""
+        results = get_days(2018, 1, 22, ['tuesday', 'Thurs'], weeks=1)
+        self.assertEqual(results, get_days(2018, 1, 22, ['Tue', 'Thu'], weeks=1))
+
+    def test_get_days_unknown_weekday(self):
+        """Test that an unrecognized weekday name raises ValueError."""
+        with self.assertRaises(ValueError):
+            get_days(2018, 1, 22, ['Tue', 'Xyz'], weeks=1)
+
+    def test_get_days_independent_of_locale(self):
+        """Test that results do not depend on the LC_TIME locale."""
+        import locale
+        saved = locale.setlocale(locale.LC_TIME)
+        self.addCleanup(locale.setlocale, locale.LC_TIME, saved)
+        for name in ('de_DE.UTF-8', 'fr_FR.UTF-8', 'C.UTF-8'):
+            try:
+                locale.setlocale(locale.LC_TIME, name)
+            except locale.Error:
+                continue
+            with self.subTest(locale=name):
+                results = get_days(2018, 1, 22, ['Tue', 'Thu'], weeks=1)
+                self.assertEqual(results, ['Tue Jan 23 00:00:00 2018',
+                                           'Thu Jan 25 00:00:00 2018'])
+
     def test_get_days_format(self):
         """Test that returned dates are in expected format."""
         results = get_days(2018, 1, 22, ['Tue'], weeks=1)
@@ -113,6 +216,20 @@ class TestGetDays(unittest.TestCase):
             self.assertIsInstance(result, str)
             self.assertTrue(result.startswith('Tue'))
 
+    def test_get_days_matches_calendar_walk(self):
+        """Test that results match the original calendar walk within a year."""
+        patterns = [['Tue', 'Thu'], ['Mon'], ['Sat', 'Sun'], ['Fri', 'Mon', 'Wed'],
+                    ['Tue', 'Tue'], ['T'], ['W', 'S']]
+        start = date(2020, 1, 1)
+        for offset in range(0, 240, 7):
+            d = start + timedelta(days=offset)
+            for dows in patterns:
+                for weeks in (0, 1, 3, 14):
+                    with self.subTest(start=d, dows=dows, weeks=weeks):
+                        self.assertEqual(
+                            get_days(d.year, d.month, d.day, dows, weeks=weeks),
+                            _calendar_walk(d.year, d.month, d.day, dows, weeks=weeks))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+
+import types
+import unittest
+from datetime import date, timedelta
+from itertools import islice
+from days import get_days, iter_days, iter_weeks
+
+
+class TestIterDays(unittest.TestCase):
+    """Test the iter_days generator."""
+
+    def test_iter_days_is_lazy(self):
+        """Test that iter_days returns a generator."""
+        results = iter_days(2018, 1, 22, ['Tue', 'Thu'], weeks=2)
+        self.assertIsInstance(results, types.GeneratorType)
+
+    def test_iter_days_yields_dates(self):
+        """Test that iter_days yields date objects."""
+        results = list(iter_days(2018, 1, 22, ['Tue', 'Thu'], weeks=2))
+        expected = [date(2018, 1, 23), date(2018, 1, 25),
+                    date(2018, 1, 30), date(2018, 2, 1)]
+        self.assertEqual(results, expected)
+
+    def test_iter_days_matches_get_days(self):
+        """Test that get_days formats the dates iter_days yields."""
+        dows = ['Mon', 'Wed', 'Fri']
+        expected = [d.strftime('%c') for d in iter_days(2018, 3, 7, dows, weeks=10)]
+        self.assertEqual(get_days(2018, 3, 7, dows, weeks=10), expected)
+
+    def test_iter_days_open_ended(self):
+        """Test that weeks=None keeps going, across years."""
+        results = list(islice(iter_days(2018, 12, 25, ['Mon'], weeks=None), 60))
+        self.assertEqual(len(results), 60)
+        self.assertEqual(results[-1], date(2020, 2, 17))
+
+    def test_iter_days_until(self):
+        """Test that nothing after ``until`` is yielded."""
+        results = list(iter_days(2018, 1, 22, ['Tue', 'Thu'], weeks=None,
+                                 until=date(2018, 1, 30)))
+        self.assertEqual(results[-1], date(2018, 1, 30))
+        self.assertEqual(len(results), 3)
+
+    def test_iter_days_stops_at_date_max(self):
+        """Test that an open-ended sequence ends at the last representable date."""
+        results = list(iter_days(9999, 12, 1, ['Fri'], weeks=None))
+        self.assertEqual(results[-1], date(9999, 12, 31))
+
+    def test_negative_weeks_yield_nothing(self):
+        """Test that only None is open-ended; negative weeks count as 0."""
+        self.assertEqual(list(iter_days(2025, 11, 1, ['Tue'], weeks=-1)), [])
+        self.assertEqual(list(iter_days(2025, 11, 1, ['Tue'], weeks=-1, every=2)), [])
+        self.assertEqual(list(get_days(2025, 11, 1, ['Tue'], weeks=-3)), [])
+
+    def test_iter_days_no_weekdays(self):
+        """Test that an empty weekday list yields nothing, even when open-ended."""
+        self.assertEqual(list(iter_days(2018, 1, 22, [], weeks=None)), [])
+
+    def test_iter_days_unknown_weekday(self):
+        """Test that an unknown weekday raises instead of yielding nothing."""
+        with self.assertRaises(ValueError):
+            list(iter_days(2018, 1, 22, ['Xyz'], weeks=None))
+
+
+class TestIterWeeks(unittest.TestCase):
+    """Test the iter_weeks generator."""
+
+    def test_iter_weeks_groups_by_week(self):
+        """Test that each tuple holds one Monday-to-Sunday week."""
+        results = list(iter_weeks(2018, 1, 22, ['Tue', 'Thu'], weeks=2))
+        self.assertEqual(results, [(date(2018, 1, 23), date(2018, 1, 25)),
+                                   (date(2018, 1, 30), date(2018, 2, 1))])
+
+    def test_iter_weeks_mid_week_start(self):
+        """Test that a mid-week start gives a short first week, not drift."""
+        results = list(iter_weeks(2018, 1, 24, ['Mon', 'Wed', 'Fri'], weeks=3))
+        self.assertEqual([len(week) for week in results], [2, 3, 3])
+        for week in results:
+            self.assertEqual(len({d - timedelta(days=d.weekday()) for d in week}), 1)
+
+    def test_iter_weeks_repeated_weekday(self):
+        """Test that repeated weekday names do not pad the groups."""
+        results = list(iter_weeks(2018, 1, 22, ['Tue', 'tue', 'Tuesday'], weeks=2))
+        self.assertEqual(results, [(date(2018, 1, 23),), (date(2018, 1, 30),)])
+
+    def test_iter_weeks_flattens_to_iter_days(self):
+        """Test that the weeks contain exactly the iter_days dates."""
+        dows = ['Mon', 'Sat', 'Sun']
+        weeks = list(iter_weeks(2018, 12, 29, dows, weeks=20))
+        self.assertEqual(len(weeks), 20)
+        self.assertEqual([d for week in weeks for d in week],
+                         list(iter_days(2018, 12, 29, dows, weeks=20)))
+
+    def test_iter_weeks_is_lazy(self):
+        """Test that weeks stream from an open-ended schedule."""
+        results = list(islice(iter_weeks(2018, 1, 22, ['Fri'], weeks=None), 3))
+        self.assertEqual(results[-1], (date(2018, 2, 9),))
+
+
+if __name__ == '__main__':
+    unittest.main()
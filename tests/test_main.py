@@ -2,9 +2,9 @@
 
 import unittest
 import sys
-from io import StringIO
+from io import BytesIO, StringIO, TextIOWrapper
 from argparse import Namespace
-from days import main
+from days import _write_lines, main
 
 
 class TestMain(unittest.TestCase):
@@ -117,6 +117,37 @@ class TestMain(unittest.TestCase):
         # Should have separators
         self.assertIn('----------', output)
     
+    def test_main_grouped_repeated_weekday(self):
+        """Test that a repeated weekday does not stretch the groups."""
+        args = Namespace(
+            year=2018,
+            month=1,
+            day=22,
+            dows=['Tue', 'Tue'],
+            weeks=2,
+            chunk=True
+        )
+        main(args)
+
+        lines = self.held_output.getvalue().strip().split('\n')
+        self.assertEqual(lines, ['Tue Jan 23', '-' * 10, 'Tue Jan 30', '-' * 10])
+
+    def test_main_grouped_mid_week_start(self):
+        """Test that groups follow calendar weeks when starting mid-week."""
+        args = Namespace(
+            year=2018,
+            month=1,
+            day=24,
+            dows=['Mon', 'Wed', 'Fri'],
+            weeks=2,
+            chunk=True
+        )
+        main(args)
+
+        lines = self.held_output.getvalue().strip().split('\n')
+        self.assertEqual(lines, ['Wed Jan 24', 'Fri Jan 26', '-' * 10,
+                                 'Mon Jan 29', 'Wed Jan 31', 'Fri Feb  2', '-' * 10])
+
     def test_main_output_format(self):
         """Test that output is in correct format (10 chars)."""
         args = Namespace(
@@ -137,5 +168,33 @@ class TestMain(unittest.TestCase):
             self.assertEqual(len(line), 10)
 
 
+class TestWriteLines(unittest.TestCase):
+    """Test the buffered output writer."""
+
+    def test_write_lines_binary_buffer(self):
+        """Test that text already written comes out before the chunks."""
+        raw = BytesIO()
+        stream = TextIOWrapper(raw, encoding='utf-8')
+        stream.write('header\n')
+        written = _write_lines(('line {}'.format(n) for n in range(2500)), stream,
+                               batch_size=1000)
+        lines = raw.getvalue().decode('utf-8').splitlines()
+        self.assertEqual(lines[0], 'header')
+        self.assertEqual(lines[1:], ['line {}'.format(n) for n in range(2500)])
+        self.assertEqual(written, len(raw.getvalue()) - len('header\n'))
+
+    def test_write_lines_text_stream(self):
+        """Test streams without a binary buffer, such as StringIO."""
+        stream = StringIO()
+        self.assertEqual(_write_lines(['a', 'b'], stream), 4)
+        self.assertEqual(stream.getvalue(), 'a\nb\n')
+
+    def test_write_lines_nothing(self):
+        """Test that no lines means no output."""
+        stream = StringIO()
+        self.assertEqual(_write_lines([], stream), 0)
+        self.assertEqual(stream.getvalue(), '')
+
+
 if __name__ == '__main__':
     unittest.main()
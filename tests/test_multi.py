@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+
+import json
+import random
+import sys
+import unittest
+from datetime import date, timedelta
+from io import StringIO
+from itertools import combinations
+from unittest.mock import patch
+from days import cli, get_days, get_days_multi
+
+
+NAMES = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
+SUBSETS = [list(c) for size in range(8) for c in combinations(NAMES, size)]
+
+
+class TestGetDaysMulti(unittest.TestCase):
+    """Test computing many weekday sets in one call."""
+
+    def assertMatchesGetDays(self, start, patterns, **kwargs):
+        results = get_days_multi(start.year, start.month, start.day, patterns, **kwargs)
+        self.assertEqual(len(results), len(patterns))
+        for days, result in zip(patterns, results):
+            expected = get_days(start.year, start.month, start.day, days, **kwargs)
+            self.assertEqual(result.dates, expected.dates)
+            self.assertEqual(result, expected)
+            self.assertEqual(result.cursor, expected.cursor)
+
+    def test_demultiplexed_in_order(self):
+        """Test that each pattern gets its own schedule, in input order."""
+        mwf, tt, weekend = get_days_multi(2025, 1, 1, [['Mon', 'Wed', 'Fri'], ['Tue', 'Thu'],
+                                                       ['Sat', 'Sun']], weeks=1)
+        self.assertEqual(mwf.dates, [date(2025, 1, 1), date(2025, 1, 3)])
+        self.assertEqual(tt.dates, [date(2025, 1, 2)])
+        self.assertEqual(weekend.dates, [date(2025, 1, 4), date(2025, 1, 5)])
+
+    def test_every_weekday_set(self):
+        """Test all 128 weekday sets against get_days, across a year boundary."""
+        for weeks in (0, 1, 14, 60):
+            with self.subTest(weeks=weeks):
+                self.assertMatchesGetDays(date(2024, 12, 4), SUBSETS, weeks=weeks)
+
+    def test_property_against_get_days(self):
+        """Test random start dates and rules against get_days."""
+        rng = random.Random(2024)
+        for _ in range(100):
+            start = date(2000, 1, 1) + timedelta(days=rng.randrange(366 * 30))
+            kwargs = {
+                'weeks': rng.randint(0, 30),
+                'every': rng.choice([1, 1, 2, 3]),
+                'nth': rng.choice([None, None, (1, -1)]),
+                'exclude': rng.choice([None, [start + timedelta(days=rng.randrange(60))]]),
+            }
+            with self.subTest(start=start, **kwargs):
+                self.assertMatchesGetDays(start, rng.sample(SUBSETS, 6), **kwargs)
+
+    def test_end_of_calendar(self):
+        """Test schedules that run into date.max."""
+        self.assertMatchesGetDays(date(9999, 12, 1), [['Mon'], ['Sat', 'Sun']], weeks=10)
+
+    def test_invalid(self):
+        """Test that bad weekday names and rules raise ValueError."""
+        with self.assertRaises(ValueError):
+            get_days_multi(2025, 1, 1, [['Mon'], ['Xyz']])
+        with self.assertRaises(ValueError):
+            get_days_multi(2025, 1, 1, [['Mon']], every=0)
+
+
+class TestPatternCLI(unittest.TestCase):
+    """Test the --pattern option."""
+
+    def run_cli(self, *args):
+        output = StringIO()
+        with patch.object(sys, 'argv', ['days.py', '--start-date', '2025-01-01'] + list(args)), \
+                patch('sys.stdout', output):
+            cli()
+        return output.getvalue().splitlines()
+
+    def test_sections(self):
+        """Test one section per pattern, with the fast parser and with argparse."""
+        expected = ['[Mon Wed Fri]', 'Wed Jan  1', 'Fri Jan  3', 'Mon Jan  6', 'Wed Jan  8',
+                    'Fri Jan 10', '', '[Tue Thu]', 'Thu Jan  2', 'Tue Jan  7', 'Thu Jan  9']
+        self.assertEqual(self.run_cli('-p', 'Mon Wed Fri', '--pattern', 'Tue,Thu', '-n', '2'),
+                         expected)
+        self.assertEqual(self.run_cli('--pattern', 'Mon Wed Fri', '-p', 'Tue,Thu', '--num', '2'),
+                         expected)
+
+    def test_grouped(self):
+        """Test --pattern with --group."""
+        self.assertEqual(self.run_cli('-p', 'Sat', '-p', 'Wed', '-n', '1', '-g'),
+                         ['[Sat]', 'Sat Jan  4', '-' * 10, '', '[Wed]', 'Wed Jan  1', '-' * 10])
+
+    def test_machine_readable(self):
+        """Test that records are tagged with their pattern."""
+        records = [json.loads(line)
+                   for line in self.run_cli('-p', 'Mon,Fri', '-p', 'Sat', '-n', '1',
+                                            '--format', 'jsonl')]
+        self.assertEqual([(r['pattern'], r['date']) for r in records],
+                         [('Mon Fri', '2025-01-03'), ('Sat', '2025-01-04')])
+        self.assertEqual(self.run_cli('-p', 'Sat', '-n', '1', '--format', 'csv'),
+                         ['pattern,index,date,weekday,week,group', 'Sat,1,2025-01-04,Sat,1,1'])
+
+    def test_invalid(self):
+        """Test that bad patterns and combinations are usage errors."""
+        for args in (['-p', 'Xyz'], ['-p', ','], ['-p', 'Mon', '-w', 'Tue'],
+                     ['-p', 'Mon', '--format', 'ics']):
+            with self.subTest(args=args), patch('sys.stderr', StringIO()), \
+                    self.assertRaises(SystemExit):
+                self.run_cli(*args)
+
+
+if __name__ == '__main__':
+    unittest.main()
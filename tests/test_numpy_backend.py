@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+
+import random
+import unittest
+from datetime import date, timedelta
+from days import get_days_array, iter_days
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+@unittest.skipIf(np is None, 'NumPy is not installed')
+class TestGetDaysArray(unittest.TestCase):
+    """Test the optional NumPy backend."""
+
+    def test_dtype_and_values(self):
+        """Test that dates come back as datetime64[D]."""
+        result = get_days_array(2018, 1, 22, ['Tue', 'Thu'], weeks=2)
+        self.assertEqual(result.dtype, np.dtype('datetime64[D]'))
+        expected = np.array(['2018-01-23', '2018-01-25', '2018-01-30', '2018-02-01'],
+                            dtype='datetime64[D]')
+        np.testing.assert_array_equal(result, expected)
+
+    def test_matches_iter_days(self):
+        """Test random starts, patterns and lengths against iter_days."""
+        names = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
+        rng = random.Random(12)
+        for _ in range(500):
+            start = date(1, 1, 1) + timedelta(days=rng.randrange(3652000))
+            days = rng.sample(names, rng.randint(0, 7))
+            weeks = rng.choice([0, 1, 2, 14, 300])
+            with self.subTest(start=start, days=days, weeks=weeks):
+                result = get_days_array(start.year, start.month, start.day, days, weeks)
+                expected = list(iter_days(start.year, start.month, start.day, days, weeks))
+                self.assertEqual(result.astype(object).tolist(), expected)
+
+    def test_until_and_date_max(self):
+        """Test that ``until`` and the last representable date bound the array."""
+        result = get_days_array(2018, 1, 22, ['Tue'], weeks=10, until=date(2018, 2, 5))
+        self.assertEqual(len(result), 2)
+        result = get_days_array(9999, 12, 1, ['Fri'], weeks=10)
+        self.assertEqual(result[-1], np.datetime64('9999-12-31'))
+
+    def test_zero_copy_view(self):
+        """Test that the array can be reinterpreted as day numbers without copying."""
+        result = get_days_array(1970, 1, 1, ['Thu'], weeks=3)
+        days = result.view('int64')
+        self.assertTrue(np.shares_memory(result, days))
+        self.assertEqual(days.tolist(), [0, 7, 14])
+        self.assertTrue(result.flags['C_CONTIGUOUS'])
+
+    def test_open_ended_is_rejected(self):
+        """Test that an array needs a bounded number of weeks."""
+        with self.assertRaises(ValueError):
+            get_days_array(2018, 1, 22, ['Tue'], weeks=None)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+
+import random
+import unittest
+from datetime import date, timedelta
+from days import WeekdayPattern
+
+
+NAMES = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
+
+
+def _matches(start, end, days):
+    """Reference: every matching date from start to end, inclusive."""
+    results = []
+    d = start
+    while d <= end:
+        if NAMES[d.weekday()] in days:
+            results.append(d)
+        d += timedelta(days=1)
+    return results
+
+
+class TestWeekdayPattern(unittest.TestCase):
+    """Test the WeekdayPattern lookup table."""
+
+    def test_offsets_and_len(self):
+        """Test that names resolve to sorted, distinct weekday numbers."""
+        pattern = WeekdayPattern(['Thu', 'tue', 'Tue'])
+        self.assertEqual(pattern.offsets, (1, 3))
+        self.assertEqual(len(pattern), 2)
+
+    def test_nth(self):
+        """Test the k-th match on or after a date."""
+        pattern = WeekdayPattern(['Tue', 'Thu'])
+        self.assertEqual(pattern.nth(date(2018, 1, 22), 0), date(2018, 1, 23))
+        self.assertEqual(pattern.nth(date(2018, 1, 23), 0), date(2018, 1, 23))
+        self.assertEqual(pattern.nth(date(2018, 1, 22), 3), date(2018, 2, 1))
+        self.assertEqual(pattern.nth(date(2018, 12, 28), 1), date(2019, 1, 3))
+
+    def test_count_between(self):
+        """Test counting matches in a closed date range."""
+        pattern = WeekdayPattern(['Tue', 'Thu'])
+        self.assertEqual(pattern.count_between(date(2018, 1, 22), date(2018, 2, 1)), 4)
+        self.assertEqual(pattern.count_between(date(2018, 1, 23), date(2018, 1, 23)), 1)
+        self.assertEqual(pattern.count_between(date(2018, 1, 24), date(2018, 1, 24)), 0)
+        self.assertEqual(pattern.count_between(date(2018, 2, 1), date(2018, 1, 22)), 0)
+        self.assertEqual(pattern.count_between(date(9999, 12, 27), date.max), 2)
+
+    def test_against_brute_force(self):
+        """Test nth and count_between against a day-by-day walk."""
+        rng = random.Random(2018)
+        for _ in range(300):
+            days = rng.sample(NAMES, rng.randint(1, 7))
+            pattern = WeekdayPattern(days)
+            start = date(2000, 1, 1) + timedelta(days=rng.randrange(146097))
+            end = start + timedelta(days=rng.randrange(200))
+            expected = _matches(start, end, days)
+            with self.subTest(days=days, start=start, end=end):
+                self.assertEqual(pattern.count_between(start, end), len(expected))
+                for k, d in enumerate(expected):
+                    self.assertEqual(pattern.nth(start, k), d)
+
+    def test_empty_pattern(self):
+        """Test a pattern that matches no weekdays."""
+        pattern = WeekdayPattern([])
+        self.assertEqual(len(pattern), 0)
+        self.assertEqual(pattern.count_between(date(2018, 1, 1), date(2018, 12, 31)), 0)
+        with self.assertRaises(ValueError):
+            pattern.nth(date(2018, 1, 1), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+#!/usr/bin/env python
+
+import time
+import unittest
+from itertools import islice
+from days import iter_days
+
+
+ALL_DAYS = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
+
+
+def _best_time(func, repeat=3):
+    """Return the fastest of ``repeat`` wall-clock timings of ``func()``."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+class TestScaling(unittest.TestCase):
+    """Guard against super-linear cost in the number of emitted dates."""
+
+    def test_iter_days_scales_linearly(self):
+        """Test that 10x the dates costs roughly 10x the time, not 100x."""
+        def run(n):
+            return lambda: sum(1 for _ in islice(iter_days(1900, 1, 1, ALL_DAYS, weeks=None), n))
+
+        small = _best_time(run(15_000))
+        large = _best_time(run(150_000))
+        # Linear growth gives a ratio near 10; the old list scan gave ~100.
+        self.assertLess(large / small, 30)
+
+    def test_iter_days_long_run_has_no_duplicates(self):
+        """Test that 100k+ dates are unique without any membership checks."""
+        results = list(iter_days(1900, 1, 1, ['Tue', 'Thu', 'Tue', 'T'], weeks=60_000))
+        self.assertEqual(len(results), 120_000)
+        self.assertEqual(len(set(results)), len(results))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+
+import json
+import sys
+import unittest
+from io import StringIO
+from types import SimpleNamespace
+from unittest.mock import patch
+from days import add_profile_hook, cli, get_days, main, remove_profile_hook
+
+
+class TestProfileHooks(unittest.TestCase):
+    """Test the profile hook API."""
+
+    def setUp(self):
+        """Register a hook that records every profile."""
+        self.profiles = []
+        add_profile_hook(self.profiles.append)
+        self.addCleanup(remove_profile_hook, self.profiles.append)
+
+    def test_get_days(self):
+        """Test get_days timings and counters."""
+        result = get_days(2025, 1, 1, ['Mon'], weeks=3)
+        self.assertEqual(len(result), 3)
+        [profile] = self.profiles
+        self.assertEqual(profile.name, 'get_days')
+        self.assertEqual(list(profile.stages), ['generate'])
+        self.assertGreaterEqual(profile.stages['generate'], 0)
+        self.assertEqual(profile.counters, {
+            'dates_emitted': 3, 'weeks_emitted': 3, 'days_spanned': 15, 'weeks_spanned': 3,
+        })
+
+    def test_main_grouped(self):
+        """Test per-stage timings and output counters for a grouped CLI run."""
+        output = StringIO()
+        with patch('sys.stdout', output):
+            main(SimpleNamespace(year=2025, month=1, day=1, dows=['Mon', 'Fri'], weeks=2,
+                                 chunk=True, nth='-1'))
+        [profile] = self.profiles
+        self.assertEqual(list(profile.stages), ['generate', 'group', 'format', 'output'])
+        self.assertTrue(all(seconds >= 0 for seconds in profile.stages.values()))
+        self.assertAlmostEqual(profile.as_dict()['seconds'], sum(profile.stages.values()))
+        self.assertEqual(profile.counters, {
+            'dates_emitted': 4, 'weeks_emitted': 2, 'days_spanned': 33, 'weeks_spanned': 5,
+            'lines_written': 6, 'bytes_written': len(output.getvalue()),
+        })
+
+    def test_patterns_call_hooks_once(self):
+        """Test that a --pattern run reports one profile with every stage."""
+        output = StringIO()
+        with patch('sys.stdout', output):
+            main(SimpleNamespace(year=2025, month=1, day=1, dows=None, weeks=2, chunk=False,
+                                 patterns=['Mon', 'Tue Thu']))
+        [profile] = self.profiles
+        self.assertEqual(list(profile.stages), ['generate', 'format', 'output'])
+        self.assertEqual(profile.counters['dates_emitted'], 5)
+
+    def test_count_calls_hooks_once(self):
+        """Test that a --count run reports one profile."""
+        with patch('sys.stdout', StringIO()):
+            main(SimpleNamespace(year=2025, month=1, day=1, dows=['Mon'], weeks=3, chunk=False,
+                                 count=True))
+        [profile] = self.profiles
+        self.assertEqual(profile.counters['dates_counted'], 3)
+
+    def test_removed_hook_is_not_called(self):
+        """Test that removing the hook stops profiling."""
+        remove_profile_hook(self.profiles.append)
+        self.addCleanup(add_profile_hook, self.profiles.append)
+        with patch('days.Profile') as mock_profile:
+            get_days(2025, 1, 1, ['Mon'], weeks=3)
+        mock_profile.assert_not_called()
+        self.assertEqual(self.profiles, [])
+
+
+class TestProfileCLI(unittest.TestCase):
+    """Test the --profile option."""
+
+    def run_cli(self, *args):
+        stdout, stderr = StringIO(), StringIO()
+        with patch.object(sys, 'argv', ['days.py', '--start-date', '2025-01-06'] + list(args)), \
+                patch('sys.stdout', stdout), patch('sys.stderr', stderr):
+            cli()
+        return stdout.getvalue(), stderr.getvalue()
+
+    def test_profile_json_on_stderr(self):
+        """Test that --profile leaves stdout alone and reports JSON on stderr."""
+        plain, _ = self.run_cli('-n', '2')
+        for args in (['-n', '2', '--profile'], ['--num', '2', '--profile']):
+            stdout, stderr = self.run_cli(*args)
+            self.assertEqual(stdout, plain)
+            report = json.loads(stderr)
+            self.assertEqual(report['name'], 'main')
+            self.assertEqual(set(report['stages']), {'generate', 'format', 'output'})
+            self.assertEqual(report['counters']['dates_emitted'], 4)
+            self.assertEqual(report['counters']['bytes_written'], len(plain))
+
+    def test_profile_machine_readable_output(self):
+        """Test --profile with a serializer."""
+        stdout, stderr = self.run_cli('-n', '1', '--format', 'jsonl', '--profile')
+        self.assertEqual(len(stdout.splitlines()), 2)
+        self.assertEqual(json.loads(stderr)['counters']['lines_written'], 2)
+
+    def test_profile_count(self):
+        """Test that --count is profiled like the other output paths."""
+        stdout, stderr = self.run_cli('--count', '--subtract', 'Thu', '--profile')
+        self.assertEqual(stdout, '14\n')
+        report = json.loads(stderr)
+        self.assertEqual(set(report['stages']), {'generate', 'format', 'output'})
+        self.assertEqual(report['counters'], {'dates_counted': 14, 'lines_written': 1,
+                                              'bytes_written': 3})
+
+    def test_profile_patterns(self):
+        """Test that --pattern reports the same stages and counters as a single schedule."""
+        plain, _ = self.run_cli('-p', 'Mon', '-p', 'Tue,Thu', '-n', '2')
+        stdout, stderr = self.run_cli('-p', 'Mon', '-p', 'Tue,Thu', '-n', '2', '--profile')
+        self.assertEqual(stdout, plain)
+        report = json.loads(stderr)
+        self.assertEqual(set(report['stages']), {'generate', 'format', 'output'})
+        self.assertEqual(report['counters'], {'dates_emitted': 6,
+                                              'lines_written': len(plain.splitlines()),
+                                              'bytes_written': len(plain)})
+
+
+if __name__ == '__main__':
+    unittest.main()
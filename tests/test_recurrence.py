@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+
+import calendar
+import random
+import sys
+import unittest
+from datetime import date, timedelta
+from io import StringIO
+from itertools import islice
+from unittest.mock import patch
+from days import Recurrence, cli, get_days, iter_days, iter_weeks, run_job
+
+
+NAMES = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
+
+
+def _brute_force(start, days, weeks, every=1, nth=()):
+    """Reference: test each day from ``start`` until ``weeks`` weeks have a match."""
+    anchor = start - timedelta(days=start.weekday())
+    results = []
+    active = set()
+    d = start
+    while True:
+        monday = d - timedelta(days=d.weekday())
+        if monday not in active and len(active) == weeks:
+            return results
+        length = calendar.monthrange(d.year, d.month)[1]
+        occurrence = (d.day - 1) // 7 + 1
+        from_end = -((length - d.day) // 7 + 1)
+        if (NAMES[d.weekday()] in days
+                and (monday - anchor).days // 7 % every == 0
+                and (not nth or occurrence in nth or from_end in nth)):
+            results.append(d)
+            active.add(monday)
+        d += timedelta(days=1)
+
+
+class TestRecurrence(unittest.TestCase):
+    """Test every-N-weeks and nth-weekday-of-month rules."""
+
+    def test_biweekly(self):
+        """Test every other week, counted from the start date's week."""
+        results = list(iter_days(2025, 1, 1, ['Tue', 'Thu'], weeks=3, every=2))
+        self.assertEqual(results, [date(2025, 1, 2), date(2025, 1, 14), date(2025, 1, 16),
+                                   date(2025, 1, 28), date(2025, 1, 30)])
+
+    def test_first_and_third_monday(self):
+        """Test nth occurrences within each month."""
+        results = list(iter_days(2025, 1, 1, ['Mon'], weeks=4, nth=(1, 3)))
+        self.assertEqual(results, [date(2025, 1, 6), date(2025, 1, 20),
+                                   date(2025, 2, 3), date(2025, 2, 17)])
+
+    def test_last_friday(self):
+        """Test counting from the end of the month."""
+        results = list(iter_days(2024, 1, 1, ['Fri'], weeks=3, nth=(-1,)))
+        self.assertEqual(results, [date(2024, 1, 26), date(2024, 2, 23), date(2024, 3, 29)])
+
+    def test_fifth_occurrence_is_skipped_in_short_months(self):
+        """Test that months without a fifth occurrence contribute nothing."""
+        results = list(iter_days(2025, 1, 1, ['Wed'], weeks=3, nth=(5,)))
+        self.assertEqual(results, [date(2025, 1, 29), date(2025, 4, 30), date(2025, 7, 30)])
+
+    def test_property_against_brute_force(self):
+        """Test random rules and start dates against a day-by-day reference."""
+        rng = random.Random(2021)
+        for _ in range(300):
+            start = date(2000, 1, 1) + timedelta(days=rng.randrange(366 * 30))
+            days = rng.sample(NAMES, rng.randint(1, 7))
+            weeks = rng.randint(0, 12)
+            every = rng.choice([1, 1, 2, 3, 5])
+            nth = tuple(rng.sample([1, 2, 3, 4, 5, -1, -2, -5], rng.randint(0, 3)))
+            with self.subTest(start=start, days=days, weeks=weeks, every=every, nth=nth):
+                self.assertEqual(list(iter_days(start.year, start.month, start.day, days,
+                                                weeks=weeks, every=every, nth=nth)),
+                                 _brute_force(start, days, weeks, every, nth))
+
+    def test_lazy_open_ended(self):
+        """Test lazy iteration with no end, and up to the last representable date."""
+        rule = Recurrence(['Fri'], nth=(-1,))
+        self.assertEqual(list(islice(rule.iter_days(date(2025, 1, 1)), 2)),
+                         [date(2025, 1, 31), date(2025, 2, 28)])
+        self.assertEqual(list(rule.iter_days(date(9999, 11, 1))),
+                         [date(9999, 11, 26), date(9999, 12, 31)])
+        biweekly = Recurrence(['Mon'], every=2)
+        self.assertEqual(list(biweekly.iter_days(date(2025, 1, 1), until=date(2025, 2, 10))),
+                         [date(2025, 1, 13), date(2025, 1, 27), date(2025, 2, 10)])
+
+    def test_get_days_and_iter_weeks(self):
+        """Test that the rule flows through get_days and iter_weeks."""
+        self.assertEqual(get_days(2025, 1, 1, ['Mon'], weeks=2, nth=(1,)).dates,
+                         [date(2025, 1, 6), date(2025, 2, 3)])
+        self.assertEqual(list(iter_weeks(2025, 1, 1, ['Mon', 'Fri'], weeks=2, every=3)),
+                         [(date(2025, 1, 3),), (date(2025, 1, 20), date(2025, 1, 24))])
+
+    def test_invalid_rules(self):
+        """Test that bad every and nth values raise ValueError."""
+        for every, nth in ((0, ()), (True, ()), (1, (0,)), (1, (6,)), (1, (-6,))):
+            with self.assertRaises(ValueError):
+                Recurrence(['Mon'], every, nth)
+
+    def test_run_job(self):
+        """Test the every and nth batch fields."""
+        result = run_job({'start_date': '2025-01-01', 'weekdays': 'Mon', 'weeks': 2,
+                          'nth': '1,-1'})
+        self.assertEqual(result['days'], ['Mon Jan  6', 'Mon Jan 27'])
+        self.assertIn('error', run_job({'every': 0}))
+
+
+class TestRecurrenceCLI(unittest.TestCase):
+    """Test the --every and --nth options."""
+
+    def run_cli(self, *args):
+        output = StringIO()
+        with patch.object(sys, 'argv', ['days.py', '--start-date', '2025-01-01'] + list(args)), \
+                patch('sys.stdout', output):
+            cli()
+        return output.getvalue().splitlines()
+
+    def test_cli_every(self):
+        """Test --every with the fast parser and with argparse."""
+        expected = ['Tue Jan 14', 'Tue Jan 28']
+        self.assertEqual(self.run_cli('-w', 'Tue', '-n', '2', '--every', '2'), expected)
+        self.assertEqual(self.run_cli('--on', 'Tue', '--num', '2', '--every', '2'), expected)
+
+    def test_cli_nth(self):
+        """Test --nth, including negative values."""
+        self.assertEqual(self.run_cli('-w', 'Fri', '-n', '2', '--nth', '-1'),
+                         ['Fri Jan 31', 'Fri Feb 28'])
+        self.assertEqual(self.run_cli('-w', 'Fri', '-n', '2', '--nth=-1,-2'),
+                         ['Fri Jan 24', 'Fri Jan 31'])
+
+    def test_cli_nth_negative_list_needs_equals(self):
+        """Test that '--nth -1,-2' is an error whichever parser handles the other options."""
+        for extra in ([], ['--date-format', '%F']):
+            with self.subTest(extra=extra), patch('sys.stderr', StringIO()), \
+                    self.assertRaises(SystemExit):
+                self.run_cli('-w', 'Fri', '--nth', '-1,-2', *extra)
+
+    def test_cli_invalid(self):
+        """Test that bad values are usage errors."""
+        for args in (['--every', '0'], ['--nth', '1,x'], ['--nth', '9']):
+            with patch('sys.stderr', StringIO()), self.assertRaises(SystemExit):
+                self.run_cli(*args)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,169 @@
+#!/usr/bin/env python
+
+import os
+import random
+import sys
+import tempfile
+import unittest
+from datetime import date, timedelta
+from io import StringIO
+from unittest.mock import patch
+from days import Schedule, cli, get_days
+
+
+NAMES = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
+
+
+def _random_schedule(rng):
+    """A schedule built one of several ways, with a few segments."""
+    start = date(2024, 1, 1) + timedelta(days=rng.randrange(400))
+    days = rng.sample(NAMES, rng.randint(1, 7))
+    kind = rng.randrange(4)
+    if kind == 0:
+        return Schedule.from_days(start.year, start.month, start.day, days,
+                                  weeks=rng.randint(0, 30))
+    if kind == 1:
+        return Schedule.from_days(start.year, start.month, start.day, days,
+                                  weeks=rng.randint(0, 30), every=rng.randint(1, 3),
+                                  exclude=[start + timedelta(days=rng.randrange(60))])
+    if kind == 2:
+        return Schedule(days, start, start + timedelta(days=rng.randrange(100)))
+    return Schedule.from_dates(start + timedelta(days=rng.randrange(300))
+                               for _ in range(rng.randrange(40)))
+
+
+class TestSchedule(unittest.TestCase):
+    """Test Schedule set operations and range queries."""
+
+    def setUp(self):
+        self.sessions = Schedule.from_days(2025, 1, 13, ['Tue', 'Thu'], weeks=14)
+        self.exam_week = Schedule(NAMES, date(2025, 3, 10), date(2025, 3, 14))
+
+    def test_from_days_matches_get_days(self):
+        """Test that from_days holds the get_days dates in one segment."""
+        self.assertEqual(list(self.sessions), get_days(2025, 1, 13, ['Tue', 'Thu']).dates)
+        self.assertEqual(self.sessions.segments,
+                         ((date(2025, 1, 14), date(2025, 4, 17), ('Tue', 'Thu')),))
+        self.assertEqual(len(Schedule.from_days(2025, 1, 1, ['Mon'], weeks=None).segments), 1)
+        self.assertEqual(list(Schedule.from_days(9999, 12, 1, ['Mon'], weeks=10))[-1],
+                         date(9999, 12, 27))
+
+    def test_difference(self):
+        """Test removing exam week from a Tuesday/Thursday schedule."""
+        remaining = self.sessions - self.exam_week
+        self.assertEqual(len(remaining), 26)
+        self.assertNotIn(date(2025, 3, 11), remaining)
+        self.assertIn(date(2025, 3, 18), remaining)
+        self.assertEqual(len(remaining.segments), 2)
+
+    def test_union_and_intersection(self):
+        """Test union and intersection."""
+        fridays = Schedule(['Fri'], date(2025, 1, 13), date(2025, 1, 31))
+        both = self.sessions | fridays
+        self.assertEqual(len(both), 28 + 3)
+        self.assertEqual(list(self.sessions & fridays), [])
+        self.assertEqual(list(self.sessions & Schedule(['Thu'], end=date(2025, 1, 25))),
+                         [date(2025, 1, 16), date(2025, 1, 23)])
+
+    def test_range_queries(self):
+        """Test count_between and slice_between."""
+        march = date(2025, 3, 1), date(2025, 3, 31)
+        self.assertEqual(self.sessions.count_between(*march), 8)
+        self.assertEqual((self.sessions - self.exam_week).count_between(*march), 6)
+        self.assertEqual(list(self.sessions.slice_between(*march))[:2],
+                         [date(2025, 3, 4), date(2025, 3, 6)])
+        self.assertEqual(self.sessions.count_between(date(2025, 3, 31), date(2025, 3, 1)), 0)
+        self.assertEqual(Schedule(['Mon']).count_between(date(2025, 1, 1), date(2025, 12, 31)),
+                         52)
+
+    def test_equality(self):
+        """Test that equality compares dates, not segments."""
+        self.assertEqual(Schedule.from_dates(self.sessions), self.sessions)
+        self.assertEqual(Schedule(['Mon', 'Tue'], date(2025, 1, 6), date(2025, 1, 6)),
+                         Schedule(['Mon'], date(2025, 1, 6), date(2025, 1, 12)))
+        self.assertNotEqual(self.sessions, self.sessions - self.exam_week)
+        self.assertFalse(Schedule())
+
+    def test_property_against_sets(self):
+        """Test random schedules against the same operations on sets of dates."""
+        rng = random.Random(2025)
+        for _ in range(500):
+            a, b = _random_schedule(rng), _random_schedule(rng)
+            first = date(2024, 1, 1) + timedelta(days=rng.randrange(500))
+            last = first + timedelta(days=rng.randrange(-5, 200))
+            with self.subTest(a=a, b=b, first=first, last=last):
+                dates_a, dates_b = set(a), set(b)
+                self.assertEqual(list(a | b), sorted(dates_a | dates_b))
+                self.assertEqual(list(a & b), sorted(dates_a & dates_b))
+                self.assertEqual(list(a - b), sorted(dates_a - dates_b))
+                in_range = sorted(d for d in dates_a if first <= d <= last)
+                self.assertEqual(a.count_between(first, last), len(in_range))
+                self.assertEqual(list(a.slice_between(first, last)), in_range)
+                self.assertEqual(first in a, first in dates_a)
+                self.assertEqual(a == b, dates_a == dates_b)
+
+
+class TestScheduleCLI(unittest.TestCase):
+    """Test --union, --intersect, --subtract, --between and --count."""
+
+    def run_cli(self, *args):
+        output = StringIO()
+        with patch.object(sys, 'argv', ['days.py', '--start-date', '2025-01-13'] + list(args)), \
+                patch('sys.stdout', output):
+            cli()
+        return output.getvalue().splitlines()
+
+    def test_subtract_and_between(self):
+        """Test removing a date range and printing one month, with both parsers."""
+        expected = ['Tue Mar  4', 'Thu Mar  6', 'Tue Mar 18', 'Thu Mar 20', 'Tue Mar 25',
+                    'Thu Mar 27']
+        args = ['--subtract', '2025-03-10..2025-03-14', '--between', '2025-03-01..2025-03-31']
+        self.assertEqual(self.run_cli('-w', 'Tue', 'Thu', *args), expected)
+        self.assertEqual(self.run_cli('--num', '14', '-w', 'Tue', 'Thu', *args), expected)
+
+    def test_operations_apply_in_order(self):
+        """Test weekday specs over the schedule's span, and weekdays limited to a range."""
+        self.assertEqual(self.run_cli('-n', '2', '--subtract', 'Thu', '--union', 'Sat'),
+                         ['Tue Jan 14', 'Sat Jan 18', 'Tue Jan 21'])
+        self.assertEqual(self.run_cli('-n', '2', '--union', 'Fri@2025-01-15..2025-01-17',
+                                      '--intersect', 'Thu,Fri'),
+                         ['Thu Jan 16', 'Fri Jan 17', 'Thu Jan 23'])
+
+    def test_weekday_specs_cover_the_whole_schedule(self):
+        """Test weekday specs with --every, --nth and --exclude, which stretch the schedule."""
+        self.assertEqual(self.run_cli('--start-date', '2025-01-06', '-w', 'Tue', 'Thu',
+                                      '--every', '2', '-n', '4', '--intersect', 'Tue'),
+                         ['Tue Jan  7', 'Tue Jan 21', 'Tue Feb  4', 'Tue Feb 18'])
+        self.assertEqual(self.run_cli('--start-date', '2025-01-06', '-w', 'Tue', 'Thu',
+                                      '--every', '2', '-n', '4', '--subtract', 'Thu'),
+                         ['Tue Jan  7', 'Tue Jan 21', 'Tue Feb  4', 'Tue Feb 18'])
+        self.assertEqual(self.run_cli('-w', 'Mon', 'Fri', '--nth', '1', '-n', '3',
+                                      '--subtract', 'Fri'),
+                         ['Mon Feb  3', 'Mon Mar  3'])
+        with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as f:
+            f.write('2025-01-13..2025-01-19\n')
+        self.addCleanup(os.unlink, f.name)
+        self.assertEqual(self.run_cli('--start-date', '2025-01-06', '-w', 'Tue', 'Thu', '-n', '4',
+                                      '-x', f.name, '--subtract', 'Thu'),
+                         ['Tue Jan  7', 'Tue Jan 21', 'Tue Jan 28', 'Tue Feb  4'])
+        self.assertEqual(self.run_cli('--start-date', '2025-01-06', '-w', 'Tue', 'Thu', '-n', '4',
+                                      '-x', f.name, '--intersect', 'Thu'),
+                         ['Thu Jan  9', 'Thu Jan 23', 'Thu Jan 30', 'Thu Feb  6'])
+
+    def test_count(self):
+        """Test --count, alone and with --between."""
+        self.assertEqual(self.run_cli('--count'), ['28'])
+        self.assertEqual(self.run_cli('--count', '--between', '2025-03-01..2025-03-31',
+                                      '--subtract', '2025-03-10..2025-03-14'), ['6'])
+
+    def test_invalid(self):
+        """Test that bad specs and ranges are usage errors."""
+        for args in (['--union', 'Xyz'], ['--subtract', '@'], ['--intersect', 'Mon@2025-13-01'],
+                     ['--between', '2025-03-31..2025-03-01'], ['--count', '-p', 'Mon']):
+            with self.subTest(args=args), patch('sys.stderr', StringIO()), \
+                    self.assertRaises(SystemExit):
+                self.run_cli(*args)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+
+import json
+import sys
+import threading
+import time
+import unittest
+from http.client import HTTPConnection
+from io import StringIO
+from unittest.mock import patch
+from days import _make_server, cli, run_job
+
+
+class TestServe(unittest.TestCase):
+    """Test the HTTP server behind ``days serve``."""
+
+    def setUp(self):
+        """Start a server on a free local port."""
+        self.server = _make_server(port=0)
+        thread = threading.Thread(target=self.server.serve_forever, args=(0.05,), daemon=True)
+        thread.start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.conn = HTTPConnection(*self.server.server_address[:2], timeout=10)
+        self.addCleanup(self.conn.close)
+
+    def get(self, path, conn=None):
+        conn = conn or self.conn
+        conn.request('GET', path)
+        response = conn.getresponse()
+        return response.status, json.loads(response.read())
+
+    def test_days(self):
+        """Test that /days returns formatted dates."""
+        status, body = self.get('/days?start_date=2018-01-22&weekdays=Tue,Thu&weeks=2')
+        self.assertEqual(status, 200)
+        self.assertEqual(body, {'days': ['Tue Jan 23', 'Thu Jan 25', 'Tue Jan 30', 'Thu Feb  1']})
+
+    def test_days_grouped_with_repeated_weekdays(self):
+        """Test group=1 and weekdays given as repeated parameters."""
+        status, body = self.get('/days?start_date=2018-01-22&weekdays=Mon&weekdays=Fri'
+                                '&weeks=2&group=1')
+        self.assertEqual(status, 200)
+        self.assertEqual(body['days'], [['Mon Jan 22', 'Fri Jan 26'], ['Mon Jan 29', 'Fri Feb  2']])
+
+    def test_days_recurrence(self):
+        """Test the every and nth parameters."""
+        status, body = self.get('/days?start_date=2025-01-01&weekdays=Fri&weeks=2&nth=-1')
+        self.assertEqual(body['days'], ['Fri Jan 31', 'Fri Feb 28'])
+        status, body = self.get('/days?start_date=2025-01-01&weekdays=Tue&weeks=2&every=2')
+        self.assertEqual(body['days'], ['Tue Jan 14', 'Tue Jan 28'])
+
+    def test_bad_requests(self):
+        """Test that invalid queries and unknown paths are client errors."""
+        for path in ('/days?weekdays=Xyz', '/days?weeks=-1', '/days?weeks=10001',
+                     '/days?start_date=2018-13-01', '/days?every=0', '/days?nth=7'):
+            status, body = self.get(path)
+            self.assertEqual(status, 400, path)
+            self.assertIn('error', body)
+        self.assertEqual(self.get('/nope')[0], 404)
+
+    def test_keep_alive(self):
+        """Test that several requests share one connection."""
+        self.get('/days?weeks=1')
+        sock = self.conn.sock
+        self.assertIsNotNone(sock)
+        self.get('/days?weeks=2')
+        self.get('/metrics')
+        self.assertIs(self.conn.sock, sock)
+
+    def test_identical_requests_are_coalesced(self):
+        """Test that concurrent identical requests compute once."""
+        def slow_run_job(job, today=None):
+            time.sleep(0.2)
+            return run_job(job, today)
+
+        path = '/days?start_date=2018-01-22&weekdays=Mon&weeks=3'
+        results = []
+
+        def fetch():
+            conn = HTTPConnection(*self.server.server_address[:2], timeout=10)
+            try:
+                results.append(self.get(path, conn))
+            finally:
+                conn.close()
+
+        with patch('days.run_job', side_effect=slow_run_job) as mock_run_job:
+            threads = [threading.Thread(target=fetch) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(mock_run_job.call_count, 1)
+        self.assertEqual(len(results), 8)
+        self.assertEqual(results, [(200, {'days': ['Mon Jan 22', 'Mon Jan 29', 'Mon Feb  5']})] * 8)
+        self.assertEqual(self.server.state.metrics()['coalesced'], 7)
+
+    def test_metrics(self):
+        """Test request counts, latency percentiles and cache hit rate."""
+        for _ in range(3):
+            self.get('/days?start_date=2018-01-22&weeks=1')
+        self.get('/days?weekdays=Xyz')
+        status, metrics = self.get('/metrics')
+        self.assertEqual(status, 200)
+        self.assertEqual(metrics['requests'], 4)
+        self.assertEqual(metrics['errors'], 1)
+        self.assertEqual(set(metrics['latency_ms']), {'p50', 'p90', 'p99', 'max'})
+        self.assertLessEqual(metrics['latency_ms']['p50'], metrics['latency_ms']['max'])
+        self.assertEqual(metrics['cache']['hits'], 2)
+        self.assertEqual(metrics['cache']['misses'], 2)
+        self.assertEqual(metrics['cache']['hit_rate'], 0.5)
+
+
+class TestServeCLI(unittest.TestCase):
+    """Test the ``days serve`` entry point."""
+
+    def test_serve_options(self):
+        """Test that options are passed to serve()."""
+        with patch.object(sys, 'argv', ['days.py', 'serve', '--port', '9001', '--max-weeks', '52']), \
+                patch('days.serve') as mock_serve:
+            cli()
+        mock_serve.assert_called_once_with('127.0.0.1', 9001, 1024, 52)
+
+    def test_negative_cache_size(self):
+        """Test that a negative --cache-size is a usage error."""
+        with patch.object(sys, 'argv', ['days.py', 'serve', '--cache-size', '-1']), \
+                patch('days.serve') as mock_serve, patch('sys.stderr', StringIO()), \
+                self.assertRaises(SystemExit):
+            cli()
+        mock_serve.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()